@@ -8,7 +8,7 @@ import logging, os, urllib3
 import glob
 from urllib.parse import unquote
 
-from settings import proxies, logger as get_logger  # assuming `proxies()` and `logger()` are in settings.py
+from settings import proxies, proxied_get, logger as get_logger  # assuming `proxies()` and `logger()` are in settings.py
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 def get_google_search_results(search_term, site_name, time='w', country_code='US'):
@@ -26,7 +26,7 @@ def get_google_search_results(search_term, site_name, time='w', country_code='US
         query = f"{search_term} site:{site_name}"
         params = {"q": query,"tf": f"pm",}
         search_url = f"https://search.brave.com/search?{urllib.parse.urlencode(params)}"
-        response = requests.get(search_url, headers=headers, timeout=10, proxies=proxies())
+        response = proxied_get(search_url, headers=headers, timeout=10)
         logger.info("Response status code: %s", response.status_code)
         if response.status_code == 200:
             logger.info("Fetched results for: %s", search_term)
@@ -46,7 +46,7 @@ def clean_google_url(href: str) -> str:
 def requests_next_page(url, site_name, logger):
     headers = {"User-Agent": UserAgent().random}
     try:
-        response = requests.get(url, headers=headers, timeout=10, proxies=proxies())
+        response = proxied_get(url, headers=headers, timeout=10)
         if response.status_code == 200:
             logger.info("Fetched next page: %s", url)
             return response.text
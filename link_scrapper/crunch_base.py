@@ -20,7 +20,7 @@ def get_google_search_results(search_term = "Funding & Investment", country_code
 
         search_url = f"https://www.google.com/search?{urllib.parse.urlencode(params)}"
 
-        response = requests.get(search_url, headers=headers, timeout=10, proxies=cf.proxies())
+        response = cf.proxied_get(search_url, headers=headers, timeout=10)
         if response.status_code == 200:
             print("Fetched results for: %s", search_term)
             return response.text
@@ -44,10 +44,17 @@ def insert_multiple_urls_from_google(documents_list):
     update_details=[]
     
     
+    # One $in query for every URL in the batch instead of a find_one per result
+    urls = list({obj["url"] for documents in documents_list for obj in documents if obj.get("url")})
+    existing_docs = {
+        doc["url"]: doc
+        for doc in news_url_1.find({"url": {"$in": urls}}, {"url": 1, "sector": 1, "tag": 1, "count": 1})
+    } if urls else {}
+    
     for documents in documents_list:
         for obj in documents:
             try:
-                existing_doc = news_url_1.find_one({"url": obj["url"]})
+                existing_doc = existing_docs.get(obj["url"])
                 if not existing_doc:
                     bulk_operations.append(pymongo.InsertOne(obj))
                     
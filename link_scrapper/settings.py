@@ -1,5 +1,13 @@
 import logging
-import os, random
+import os, random, sys, time
+import requests
+
+# Fetch components shared with news_scrapper / past_data_server (scraper_common/ at the repo root)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
+from scraper_common.proxy_manager import ProxyManager
 
 class SiteFilter(logging.Filter):
     def __init__(self, site_name):
@@ -43,13 +51,26 @@ def check_log_file(file):
     return file
 
 
-def proxies():
-    plist = [
-        "37.48.118.90:13082",
-        "83.149.70.159:13082"
-    ]
-    prx = random.choice(plist)
-    return {
-        'http': 'http://' + prx,
-        'https': 'http://' + prx
-    }
\ No newline at end of file
+PROXY_LIST = [
+    "37.48.118.90:13082",
+    "83.149.70.159:13082"
+]
+proxy_manager = ProxyManager(PROXY_LIST)
+
+
+def proxies(url=None):
+    """Pick the healthiest proxy (for url's host when given)"""
+    return proxy_manager.get_proxy(url)
+
+
+def proxied_get(url, **kwargs):
+    """requests.get through the healthiest proxy, reporting the outcome back to the proxy manager"""
+    proxy = proxy_manager.choose(url)
+    started = time.monotonic()
+    try:
+        response = requests.get(url, proxies=proxy_manager.as_requests_proxies(proxy), **kwargs)
+    except Exception:
+        proxy_manager.report(proxy, url, time.monotonic() - started)
+        raise
+    proxy_manager.report(proxy, url, time.monotonic() - started, response.status_code)
+    return response
\ No newline at end of file
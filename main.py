@@ -5,12 +5,22 @@ from news_scrapper.tech_funding_news import TechFundingNews
 from news_scrapper.tech_crunch import TechCrunch
 from news_scrapper.your_story import YourStory
 from news_scrapper.inc42 import Inc42
+from news_scrapper.settings import session_pool, proxy_manager, circuit_breakers, retry_policy, single_flight, adaptive_timeouts, scrape_router
 
 from logger import CustomLogger
 
 logger = CustomLogger('/home/riken/news-scrapper/news-scrapper/log/main')
 
 
+def run_with_retry_budget(task):
+    """Run one scraper with its own retry budget (budgets are bound to the fetching thread)"""
+    retry_policy.use_budget(retry_policy.new_budget())
+    try:
+        return task()
+    finally:
+        retry_policy.use_budget(None)
+
+
 def news_scrapper(max_workers = 6):
 
     tasks = [
@@ -23,7 +33,7 @@ def news_scrapper(max_workers = 6):
 
     with ThreadPoolExecutor(max_workers=max_workers) as executor:
         future_to_task = {
-            executor.submit(task): task.__qualname__
+            executor.submit(run_with_retry_budget, task): task.__qualname__
             for task in tasks
         }
 
@@ -35,6 +45,19 @@ def news_scrapper(max_workers = 6):
             except Exception as e:
                 logger.error(f"✗ Failed: {task_name} → {e}", exc_info=True)
 
+    pool_stats = session_pool.get_stats()
+    logger.info(
+        f"🔌 HTTP pool: {pool_stats['requests']} requests, "
+        f"{pool_stats['new_connections']} new connections, reuse rate {pool_stats['reuse_rate']:.0%}"
+    )
+    quarantined = [proxy for proxy, health in proxy_manager.get_stats().items() if health["quarantined"]]
+    logger.info(f"🛡️ Proxies quarantined at exit: {len(quarantined)} {quarantined}")
+    logger.info(f"🔌 Circuit breakers: {circuit_breakers.get_stats()}")
+    logger.info(f"🔁 Retries: {retry_policy.get_stats()}")
+    logger.info(f"🔗 Single-flight: {single_flight.get_stats()}")
+    logger.info(f"⏱️ Adaptive timeouts: {adaptive_timeouts.get_stats()}")
+    logger.info(f"🧭 Fetch tiers: {scrape_router.get_stats()}")
+
 
 if __name__ == "__main__":
     logging.info("[START] Script initialized...")
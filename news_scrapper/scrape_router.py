@@ -0,0 +1,166 @@
+"""
+Tiered Fetch Routing for News Scraper System
+Tries the cheap paths first (direct, then one of our proxies) and escalates to
+scrape.do without rendering, then with rendering, only when the cheaper tier
+failed or returned a page the caller could not use. The tier that worked is
+remembered per host + first path segment for a while, so routes that needed
+scrape.do recently go straight there and everything else stays cheap
+"""
+
+import logging
+import threading
+import time
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import urlsplit
+
+from scraper_common.rate_limiter import domain_of
+from scraper_common.retry_policy import RetryPolicy
+
+
+def route_key(url: str) -> str:
+    """Escalation is remembered per host and first path segment (e.g. yourstory.com/search)"""
+    segments = [segment for segment in urlsplit(url).path.split("/") if segment]
+    return f"{domain_of(url)}/{segments[0] if segments else ''}"
+
+
+class Tier:
+    """One way of fetching a page, with its scrape.do credit cost"""
+
+    def __init__(self, name: str, fetch: Callable, credits: int = 0, attempts: int = 1):
+        """
+        Initialize tier
+
+        Args:
+            name: Label used in logs and stats
+            fetch: fetch(url, wait_selector) -> requests.Response, may raise
+            credits: scrape.do credits one request on this tier costs
+            attempts: Tries on this tier before escalating
+        """
+        self.name = name
+        self.fetch = fetch
+        self.credits = credits
+        self.attempts = attempts
+        self.requests = 0
+        self.successes = 0
+        self.credits_spent = 0
+        self.latency_total = 0.0
+
+
+class ScrapeRouter:
+    """Cheapest-tier-first fetching with remembered escalations and a credit budget"""
+
+    def __init__(self, tiers: List[Tier], escalation_ttl: float = 3600, max_credits: Optional[int] = None,
+                 retry_policy: Optional[RetryPolicy] = None):
+        """
+        Initialize scrape router
+
+        Args:
+            tiers: Tiers ordered cheapest first
+            escalation_ttl: Seconds a route keeps starting at the tier that last worked for it
+            max_credits: scrape.do credits this process may spend (None = unlimited)
+            retry_policy: Backoff and retry budget for repeat attempts on the same tier
+        """
+        self.tiers = tiers
+        self.escalation_ttl = escalation_ttl
+        self.max_credits = max_credits
+        self.retry_policy = retry_policy or RetryPolicy()
+        self._routes: Dict[str, Tuple[int, float]] = {}
+        self._lock = threading.Lock()
+        self.budget_refusals = 0
+
+    def _start_tier(self, key: str) -> int:
+        with self._lock:
+            entry = self._routes.get(key)
+            if entry and entry[1] > time.monotonic():
+                return entry[0]
+            self._routes.pop(key, None)
+            return 0
+
+    def _remember(self, key: str, index: int):
+        with self._lock:
+            if index == 0:
+                self._routes.pop(key, None)
+            else:
+                self._routes[key] = (index, time.monotonic() + self.escalation_ttl)
+
+    def _charge(self, tier: Tier) -> bool:
+        """Reserve the tier's credits; False when that would exceed max_credits"""
+        with self._lock:
+            spent = sum(t.credits_spent for t in self.tiers)
+            if tier.credits and self.max_credits is not None and spent + tier.credits > self.max_credits:
+                self.budget_refusals += 1
+                return False
+            tier.requests += 1
+            tier.credits_spent += tier.credits
+            return True
+
+    def fetch(self, url: str, validate: Optional[Callable] = None, wait_selector: Optional[str] = None):
+        """
+        Fetch a page through the cheapest tier that yields a usable response
+
+        Args:
+            url: Page to fetch
+            validate: validate(response) -> bool; a 200 the caller cannot parse escalates too
+            wait_selector: CSS selector scrape.do waits for when rendering
+
+        Returns (True, response) or (False, None), like get_request.
+        """
+        key = route_key(url)
+        start = self._start_tier(key)
+        self.retry_policy.record_request()
+        for index in range(start, len(self.tiers)):
+            tier = self.tiers[index]
+            for attempt in range(tier.attempts):
+                if not self._charge(tier):
+                    logging.warning(f"💳 scrape.do credit budget spent, not trying {tier.name} for {url}")
+                    return False, None
+                started = time.monotonic()
+                try:
+                    res = tier.fetch(url, wait_selector)
+                except Exception as e:
+                    logging.warning(f"❌ {tier.name} error for {url}: {e}")
+                    res = None
+                with self._lock:
+                    tier.latency_total += time.monotonic() - started
+
+                if res is not None and res.status_code == 200 and (validate is None or validate(res)):
+                    with self._lock:
+                        tier.successes += 1
+                    self._remember(key, index)
+                    logging.info(f"✅ {tier.name}: {url}")
+                    return True, res
+
+                if res is not None:
+                    logging.warning(f"⚠️ {tier.name} unusable for {url} [{res.status_code}]")
+                if attempt + 1 < tier.attempts:
+                    if not self.retry_policy.allow_retry():
+                        logging.warning(f"🪣 Retry budget exhausted, not retrying {tier.name} for {url}")
+                        break
+                    retry_after = self.retry_policy.retry_after(res.status_code, res.headers) if res is not None else None
+                    time.sleep(self.retry_policy.delay(attempt, retry_after))
+
+            if index + 1 < len(self.tiers):
+                logging.info(f"⬆️ Escalating {key} from {tier.name} to {self.tiers[index + 1].name}")
+
+        logging.error(f"❌ All tiers failed for {url}")
+        return False, None
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            now = time.monotonic()
+            return {
+                "tiers": {
+                    tier.name: {
+                        "requests": tier.requests,
+                        "successes": tier.successes,
+                        "credits": tier.credits_spent,
+                        "avg_latency": round(tier.latency_total / tier.requests, 2) if tier.requests else 0.0,
+                    }
+                    for tier in self.tiers
+                },
+                "credits_spent": sum(tier.credits_spent for tier in self.tiers),
+                "budget_refusals": self.budget_refusals,
+                "escalated_routes": {
+                    key: self.tiers[index].name for key, (index, expires) in self._routes.items() if expires > now
+                },
+            }
@@ -4,7 +4,16 @@ import random
 import time
 import requests
 import urllib3, urllib, json
+from urllib.parse import urlsplit
 from pymongo import MongoClient
+from scraper_common.session_pool import SessionPool
+from scraper_common.rate_limiter import RateLimiter
+from scraper_common.proxy_manager import ProxyManager
+from scraper_common.circuit_breaker import CircuitBreakerRegistry
+from scraper_common.retry_policy import RetryPolicy
+from scraper_common.single_flight import SingleFlight, normalize_url
+from scraper_common.adaptive_timeout import AdaptiveTimeouts
+from news_scrapper.scrape_router import ScrapeRouter, Tier
 
 logging.basicConfig(
     level=logging.INFO,
@@ -26,6 +35,22 @@ news_details_client = clientdb.new_details
 
 stats_db = masterclient.STARTUPSCRAPERDATA
 
+def existing_urls(collection, urls):
+    """URLs among urls already in collection: one $in query, projected to the indexed url field."""
+    if not urls:
+        return set()
+    return {doc["url"] for doc in collection.find({"url": {"$in": list(set(urls))}}, {"url": 1, "_id": 0})}
+
+def unique_by_url(grids):
+    """grids without repeats of a URL listed earlier on the same page, in listing order."""
+    seen = set()
+    unique = []
+    for grid in grids:
+        if grid["url"] not in seen:
+            seen.add(grid["url"])
+            unique.append(grid)
+    return unique
+
 def save_run_stats(inserted_count):
     
     """Save run statistics to the MongoDB collection"""    
@@ -40,7 +65,7 @@ def save_run_stats(inserted_count):
 
 
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
-CONFIG_FILE = "/home/riken/news-scrapper/news-scrapper/config.json"
+CONFIG_FILE = os.getenv("NEWS_SCRAPPER_CONFIG", "/home/riken/news-scrapper/news-scrapper/config.json")
 with open(CONFIG_FILE, "r") as f: config = json.load(f)
 TOKEN = config["token"]
 
@@ -79,9 +104,21 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:116.0) Gecko/20100101 Firefox/116.0",
 ]
 
-def get_proxy():
-    prx = random.choice(PROXIES)
-    return {"http": f"http://{prx}", "https": f"http://{prx}"}
+session_pool = SessionPool()
+rate_limiter = RateLimiter(sites={
+    "vccircle.com": {"rate": 0.5, "burst": 2},
+})
+proxy_manager = ProxyManager(PROXIES)
+circuit_breakers = CircuitBreakerRegistry()
+retry_policy = RetryPolicy()
+single_flight = SingleFlight()
+adaptive_timeouts = AdaptiveTimeouts()
+
+# Statuses that mean the host is refusing or failing us (for the circuit breaker)
+HOST_FAILURE_STATUSES = {403, 429}
+
+def get_proxy(url=None):
+    return proxy_manager.get_proxy(url)
 
 def get_headers():
     return {
@@ -89,87 +126,137 @@ def get_headers():
             "Accept-Language": "en-US,en;q=0.9"
         }
 
-def get_request(url, max_retries=20, timeout=10):
-    """Perform GET request with retries, proxies, and UA rotation."""
+def get_request(url, max_retries=20, timeout=None):
+    """Perform GET request with retries, proxies, and UA rotation.
+
+    Concurrent calls for the same normalized URL share a single fetch.
+    timeout=None uses the host's adaptive timeout (rolling latency percentile).
+    """
+    return single_flight.do(
+        normalize_url(url),
+        lambda: _fetch(url, max_retries, timeout),
+        is_success=lambda result: result[0],
+    )
+
+def _fetch(url, max_retries, timeout):
+    """The retrying network fetch behind get_request."""
+    retry_policy.record_request()
+    retry_after = None
     for attempt in range(max_retries):
+        if attempt:
+            if not retry_policy.allow_retry():
+                logging.warning(f"🪣 Retry budget exhausted, giving up on {url}")
+                return False, None
+            time.sleep(retry_policy.delay(attempt - 1, retry_after))
+            retry_after = None
+        if not circuit_breakers.allow(url):
+            logging.warning(f"🔌 Circuit open, failing fast: {url}")
+            return False, None
+        rate_limiter.acquire(url)
+        proxy = proxy_manager.choose(url)
+        attempt_timeout = timeout or adaptive_timeouts.timeout_for(url)
+        started = time.monotonic()
         try:
-            res = requests.get(
+            res = session_pool.get(
                 url,
                 headers=get_headers(),
-                proxies=get_proxy(),
-                timeout=timeout,
+                proxies=proxy_manager.as_requests_proxies(proxy),
+                timeout=attempt_timeout,
                 verify=False,  # if possible, set verify=True
             )
+            adaptive_timeouts.record(url, time.monotonic() - started)
+            proxy_manager.report(proxy, url, time.monotonic() - started, res.status_code)
+            circuit_breakers.record(url, res.status_code not in HOST_FAILURE_STATUSES and res.status_code < 500)
 
             if res.status_code == 200:
                 logging.info(f"✅ Success: {url} [{res.status_code}]")
                 return True, res
 
+            if retry_policy.is_permanent(res.status_code):
+                logging.warning(f"🚫 Permanent failure, not retrying: {url} [{res.status_code}]")
+                return False, None
+
+            retry_after = retry_policy.retry_after(res.status_code, res.headers)
             logging.warning(f"⚠️ Failed: {url} [{res.status_code}]")
 
-        except requests.Timeout:
-            logging.warning(f"⏳ Timeout on {url}, retry {attempt+1}/{max_retries}")
+        except requests.Timeout as e:
+            if proxy is None and isinstance(e, requests.ReadTimeout):
+                adaptive_timeouts.record_timeout(url)
+            proxy_manager.report(proxy, url, time.monotonic() - started)
+            circuit_breakers.record(url, False)
+            logging.warning(f"⏳ Timeout ({attempt_timeout}s) on {url}, retry {attempt+1}/{max_retries}")
         except Exception as e:
+            proxy_manager.report(proxy, url, time.monotonic() - started)
+            circuit_breakers.record(url, False)
             logging.warning(f"❌ Error fetching {url}: {e}")
 
-        time.sleep(1)
-
     logging.error(f"❌ All retries failed for {url}")
     return False, None
 
 
 
-def get_scrape_do_requests(url):
-    c = 0
-    headers = get_headers()
-
-    while c < 10:
-        try:
-            encoded_url = urllib.parse.quote_plus(url)
-            url = f"https://api.scrape.do/?token={TOKEN}&url={encoded_url}&render=true"
-            res = requests.get(url, headers=headers, verify=False)
-            print(f'scrape do URL: {res.url} : status code --> {res.status_code}',)
-
-            if res.status_code == 200:
-                return True, res
-
-        except requests.Timeout:
-            print("Request timed out. Retrying...")
-        except requests.RequestException as e:
-            print("Request failed: %s", e)
-
-        print("Scrape do Checking try again: %d", c)
-        time.sleep(0.5)
-        c += 1
-
-    return False, False
-
-
-def yourstory_scrape_do_requests(url):
-    c = 0
-    headers = get_headers()
-    waitSelector = ".container-results"
-    render = "true"
-    waitSelector = ".container-results li"
-    
-    while c < 10:
-        try:
-            encoded_url = urllib.parse.quote(url)
-            url = f"http://api.scrape.do/?token={TOKEN}&url={encoded_url}&render={render}&waitSelector={waitSelector}"
-            res = requests.get(url, headers=headers, verify=False)
-            print(f'scrape do URL: {res.url} : status code --> {res.status_code}',)
-
-            if res.status_code == 200:
-                return True, res
-
-        except requests.Timeout:
-            print("Request timed out. Retrying...")
-        except requests.RequestException as e:
-            print("Request failed: %s", e)
+def _direct_fetch(url, wait_selector=None):
+    rate_limiter.acquire(url)
+    started = time.monotonic()
+    try:
+        res = session_pool.get(url, headers=get_headers(), timeout=adaptive_timeouts.timeout_for(url), verify=False)
+    except requests.ReadTimeout:
+        adaptive_timeouts.record_timeout(url)
+        raise
+    adaptive_timeouts.record(url, time.monotonic() - started)
+    return res
+
+def _proxy_fetch(url, wait_selector=None):
+    rate_limiter.acquire(url)
+    proxy = proxy_manager.choose(url)
+    started = time.monotonic()
+    try:
+        res = session_pool.get(
+            url,
+            headers=get_headers(),
+            proxies=proxy_manager.as_requests_proxies(proxy),
+            timeout=adaptive_timeouts.timeout_for(url),
+            verify=False,
+        )
+    except Exception:
+        proxy_manager.report(proxy, url, time.monotonic() - started)
+        raise
+    adaptive_timeouts.record(url, time.monotonic() - started)
+    proxy_manager.report(proxy, url, time.monotonic() - started, res.status_code)
+    return res
+
+def _scrape_do_fetch(render):
+    def fetch(url, wait_selector=None):
+        params = {"token": TOKEN, "url": url}
+        if render:
+            params["render"] = "true"
+            if wait_selector:
+                params["waitSelector"] = wait_selector
+        res = session_pool.get(SCRAPE_DO_URL, params=params, headers=get_headers(), timeout=SCRAPE_DO_TIMEOUT, verify=False)
+        # The query string carries the API token, keep it out of the logs
+        logging.debug(f"scrape.do {urlsplit(res.url)._replace(query='').geturl()} for {url} [{res.status_code}]")
+        return res
+    return fetch
+
+# Point SCRAPE_DO_URL at a local stand-in to exercise the scrape.do tiers without spending credits
+SCRAPE_DO_URL = os.getenv("SCRAPE_DO_URL", config.get("scrape_do_url", "https://api.scrape.do/"))
+SCRAPE_DO_TIMEOUT = 90
+scrape_router = ScrapeRouter(
+    tiers=[
+        Tier("direct", _direct_fetch),
+        Tier("proxy", _proxy_fetch),
+        Tier("scrape_do", _scrape_do_fetch(render=False), credits=1, attempts=2),
+        Tier("scrape_do_render", _scrape_do_fetch(render=True), credits=5, attempts=3),
+    ],
+    max_credits=config.get("scrape_do_max_credits"),
+    retry_policy=retry_policy,
+)
 
-        print("Scrape do Checking try again: %d", c)
-        time.sleep(0.5)
-        c += 1
+def get_scrape_do_requests(url, validate=None):
+    """Fetch via the cheapest working tier; validate(response) -> bool rejects pages we cannot parse."""
+    return scrape_router.fetch(url, validate)
 
-    return False, False
 
+def yourstory_scrape_do_requests(url, validate=None):
+    """get_scrape_do_requests for YourStory listings, which render client-side."""
+    return scrape_router.fetch(url, validate, wait_selector=".container-results li")
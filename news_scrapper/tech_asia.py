@@ -4,7 +4,7 @@ from datetime import datetime
 import json
 from bs4 import BeautifulSoup
 from requests import RequestException
-from settings import get_request, get_scrape_do_requests, news_details_client, yourstory_scrape_do_requests
+from settings import existing_urls, get_request, get_scrape_do_requests, news_details_client, unique_by_url, yourstory_scrape_do_requests
 from datetime import datetime
 
 URL = "https://www.techinasia.com/news/byd-overtakes-tesla-europes-july-car-sales"
@@ -125,9 +125,11 @@ class TechCrunch:
 
     def check_db_grid(self):
         """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
+        grids = unique_by_url(self.grid_details)
+        existing = existing_urls(news_details_client, [grid["url"] for grid in grids])
+        for grid in grids:
             try:
-                if news_details_client.find_one({"url": grid["url"]}):
+                if grid["url"] in existing:
                     logging.info(f"Skipping (already in DB): {grid['url']}")
                     continue
 
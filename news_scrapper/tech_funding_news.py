@@ -4,7 +4,7 @@ from datetime import datetime
 import json
 from bs4 import BeautifulSoup
 from requests import RequestException
-from news_scrapper.settings import get_request, get_scrape_do_requests, news_details_client, save_run_stats, yourstory_scrape_do_requests
+from news_scrapper.settings import existing_urls, get_request, get_scrape_do_requests, news_details_client, save_run_stats, unique_by_url, yourstory_scrape_do_requests
 from datetime import datetime
 from logger import CustomLogger
 logger = CustomLogger(log_folder="/home/riken/news-scrapper/news-scrapper/log/TechFundingNews")
@@ -117,9 +117,11 @@ class TechFundingNews:
 
     def check_db_grid(self):
         """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
+        grids = unique_by_url(self.grid_details)
+        existing = existing_urls(news_details_client, [grid["url"] for grid in grids])
+        for grid in grids:
             try:
-                if news_details_client.find_one({"url": grid["url"]}):
+                if grid["url"] in existing:
                     logger.info(f"Skipping (already in DB): {grid['url']}")
                     continue
 
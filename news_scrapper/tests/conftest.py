@@ -0,0 +1,22 @@
+"""
+Test setup: news_scrapper is imported as a package from the repo root, and its settings
+module reads config.json and opens log/main.log at import time, so tests point it at a
+scratch config and run from a scratch folder
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.insert(0, REPO_ROOT)
+
+SCRATCH = tempfile.mkdtemp(prefix="news-scrapper-tests-")
+os.makedirs(os.path.join(SCRATCH, "log"))
+os.chdir(SCRATCH)
+
+CONFIG_FILE = os.path.join(SCRATCH, "config.json")
+with open(CONFIG_FILE, "w") as f:
+    json.dump({"token": "test-token"}, f)
+os.environ["NEWS_SCRAPPER_CONFIG"] = CONFIG_FILE
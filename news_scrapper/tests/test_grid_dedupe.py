@@ -0,0 +1,13 @@
+"""A URL listed twice on a grid page is checked and fetched once"""
+
+from news_scrapper.settings import unique_by_url
+
+
+def test_unique_by_url_keeps_the_first_listing():
+    grids = [
+        {"url": "https://example.com/a", "title": "A"},
+        {"url": "https://example.com/b", "title": "B"},
+        {"url": "https://example.com/a", "title": "A (featured)"},
+    ]
+
+    assert unique_by_url(grids) == grids[:2]
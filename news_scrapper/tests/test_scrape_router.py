@@ -0,0 +1,81 @@
+"""
+Tiered fetching against a local stand-in for the target site, our proxy and scrape.do:
+each tier is tried only after the cheaper ones failed, in order, and charged its credits
+"""
+
+import logging
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from news_scrapper import settings
+
+
+class StandIn(BaseHTTPRequestHandler):
+    """Blocks direct and proxied fetches; scrape.do serves a usable page only when rendering"""
+
+    calls = []
+
+    def do_GET(self):
+        parts = urlsplit(self.path)
+        query = parse_qs(parts.query)
+        if parts.path == "/scrape-do":
+            tier = "scrape_do_render" if query.get("render") == ["true"] else "scrape_do"
+            status, body = 200, "<div class='results'>rendered</div>" if tier == "scrape_do_render" else "<div></div>"
+        else:
+            # A proxied request names the absolute target URL on the request line
+            tier = "proxy" if self.path.startswith("http://") else "direct"
+            status, body = 403, "blocked"
+        StandIn.calls.append((tier, query.get("token", [None])[0]))
+        payload = body.encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def stand_in(monkeypatch):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StandIn)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    address = f"127.0.0.1:{server.server_port}"
+    StandIn.calls = []
+    monkeypatch.setattr(settings, "SCRAPE_DO_URL", f"http://{address}/scrape-do")
+    monkeypatch.setattr(settings.proxy_manager, "choose", lambda url: address)
+    monkeypatch.setattr(settings.retry_policy, "base_delay", 0.0)
+    yield address
+    server.shutdown()
+    server.server_close()
+
+
+def test_tiers_are_tried_cheapest_first(stand_in, caplog):
+    router = settings.scrape_router
+    spent_before = router.get_stats()["credits_spent"]
+
+    with caplog.at_level(logging.DEBUG):
+        done, response = router.fetch(f"http://{stand_in}/news/article", validate=lambda res: "results" in res.text)
+
+    assert done and "rendered" in response.text
+    assert [tier for tier, _ in StandIn.calls] == ["direct", "proxy", "scrape_do", "scrape_do", "scrape_do_render"]
+    assert [token for tier, token in StandIn.calls if tier.startswith("scrape_do")] == ["test-token"] * 3
+    assert router.get_stats()["credits_spent"] - spent_before == 2 * 1 + 5
+    # Ours only: urllib3's own debug lines print full request URLs
+    logged = [record.getMessage() for record in caplog.records if record.name == "root"]
+    assert any("scrape.do" in message for message in logged)
+    assert not any("test-token" in message for message in logged)
+
+
+def test_escalated_route_starts_at_the_tier_that_worked(stand_in):
+    url = f"http://{stand_in}/news/other-article"
+    settings.scrape_router.fetch(url, validate=lambda res: "results" in res.text)
+    StandIn.calls = []
+
+    done, _ = settings.scrape_router.fetch(url, validate=lambda res: "results" in res.text)
+
+    assert done
+    assert [tier for tier, _ in StandIn.calls] == ["scrape_do_render"]
@@ -4,7 +4,7 @@ from datetime import datetime
 import json
 from bs4 import BeautifulSoup
 from requests import RequestException
-from news_scrapper.settings import get_request, get_scrape_do_requests, news_details_client, save_run_stats, yourstory_scrape_do_requests
+from news_scrapper.settings import existing_urls, get_request, get_scrape_do_requests, news_details_client, save_run_stats, unique_by_url, yourstory_scrape_do_requests
 from datetime import datetime
 from logger import CustomLogger
 logger = CustomLogger(log_folder="/home/riken/news-scrapper/news-scrapper/log/YourStory")
@@ -22,7 +22,10 @@ class YourStory:
     def get_grid_details(self):
         """Scrape the grid (listing) page."""
         try:
-            done, response = yourstory_scrape_do_requests(URL)
+            # Only a listing that actually yields articles counts; otherwise escalate to rendering
+            done, response = yourstory_scrape_do_requests(
+                URL, validate=lambda res: bool(self.scrape_yourstory_data(res.text))
+            )
             if not done:
                 logger.error(f"Request failed: {URL}")
                 return []
@@ -158,13 +161,17 @@ class YourStory:
 
     def check_db_grid(self):
         """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
+        grids = unique_by_url(self.grid_details)
+        existing = existing_urls(news_details_client, [grid["url"] for grid in grids])
+        for grid in grids:
             try:
-                if news_details_client.find_one({"url": grid["url"]}):
+                if grid["url"] in existing:
                     logger.info(f"Skipping (already in DB): {grid['url']}")
                     continue
 
-                done, response = get_scrape_do_requests(grid["url"])
+                done, response = get_scrape_do_requests(
+                    grid["url"], validate=lambda res: bool(self.seprate_blog_details(res).get("title"))
+                )
                 if not done:
                     logger.warning(f"Failed fetching: {grid['url']}")
                     continue
@@ -0,0 +1,164 @@
+"""
+Asyncio Fetch Engine for News Scraper System
+Alternative to the blocking settings.get_request: keeps many article fetches
+in flight from a single thread, bounded by a global and a per-host semaphore
+"""
+
+import asyncio
+import json
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from settings import HOST_FAILURE_STATUSES, adaptive_timeouts, circuit_breakers, get_headers, logger, proxy_manager, rate_limiter, response_cache, retry_policy
+
+
+class AsyncResponse:
+    """Minimal requests.Response look-alike so scraper parse methods work unchanged"""
+
+    def __init__(self, url: str, status_code: int, headers: Dict, content: bytes, encoding: Optional[str]):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class AsyncFetchEngine:
+    """aiohttp-based fetcher with global and per-host concurrency limits"""
+
+    def __init__(self, global_limit: int = 100, per_host_limit: int = 8):
+        """
+        Initialize fetch engine
+
+        Args:
+            global_limit: Max requests in flight across all hosts
+            per_host_limit: Max requests in flight against a single host
+        """
+        self.global_limit = global_limit
+        self.per_host_limit = per_host_limit
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._global: Optional[asyncio.Semaphore] = None
+        self._hosts: Dict[str, asyncio.Semaphore] = {}
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.failures = 0
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        """Open the shared aiohttp session (must run inside the event loop)"""
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=self.global_limit, limit_per_host=self.per_host_limit, ssl=False)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._global = asyncio.Semaphore(self.global_limit)
+
+    async def close(self):
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    def _host_semaphore(self, host: str) -> asyncio.Semaphore:
+        if host not in self._hosts:
+            self._hosts[host] = asyncio.Semaphore(self.per_host_limit)
+        return self._hosts[host]
+
+    async def fetch(self, url: str, max_retries: int = 20, timeout: Optional[float] = None,
+                    params: Dict = None, headers: Dict = None) -> Tuple[bool, Optional[AsyncResponse]]:
+        """Async counterpart of settings.get_request, same (done, response) contract"""
+        await self.start()
+        if not headers:
+            headers = get_headers()
+        host_semaphore = self._host_semaphore(urlsplit(url).hostname or "")
+
+        retry_policy.record_request()
+        retry_after = None
+        for attempt in range(max_retries):
+            if attempt:
+                if not retry_policy.allow_retry():
+                    logger.warning(f"🪣 Retry budget exhausted, giving up on {url}")
+                    break
+                # Back off outside the semaphores so the slot goes to another request
+                await asyncio.sleep(retry_policy.delay(attempt - 1, retry_after))
+                retry_after = None
+            if not circuit_breakers.allow(url):
+                logger.warning(f"🔌 Circuit open, failing fast: {url}")
+                return False, None
+            await rate_limiter.acquire_async(url)
+            # Host slot first: a request queued behind a busy host must not hold a global slot
+            async with host_semaphore, self._global:
+                self.in_flight += 1
+                self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+                self.requests += 1
+                proxy = proxy_manager.choose(url)
+                attempt_timeout = timeout or adaptive_timeouts.timeout_for(url)
+                started = time.monotonic()
+                try:
+                    async with self._session.get(
+                        url,
+                        headers=headers,
+                        proxy=f"http://{proxy}" if proxy else None,
+                        timeout=aiohttp.ClientTimeout(total=attempt_timeout),
+                        params=params or None,
+                    ) as res:
+                        body = await res.read()
+                    adaptive_timeouts.record(url, time.monotonic() - started)
+                    proxy_manager.report(proxy, url, time.monotonic() - started, res.status)
+                    circuit_breakers.record(url, res.status not in HOST_FAILURE_STATUSES and res.status < 500)
+
+                    if res.status == 200:
+                        logger.info(f"✅ Success: {url} [{res.status}]")
+                        response = AsyncResponse(str(res.url), res.status, dict(res.headers), body, res.charset)
+                        response_cache.put(url, response)
+                        return True, response
+
+                    if retry_policy.is_permanent(res.status):
+                        logger.warning(f"🚫 Permanent failure, not retrying: {url} [{res.status}]")
+                        self.failures += 1
+                        return False, None
+
+                    retry_after = retry_policy.retry_after(res.status, res.headers)
+                    logger.warning(f"⚠️ Failed: {url} [{res.status}]")
+
+                except asyncio.TimeoutError as e:
+                    if proxy is None and not isinstance(e, aiohttp.ConnectionTimeoutError):
+                        # Only a direct read timeout says the host itself was slow
+                        adaptive_timeouts.record_timeout(url)
+                    proxy_manager.report(proxy, url, time.monotonic() - started)
+                    circuit_breakers.record(url, False)
+                    logger.warning(f"⏳ Timeout on {url}, retry {attempt+1}/{max_retries}")
+                except Exception as e:
+                    proxy_manager.report(proxy, url, time.monotonic() - started)
+                    circuit_breakers.record(url, False)
+                    logger.warning(f"❌ Error fetching {url}: {e}")
+                finally:
+                    self.in_flight -= 1
+        else:
+            logger.error(f"❌ All retries failed for {url}")
+
+        self.failures += 1
+        return False, None
+
+    def get_stats(self) -> Dict:
+        return {
+            "requests": self.requests,
+            "failures": self.failures,
+            "peak_in_flight": self.peak_in_flight,
+            "global_limit": self.global_limit,
+            "per_host_limit": self.per_host_limit,
+        }
@@ -1,13 +1,56 @@
+import asyncio
+import inspect
+import re
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
-from typing import Dict, Optional
+from typing import Dict, Iterator, List, Optional, Set
 import pytz
+from bs4 import BeautifulSoup, SoupStrainer
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError, OperationFailure
+from requests import RequestException
 from logger import CustomLogger
+from pipeline import Pipeline, Stage
+from sitemap import iter_sitemap, parse_w3c_datetime
+from settings import checkpoints, circuit_breakers, fetch_scheduler, get_request, known_urls, response_cache, retry_policy, validator_cache
+
+DUPLICATE_KEY = 11000
+INDEX_NOT_FOUND = 27
+
+# collection full name -> whether it has a unique url index, checked once per process
+_url_indexes: Dict[str, bool] = {}
+_url_indexes_lock = threading.Lock()
 
 ist = pytz.timezone("Asia/Kolkata")
 ist_time = datetime.now(tz=ist)
 
 class BaseScraper:
     
+    # Listing base URLs for the generic paginated loop (run_async); page N is
+    # PAGE_URL_TEMPLATE formatted with url=<base>, page=N. Only scrapers that declare
+    # a template get their next listing pages prefetched, see next_listing_url()
+    LISTING_URLS: List[str] = []
+    PAGE_URL_TEMPLATE: Optional[str] = None
+    FIRST_PAGE = 1  # page_index each listing starts at, in run() and run_async() alike
+    # Detail stage (check_db_grid): skip grid items already in the DB before fetching them
+    # (after the watermark cut; False for scrapers that drop them while collecting the grid),
+    # and whether grid fields win over separate_blog_details output when merging
+    SKIP_EXISTING_BEFORE_FETCH = True
+    GRID_OVERRIDES_DETAILS = False
+    # Article field the incremental watermark is kept on (see apply_watermark)
+    WATERMARK_FIELD = "time"
+    # Full mode: consecutive empty listing pages taken as the end of the listing
+    EMPTY_PAGES_END_LISTING = 3
+    # run() pages every listing through should_continue_scraping / page_index, so a
+    # backfill can be split into page-range shards (see set_shard)
+    SHARDABLE = True
+    # Sitemap discovery (run_sitemaps): sitemap / sitemap index URLs, and the pattern
+    # a <loc> must match to count as an article (empty = every URL)
+    SITEMAP_URLS: List[str] = []
+    SITEMAP_URL_PATTERN = ""
+    
     def __init__(self, db_client, log_folder: str = "log/scrapers"):
         
         self.db_client = db_client
@@ -16,7 +59,19 @@ class BaseScraper:
             'max_pages': 5,
             'skip_threshold': 10,
             'enable_skip_logic': True,
-            'mode': 'incremental'
+            'mode': 'incremental',
+            'detail_concurrency': 4,
+            'write_batch_size': 200,
+            'write_flush_seconds': 5,
+            'save_mode': 'atomic',
+            'listing_prefetch': 1,
+            'parse_workers': 2,
+            'pipeline_queue_size': 16,
+            'watermark_overlap_minutes': 60,
+            'watermark_min_older_items': 2,
+            'frontier_search': True,
+            'frontier_known_ratio': 1.0,
+            'sitemap_batch_size': 50
         }
         self.page_index = 1
         self.run_loop = True
@@ -28,26 +83,159 @@ class BaseScraper:
         self.last_empty_page = None  
         self.articles_saved_this_page = 0
         self.is_in_backtrack_mode = False  # Explicit backtracking flag   
+        self.circuit_open_hosts = set()  # Hosts whose circuit breaker opened during this run
+        self.listing_not_modified = False  # Last listing fetch came back 304
+        self.pages_not_modified = 0
+        self.listing_validator_url: Optional[str] = None  # Listing page being processed, its validators await commit
+        self.page_incomplete = False  # A detail of that page failed, so it is refetched in full next run
+        self.validated_pages: List[str] = []  # Processed listing pages, committed by the next flush_writes()
+        self.replay_mode = False  # Reparsing cached responses, see reparse_from_cache()
+        self.end_of_listing = False  # Listing page missing from the cache while replaying
+        self.retry_budget = retry_policy.new_budget()  # Retries this run may spend across all its requests
+        self.write_buffer: List[UpdateOne] = []  # Pending upserts, see flush_writes()
+        self.buffered_urls: List[str] = []
+        self.buffered_url_set: Set[str] = set()  # buffered_urls for the duplicate check in save_article()
+        self.buffered_times: List[Optional[datetime]] = []  # WATERMARK_FIELD of each buffered article
+        self.buffer_started = 0.0
+        self.bulk_writes = 0
+        self.unique_url_index = False  # Set by ensure_url_index(); atomic saves need it
+        self.prefetch_pool: Optional[ThreadPoolExecutor] = None  # Next listing pages, see prefetch_listings()
+        self.prefetched: Dict[str, Future] = {}
+        self.prefetch_hits = 0
+        self.detail_pipeline: Optional[Pipeline] = None  # Built on first check_db_grid, see build_detail_pipeline()
+        self.last_listing_page: Optional[int] = None
+        self.listing_stride = 1  # How far page_index moves between listing fetches, learned in get_listing
+        self.listing_base: Optional[str] = None  # Listing base URL get_listing_grid is paging through
+        self.prefetch_wasted = 0
+        self.watermark: Optional[Dict] = None  # Newest article saved by an earlier run, see set_watermark()
+        self.watermark_reached = False  # Current listing hit the watermark, stop paging it
+        self.watermark_gap = False  # A listing stopped before reaching the watermark (page limit, breaker)
+        self.saved_watermark: Optional[Dict] = None  # Newest article written this run
+        self.watermark_cuts = 0
+        self.frontier: Optional[Dict] = None  # Full-mode gallop/bisection state, see next_frontier_page()
+        self.frontier_next: Optional[int] = None  # Page index get_new_page_index last returned
+        self.page_offset = 0  # What the run loop adds to that before fetching (legacy loops += 1)
+        self.resume_page: Optional[int] = None  # Where to continue after revisiting a stepped-over page
+        self.empty_pages = 0
+        self.listed_grid: List[Dict] = []  # Grid items drop_existing saw on this listing page, before filtering
+        self.oldest_stored: Optional[datetime] = None
+        self.oldest_stored_loaded = False
+        self.frontier_searches = 0
+        self.frontier_probes = 0
+        self.frontier_pages: List[int] = []
+        self.expected_page: Optional[int] = None  # Page index get_new_page_index last returned for this listing
+        self.continues_listing = False  # Set by get_new_page_index: the next track_listing continues this listing
+        self.listing_number = -1  # Listings started this run, checkpoints say which one to resume
+        self.listings_finished = 0  # Listings followed to their end or their shard's last page, see backfill_complete()
+        self.resume_from: Optional[Dict] = None  # Checkpoint of a previous, unfinished run
+        self.checkpoint_loaded = False
+        self.pages_since_checkpoint = 0
+        self.shard: Optional[Dict] = None  # {"id", "start", "end"} page offsets this instance backfills
+        self.listing_first: Optional[int] = None  # page_index the current listing started at
+        self.page_limit: Optional[int] = None  # First page_index past this shard (exclusive)
+        self.hold_gap = 0  # page_index at should_continue_scraping minus what get_new_page_index returned
+        self.sitemaps_fetched = 0  # Sitemap discovery counters, see run_sitemaps()
+        self.sitemaps_skipped = 0
+        self.sitemap_urls_seen = 0
+        self.sitemap_errors = 0  # Sitemaps that could not be fetched or parsed
+        self.sitemap_complete = False  # run_sitemaps read every sitemap and saved every new URL, see run_sitemaps()
         self.ist = pytz.timezone("Asia/Kolkata")
         self.utc = pytz.UTC
+        self.ensure_url_index()
+        # Optional in-memory filter of this collection's stored URLs (None when disabled)
+        self.known_urls = known_urls.for_collection(db_client)
+    
+    def ensure_url_index(self):
+        """
+        Unique index on url, so existence checks are index-only and the atomic save mode's
+        insert-only upserts cannot race into duplicate documents. A non-unique url index left
+        by older runs is rebuilt as unique; a collection that already holds duplicate URLs
+        keeps a plain index and saves fall back to check-then-write (see atomic_saves).
+        """
+        key = getattr(self.db_client, 'full_name', None) or str(id(self.db_client))
+        with _url_indexes_lock:
+            if key not in _url_indexes:
+                _url_indexes[key] = self.build_unique_url_index()
+            self.unique_url_index = _url_indexes[key]
+    
+    def build_unique_url_index(self) -> bool:
+        try:
+            for name, index in self.db_client.index_information().items():
+                if [tuple(field) for field in index.get('key', [])] == [("url", 1)] and not index.get('unique'):
+                    self.logger.warning(f"⚠️ Rebuilding non-unique url index {name} as unique")
+                    try:
+                        self.db_client.drop_index(name)
+                    except OperationFailure as e:
+                        # Another process dropped it first
+                        if e.code != INDEX_NOT_FOUND:
+                            raise
+            self.db_client.create_index("url", unique=True)
+            return True
+        except Exception as e:
+            self.logger.warning(
+                f"⚠️ Could not create unique url index ({e}); saving with check-then-write "
+                f"until duplicate URLs are removed"
+            )
+        try:
+            self.db_client.create_index("url")
+        except Exception as e:
+            self.logger.warning(f"⚠️ Could not ensure url index: {e}")
+        return False
+    
+    def atomic_saves(self) -> bool:
+        """Insert-only upserts ($setOnInsert) instead of check-then-write, only behind a unique url index"""
+        return (self.config.get('save_mode', 'atomic') == 'atomic' and self.config.get('skip_existing', True)
+                and self.unique_url_index)
     
     def set_config(self, config: Dict):
         
         self.config.update(config)
         self.logger.info(f"📝 Configuration updated: {self.config}")
     
+    def on_circuit_open(self, host: str):
+        """Called by get_request when a host this scraper fetches from is failing fast"""
+        if host not in self.circuit_open_hosts:
+            self.circuit_open_hosts.add(host)
+            self.logger.warning(f"🔌 Circuit breaker open for {host}, stopping scraper")
+        self.run_loop = False
+    
+    def bind_fetch_context(self):
+        """Attach this scraper's per-thread fetch state to the current thread"""
+        # Route breaker trips on this thread's fetches back to this scraper
+        circuit_breakers.listen(self.on_circuit_open)
+        # Full-mode (backfill) fetches queue behind incremental ones in the fetch scheduler
+        fetch_scheduler.set_backfill(self.config['mode'] == 'full')
+        retry_policy.use_budget(self.retry_budget)
+        response_cache.set_replay(self.replay_mode)
+    
     def should_continue_scraping(self) -> bool:
         
+        self.bind_fetch_context()
+        
+        if self.config['mode'] == 'full' and not self.replay_mode and not self.track_listing():
+            self.stop_listing()
+            return False
+        
+        if self.watermark_reached:
+            # Only this listing is done; a multi-listing run() moves on to the next one
+            self.watermark_reached = False
+            self.logger.info("⏹️  Reached articles older than the watermark, stopping this listing")
+            self.stop_listing()
+            return False
+        
         if not self.run_loop:
             self.logger.info("⏹️  run_loop=False, stopping scraper")
+            self.watermark_gap = True
+            self.stop_listing()
             return False
         
         if self.config['mode'] == 'incremental':
             max_pages = self.config.get('max_pages', 5)
             if self.page_index > max_pages:
                 self.logger.info(f"⏹️  Reached page limit ({max_pages}), stopping scraper")
+                self.watermark_gap = True
+                self.stop_listing()
                 return False
-        print(self.config['mode'])
         if self.config['mode'] == 'incremental':
             if self.config.get('enable_skip_logic', True):
                 skip_threshold = self.config.get('skip_threshold', 10)
@@ -55,11 +243,140 @@ class BaseScraper:
                     self.logger.warning(
                         f"⏹️  Reached skip threshold ({skip_threshold} consecutive skips), stopping scraper"
                     )
+                    self.stop_listing()
                     return False
         
         return True
     
     def should_break_loop(self, page_index : int = 0, previous_grid : list = [], grid_details : list = []):
+        if self.is_end_of_listing(page_index, previous_grid, grid_details):
+            if self.config['mode'] == 'full':
+                self.listings_finished += 1
+            # Pages prefetched past the end of this listing are never going to be read
+            self.stop_listing()
+            return True
+        return False
+    
+    def stop_listing(self):
+        """The current listing's loop ends: drop its prefetches, the next loop is a new listing"""
+        self.expected_page = None
+        self.continues_listing = False
+        self.cancel_prefetch()
+    
+    def checkpointing(self) -> bool:
+        """Full-mode runs checkpoint their paging state (replays always re-walk from page 1)"""
+        return checkpoints.enabled and self.config['mode'] == 'full' and not self.replay_mode
+    
+    def set_shard(self, shard_id: int, start: int, end: int):
+        """
+        Backfill only pages [start, end) of every listing, counted from the page the run
+        loop starts the listing at; the shard checkpoints and resumes on its own
+        """
+        self.shard = {"id": shard_id, "start": start, "end": end}
+        self.logger.info(f"🧩 Shard {shard_id}: pages +{start} to +{end - 1} of each listing")
+    
+    def checkpoint_name(self) -> str:
+        name = type(self).__name__
+        return f"{name}.shard{self.shard['id']}" if self.shard else name
+    
+    def track_listing(self) -> bool:
+        """
+        Called before every full-mode listing page: checkpoints a listing in progress and
+        ends it at the shard boundary, or starts the next one (at the shard's first page,
+        or where the previous run's checkpoint says). False skips a listing that an
+        interrupted earlier run had already finished.
+        """
+        continues, self.continues_listing = self.continues_listing, False
+        if continues:
+            # What the loop added to the index get_new_page_index returned (legacy loops: +1)
+            self.hold_gap = self.page_index - self.expected_page
+            if self.page_limit is not None and self.page_index >= self.page_limit:
+                self.logger.info(f"🧩 Shard {self.shard['id']} reached its last page")
+                self.listings_finished += 1
+                return False
+            self.pages_since_checkpoint += 1
+            if self.checkpointing() and self.pages_since_checkpoint >= checkpoints.every_pages:
+                self.save_checkpoint()
+            return True
+        
+        self.listing_number += 1
+        self.listing_first = self.page_index
+        if self.shard:
+            self.page_index = self.listing_first + self.shard['start']
+            self.page_limit = self.listing_first + self.shard['end']
+        if not self.checkpointing():
+            return True
+        if not self.checkpoint_loaded:
+            self.checkpoint_loaded = True
+            self.resume_from = checkpoints.load(self.checkpoint_name())
+        resume = self.resume_from
+        if resume is None:
+            return True
+        if self.listing_number < resume.get('listing', 0):
+            self.logger.info(f"⏭️  Listing {self.listing_number} was finished before the last run stopped, skipping")
+            self.listings_finished += 1
+            return False
+        self.resume_from = None
+        if self.listing_number == resume.get('listing', 0):
+            self.restore_checkpoint(resume)
+        return True
+    
+    def save_checkpoint(self):
+        self.pages_since_checkpoint = 0
+        checkpoints.save(self.checkpoint_name(), {
+            "listing": self.listing_number,
+            "page_index": self.page_index,
+            "expected_page": self.expected_page,
+            "skipped_pages": self.skipped_pages,
+            "skip_stage": self.skip_stage,
+            "is_in_backtrack_mode": self.is_in_backtrack_mode,
+            "last_empty_page": self.last_empty_page,
+            "frontier": self.frontier,
+            "frontier_next": self.frontier_next,
+            "page_offset": self.page_offset,
+            "resume_page": self.resume_page,
+            "empty_pages": self.empty_pages,
+            "saved_at": datetime.now(timezone.utc).isoformat()
+        })
+    
+    def restore_checkpoint(self, checkpoint: Dict):
+        """Continue the listing from a previous run's checkpoint instead of page 1"""
+        self.page_index = checkpoint['page_index']
+        self.expected_page = checkpoint.get('expected_page')
+        self.skipped_pages = checkpoint.get('skipped_pages', [])
+        self.skip_stage = checkpoint.get('skip_stage', 0)
+        self.is_in_backtrack_mode = checkpoint.get('is_in_backtrack_mode', False)
+        self.last_empty_page = checkpoint.get('last_empty_page')
+        self.frontier = checkpoint.get('frontier')
+        self.frontier_next = checkpoint.get('frontier_next')
+        self.page_offset = checkpoint.get('page_offset', 0)
+        self.resume_page = checkpoint.get('resume_page')
+        self.empty_pages = checkpoint.get('empty_pages', 0)
+        self.logger.info(
+            f"♻️ Resuming listing {self.listing_number} at page {self.page_index} "
+            f"from checkpoint of {checkpoint.get('saved_at', 'a previous run')}"
+        )
+    
+    def backfill_complete(self) -> bool:
+        """
+        Whether this full-mode run followed every listing it started to the end of the
+        listing (or to its shard's last page); False when the run stopped early, e.g. on
+        a circuit breaker or a run loop that broke off for another reason
+        """
+        return self.run_loop and self.listing_number >= 0 and self.listings_finished > self.listing_number
+    
+    def finish_checkpoint(self):
+        """A backfill that ran to the end starts from page 1 next time; one stopped early keeps its checkpoint"""
+        if self.checkpointing() and self.backfill_complete():
+            checkpoints.clear(self.checkpoint_name())
+    
+    def is_end_of_listing(self, page_index: int, previous_grid: list, grid_details: list) -> bool:
+        if self.listing_not_modified:
+            # Page unchanged since last run, so nothing deeper in this listing changed either
+            return True
+        if self.end_of_listing:
+            self.end_of_listing = False
+            return True
         if self.config['mode'] == 'full':
             if page_index >= 5000:
                 return True
@@ -70,16 +387,46 @@ class BaseScraper:
 
     def get_new_page_index(self, page_index, grid_details: list) -> int:
         """
-        Adaptive page indexing with smart backtracking.
-        
-        Forward mode: Skip 1→5→10→20 when no articles saved
-        Backtrack mode: Process skipped pages sequentially when articles found
+        Next listing page: +1 in incremental mode; in full mode the frontier search
+        (next_frontier_page), or the adaptive stepping below when frontier_search is off.
         """
+        # Classified as listed, not as left after dropping stored items (see listed_page)
+        grid_details, self.listed_grid = self.listed_page(grid_details), []
         if self.config['mode'] != 'full':
             # Incremental mode - simple +1
             self.articles_saved_this_page = 0
             return page_index + 1
         
+        if self.frontier_search_enabled():
+            next_page = self.next_frontier_page(page_index, grid_details)
+        else:
+            next_page = self.next_stepping_page(page_index, grid_details)
+        # Next should_continue_scraping continues this listing (see track_listing)
+        self.expected_page = next_page
+        self.continues_listing = True
+        return next_page
+    
+    def listed_page(self, grid_details: list) -> list:
+        """
+        The page's grid as listed, for telling scraped and empty pages apart: a scraper that
+        drops stored items while collecting the grid (drop_existing in scrape_grid_data)
+        leaves grid_details short, or empty on a page it has fully scraped
+        """
+        listed = list(grid_details)
+        urls = {grid.get('url') for grid in grid_details}
+        for grid in self.listed_grid:
+            if grid.get('url') not in urls:
+                urls.add(grid.get('url'))
+                listed.append(grid)
+        return listed
+    
+    def next_stepping_page(self, page_index, grid_details: list) -> int:
+        """
+        Adaptive page indexing with smart backtracking.
+        
+        Forward mode: Skip 1→5→10→20 when no articles saved
+        Backtrack mode: Process skipped pages sequentially when articles found
+        """
         # Check productivity
         was_productive = self.articles_saved_this_page > 0
         saved_count = self.articles_saved_this_page
@@ -141,21 +488,401 @@ class BaseScraper:
             
             return next_page
 
-    def check_article_exists(self, url: str) -> bool:
+    def frontier_search_enabled(self) -> bool:
+        # Replays re-walk every cached page, and without skip_existing nothing counts as scraped
+        return (self.config.get('frontier_search', True) and not self.replay_mode
+                and self.config.get('skip_existing', True))
+    
+    def oldest_stored_time(self) -> Optional[datetime]:
+        """Oldest WATERMARK_FIELD in the collection (one query per run, lowered as older articles are written)"""
+        if not self.oldest_stored_loaded:
+            self.oldest_stored_loaded = True
+            try:
+                doc = self.db_client.find_one(
+                    {self.WATERMARK_FIELD: {"$type": "date"}},
+                    {self.WATERMARK_FIELD: 1, "_id": 0},
+                    sort=[(self.WATERMARK_FIELD, 1)]
+                )
+                self.oldest_stored = self.article_time(doc) if doc else None
+            except Exception as e:
+                self.logger.warning(f"⚠️ Could not read oldest stored article time: {e}")
+        return self.oldest_stored
+    
+    def page_scraped(self, grid_details: List[Dict]) -> bool:
+        """
+        Whether a listing page has nothing left to save: at least frontier_known_ratio of its
+        URLs are stored. A page dated entirely before the oldest stored article is unscraped
+        without a DB query.
+        """
+        urls = {grid['url'] for grid in grid_details if grid.get('url')}
+        if not urls:
+            return False
+        dated = [published for published in map(self.article_time, grid_details) if published is not None]
+        oldest = self.oldest_stored_time() if dated else None
+        if oldest is not None and max(dated) < oldest:
+            return False
+        existing = self.existing_urls(list(urls))
+        if existing is None:
+            return False
+        return len(existing & urls) / len(urls) >= self.config.get('frontier_known_ratio', 1.0)
+    
+    def is_frontier_probe(self) -> bool:
+        """The page being processed is only fetched to locate the frontier, its articles are left alone"""
+        return self.frontier is not None and self.page_index == self.frontier_next + self.page_offset
+    
+    def next_frontier_page(self, page_index: int, grid_details: list) -> int:
+        """
+        Full-mode paging that finds where unscraped history starts in O(log n) listing fetches.
         
-        try:
-            exists = self.db_client.find_one({"url": url}) is not None
-            if exists:
-                if not self.config['mode'] == "full" :
-                    self.consecutive_skips += 1
-                    self.skipped_urls += 1
+        Pages are processed one after another while they have missing articles. From the first
+        page with nothing new, the search gallops ahead (+1, +2, +4, ... pages) until a page with
+        missing articles (or an empty page past the end of the listing), then bisects between the
+        last scraped and that page. Probed pages are only classified (page_scraped); processing
+        resumes at the first page with missing articles.
+        """
+        saved = self.articles_saved_this_page
+        self.articles_saved_this_page = 0
+        
+        # The loop fetches the returned index plus whatever it adds itself (legacy loops do
+        # page_index += 1); a jump back means a new listing, so any search is stale
+        step = None if self.frontier_next is None else page_index - self.frontier_next
+        stepped_over = 0
+        if step is not None and 0 <= step <= 2:
+            stepped_over = step - self.page_offset
+            self.page_offset = step
+        else:
+            self.frontier = None
+            self.empty_pages = 0
+            self.resume_page = None
+        
+        if self.frontier is None and stepped_over > 0:
+            # Increment learned only now: go back for the page it stepped over, then carry on
+            self.resume_page = page_index + 1
+            target = page_index - stepped_over
+        elif self.frontier is None:
+            target = self.next_sequential_page(page_index, grid_details, saved)
+        else:
+            target = self.next_probe_page(page_index, grid_details)
+        self.frontier_next = target - self.page_offset
+        return self.frontier_next
+    
+    def next_sequential_page(self, page_index: int, grid_details: list, saved: int) -> int:
+        if not grid_details:
+            self.empty_pages += 1
+            if self.empty_pages >= self.EMPTY_PAGES_END_LISTING:
+                self.logger.info(f"🏁 {self.empty_pages} empty pages in a row, end of listing")
+                self.end_of_listing = True
+            return page_index + 1
+        self.empty_pages = 0
+        resume, self.resume_page = self.resume_page, None
+        if saved > 0 or not self.page_scraped(grid_details):
+            return max(page_index + 1, resume or 0)
+        
+        self.frontier = {"start": page_index, "lo": page_index, "hi": None, "hi_empty": False, "step": 1}
+        self.frontier_searches += 1
+        self.logger.info(f"🔎 Page {page_index} already scraped, searching for the first page with missing articles")
+        return page_index + 1
+    
+    def next_probe_page(self, page_index: int, grid_details: list) -> int:
+        search = self.frontier
+        self.frontier_probes += 1
+        if grid_details and self.page_scraped(grid_details):
+            search['lo'] = page_index
+        else:
+            search['hi'], search['hi_empty'] = page_index, not grid_details
+        
+        if search['hi'] is None:
+            search['step'] *= 2
+            target = search['lo'] + search['step']
+            if self.page_limit is not None:
+                # Never gallop past the shard: its last page bounds the search instead
+                last = self.page_limit - 1 - self.hold_gap + self.page_offset
+                if search['lo'] >= last:
+                    self.frontier = None
+                    self.logger.info(f"🧩 Shard {self.shard['id']} already scraped up to its last page {last}")
+                    return last + 1
+                target = min(target, last)
+            self.logger.info(f"🚀 Page {page_index} scraped, galloping to page {target}")
+            return target
+        if search['hi'] - search['lo'] > 1:
+            middle = (search['lo'] + search['hi']) // 2
+            self.logger.info(f"🔎 Frontier between pages {search['lo']} and {search['hi']}, probing {middle}")
+            return middle
+        
+        self.frontier = None
+        if search['hi_empty']:
+            self.logger.info(f"🏁 Listing ends after page {search['lo']}, everything before it is scraped")
+            self.end_of_listing = True
+        else:
+            self.frontier_pages.append(search['hi'])
+            self.logger.info(f"🎯 Frontier at page {search['hi']} (searched from page {search['start']}), resuming from there")
+        return search['hi']
+    
+    def get_listing(self, url: str, **kwargs):
+        """
+        get_request for listing pages. In incremental mode the page is revalidated with
+        ETag / Last-Modified; a 304 sets listing_not_modified so the caller skips parsing
+        and DB checks and should_break_loop ends this listing.
+        
+        In incremental mode the next config['listing_prefetch'] pages are fetched in the
+        background while this page's details are processed, see prefetch_listings().
+        """
+        future = None if kwargs else self.prefetched.pop(url, None)
+        done, response = False, None
+        if future is not None:
+            try:
+                done, response = future.result()
+                self.prefetch_hits += 1
+            except Exception as e:
+                self.logger.warning(f"⚠️ Prefetched listing failed, fetching again: {e}")
+                future = None
+        if future is None:
+            done, response = self.fetch_listing(url, **kwargs)
+        if self.last_listing_page is not None and self.page_index > self.last_listing_page:
+            self.listing_stride = self.page_index - self.last_listing_page
+        self.last_listing_page = self.page_index
+        
+        self.listing_not_modified = bool(done and response.status_code == 304)
+        if self.replay_mode and not done:
+            self.logger.info(f"📦 Listing not in cache, end of replay for: {url}")
+            self.end_of_listing = True
+        if self.listing_not_modified:
+            self.pages_not_modified += 1
+            self.logger.info(f"♻️ Listing unchanged since last run: {url}")
+        elif done and self.config['mode'] == 'incremental':
+            # Revalidated next run only once this page's articles are saved, see finish_listing_page()
+            self.listing_validator_url = url
+            self.page_incomplete = False
+        # A failed or unchanged page ends this listing, nothing after it is worth fetching
+        self.prefetch_listings(url if done and not self.listing_not_modified else None)
+        return done, response
+    
+    def fetch_listing(self, url: str, **kwargs):
+        return get_request(url, conditional=self.config['mode'] == 'incremental', kind="listing", **kwargs)
+    
+    def _fetch_listing_bound(self, url: str):
+        self.bind_fetch_context()
+        return self.fetch_listing(url)
+    
+    def next_listing_url(self, url: str, pages_ahead: int) -> Optional[str]:
+        """
+        URL of the listing page pages_ahead after url, or None when it cannot be told.
+        Built from PAGE_URL_TEMPLATE and the listing get_listing_grid is paging, stepping
+        by the page stride the run loop has shown so far. Scrapers without a template
+        (cursor or token pagination, hand-built URLs) are not prefetched unless they
+        override this.
+        """
+        if not self.PAGE_URL_TEMPLATE or self.listing_base is None:
+            return None
+        if url != self.PAGE_URL_TEMPLATE.format(url=self.listing_base, page=self.page_index):
+            return None
+        return self.PAGE_URL_TEMPLATE.format(url=self.listing_base, page=self.page_index + pages_ahead * self.listing_stride)
+    
+    def prefetch_listings(self, url: Optional[str]):
+        """
+        Start fetching the listing pages after url (the page just read) so they are ready
+        when the run loop asks for them. Only incremental mode walks pages in a predictable
+        +1 order; full mode jumps around and replay reads from disk, so neither prefetches.
+        Prefetches no longer on the path ahead are cancelled.
+        """
+        depth = int(self.config.get('listing_prefetch', 0))
+        upcoming = []
+        if url and depth > 0 and self.config['mode'] == 'incremental' and not self.replay_mode:
+            max_pages = self.config.get('max_pages', 5)
+            for ahead in range(1, depth + 1):
+                next_url = self.next_listing_url(url, ahead)
+                if next_url is None or self.page_index + ahead * self.listing_stride > max_pages:
+                    break
+                upcoming.append(next_url)
+        
+        for stale in [key for key in self.prefetched if key not in upcoming]:
+            self._discard_prefetch(self.prefetched.pop(stale))
+        if not upcoming:
+            return
+        if self.prefetch_pool is None:
+            self.prefetch_pool = ThreadPoolExecutor(max_workers=depth, thread_name_prefix="listing")
+        for next_url in upcoming:
+            if next_url not in self.prefetched:
+                self.prefetched[next_url] = self.prefetch_pool.submit(self._fetch_listing_bound, next_url)
+    
+    def finish_listing_page(self):
+        """The current listing page went through the detail stage: commit its validators with the next write"""
+        url, self.listing_validator_url = self.listing_validator_url, None
+        if url and self.run_loop and not self.page_incomplete:
+            self.validated_pages.append(url)
+    
+    def commit_validators(self, failed: bool = False):
+        """
+        Called after every flush_writes(): the finished listing pages' articles are in the DB,
+        so their validators may turn the next run's fetches into 304s. After a failed write
+        they are dropped instead and the pages are fetched in full next run.
+        """
+        pages, self.validated_pages = self.validated_pages, []
+        if failed:
+            # The page in progress may have had articles in the failed write too
+            self.page_incomplete = True
+        for url in pages:
+            if failed:
+                validator_cache.discard(url)
             else:
-                self.consecutive_skips = 0
-            
-            return exists
+                validator_cache.commit(url)
+    
+    def _discard_prefetch(self, future: Future):
+        # A request already on the wire finishes in the background, its response is dropped
+        future.cancel()
+        self.prefetch_wasted += 1
+    
+    def cancel_prefetch(self):
+        """Drop every pending listing prefetch (loop is stopping or leaving this listing)"""
+        for future in self.prefetched.values():
+            self._discard_prefetch(future)
+        self.prefetched = {}
+        if self.prefetch_pool is not None:
+            self.prefetch_pool.shutdown(wait=False)
+            self.prefetch_pool = None
+    
+    def article_exists(self, url: str) -> Optional[bool]:
+        """DB lookup only, no skip counting; None when unknown (replay mode or DB error)"""
+        if self.replay_mode:
+            # Reparsing: every cached article is re-extracted and overwritten
+            return None
+        try:
+            if self.known_urls:
+                return url in self.known_urls.existing([url])
+            return self.db_client.find_one({"url": url}) is not None
         except Exception as e:
             self.logger.error(f"❌ Error checking article existence: {e}")
-            return False
+            return None
+    
+    def existing_urls(self, urls: List[str]) -> Optional[Set[str]]:
+        """
+        Which of urls are already stored, in a single $in query projected to the indexed
+        url field (covered by the url index). None when unknown (replay mode or DB error).
+        """
+        if self.replay_mode:
+            return None
+        if not urls:
+            return set()
+        try:
+            if self.known_urls:
+                return self.known_urls.existing(urls)
+            cursor = self.db_client.find({"url": {"$in": list(set(urls))}}, {"url": 1, "_id": 0})
+            return {doc["url"] for doc in cursor}
+        except Exception as e:
+            self.logger.error(f"❌ Error checking article existence: {e}")
+            return None
+    
+    def check_articles_exist(self, urls: List[str]) -> List[bool]:
+        """Batched check_article_exists: one query, skip counters applied in list order"""
+        existing = self.existing_urls(urls)
+        flags = []
+        for url in urls:
+            exists = None if existing is None else url in existing
+            self.count_existing(exists)
+            flags.append(bool(exists))
+        return flags
+    
+    def drop_existing(self, grids: List[Dict]) -> List[Dict]:
+        """Grid items not stored yet (one query for the whole grid page)"""
+        self.listed_grid.extend(grids)
+        flags = self.check_articles_exist([grid['url'] for grid in grids])
+        return [grid for grid, exists in zip(grids, flags) if not exists]
+    
+    def count_existing(self, exists: Optional[bool]):
+        """Update the skip counters for one article_exists() result"""
+        if exists:
+            if not self.config['mode'] == "full" :
+                self.consecutive_skips += 1
+                self.skipped_urls += 1
+        elif exists is False:
+            self.consecutive_skips = 0
+    
+    def check_article_exists(self, url: str) -> bool:
+        
+        exists = self.article_exists(url)
+        self.count_existing(exists)
+        return bool(exists)
+    
+    def set_watermark(self, watermark: Optional[Dict]):
+        """
+        Newest article an earlier incremental run saved, as persisted by ScraperState
+        
+        Args:
+            watermark: {"time": ISO timestamp, "url": ...} or None for no watermark
+        """
+        self.watermark = None
+        if not watermark:
+            return
+        try:
+            mark_time = datetime.fromisoformat(watermark['time'])
+        except (KeyError, TypeError, ValueError) as e:
+            self.logger.warning(f"⚠️ Ignoring unreadable watermark {watermark}: {e}")
+            return
+        if mark_time.tzinfo is None:
+            mark_time = mark_time.replace(tzinfo=timezone.utc)
+        self.watermark = {"time": mark_time, "url": watermark.get('url', '')}
+        self.logger.info(f"🔖 Watermark: {mark_time.isoformat()} ({self.watermark['url']})")
+    
+    def article_time(self, article: Dict) -> Optional[datetime]:
+        """WATERMARK_FIELD of a grid item / article as an aware datetime, None if it has no parsed date"""
+        value = article.get(self.WATERMARK_FIELD)
+        if not isinstance(value, datetime):
+            return None
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value
+    
+    def apply_watermark(self, grids: List[Dict]) -> List[Dict]:
+        """
+        Cut a listing page at the watermark, so nothing past it is fetched or checked
+        against the DB, and stop paging the listing.
+        
+        The cut is at the watermark URL itself, or at the first run of watermark_min_older_items
+        consecutive items dated more than watermark_overlap_minutes before the watermark time
+        (a single old item can be a pinned / sticky post). Items without a parsed date
+        never count as older.
+        """
+        if self.watermark is None or self.config['mode'] != 'incremental' or not grids:
+            return grids
+        threshold = self.watermark['time'] - timedelta(minutes=self.config.get('watermark_overlap_minutes', 60))
+        min_older = max(self.config.get('watermark_min_older_items', 2), 1)
+        
+        cut, older = None, 0
+        for index, grid in enumerate(grids):
+            if grid.get('url') == self.watermark['url']:
+                cut = index
+                break
+            published = self.article_time(grid)
+            older = older + 1 if published is not None and published < threshold else 0
+            if older >= min_older:
+                cut = index - min_older + 1
+                break
+        if cut is None:
+            return grids
+        
+        self.watermark_reached = True
+        self.watermark_cuts += 1
+        self.logger.info(f"🔖 Watermark reached: keeping {cut} of {len(grids)} items on page {self.page_index}")
+        return grids[:cut]
+    
+    def next_watermark(self) -> Optional[Dict]:
+        """
+        Watermark to persist after a successful run, or None to keep the stored one.
+        
+        It only moves forward, and only when every listing was followed down to already-stored
+        articles (watermark, skip threshold or unchanged page): a run cut short by max_pages
+        would otherwise leave unscraped articles behind the new mark.
+        """
+        saved = self.saved_watermark
+        if saved is None or (self.watermark is not None and self.watermark_gap):
+            return None
+        if self.watermark is not None and saved['time'] <= self.watermark['time']:
+            return None
+        return {
+            "time": saved['time'].isoformat(),
+            "url": saved['url'],
+            "updated": datetime.now(timezone.utc).isoformat()
+        }
     
     def is_article_too_old(self, article_date: datetime, cutoff_year: int = 2025) -> bool:
         
@@ -205,29 +932,114 @@ class BaseScraper:
         fixed_doc['created_at'] = ist_time
         return fixed_doc
     
-    def save_article(self, article_data: Dict) -> bool:
+    def save_article(self, article_data: Dict, checked: bool = False) -> bool:
+        """
+        Queue an upsert for the article; the write buffer is flushed with one unordered
+        bulk_write by size (write_batch_size) or age (write_flush_seconds).
+
+        checked=True means the caller already ran the existence check for this URL
+        and updated the skip counters (filter stage / drop_existing).
+        Counters are incremented when queued and corrected from the bulk result.
         
+        In the atomic save mode there is no separate existence query: the upsert only
+        sets fields on insert, and the bulk result says which articles were new.
+        """
         try:
-            
+            url = article_data.get('url', '')
             if self.config.get('skip_existing', True):
-                if self.check_article_exists(article_data.get('url', '')):
+                if url in self.buffered_url_set:
+                    # Saved earlier in this run, just not flushed yet
+                    self.count_existing(True)
+                    return False
+                if not checked and not self.atomic_saves() and self.check_article_exists(url):
                     return False
             
-            
-            self.db_client.update_one(
+            if not self.write_buffer:
+                self.buffer_started = time.monotonic()
+            update = "$setOnInsert" if self.atomic_saves() else "$set"
+            self.write_buffer.append(UpdateOne(
                 {"url": article_data['url']},
-                {"$set": self.fix_data_doc(article_data)},
+                {update: self.fix_data_doc(article_data)},
                 upsert=True
-            )
+            ))
+            self.buffered_urls.append(article_data['url'])
+            self.buffered_url_set.add(article_data['url'])
+            self.buffered_times.append(self.article_time(article_data))
             
             self.total_articles_scraped += 1
             self.articles_saved_this_page += 1  
+            
+            if (len(self.write_buffer) >= self.config.get('write_batch_size', 200)
+                    or time.monotonic() - self.buffer_started >= self.config.get('write_flush_seconds', 5)):
+                self.flush_writes()
             return True
             
         except Exception as e:
             self.logger.error(f"❌ Error saving article: {e}")
             return False
     
+    def flush_writes(self) -> int:
+        """Write the buffered upserts in one unordered bulk_write; returns documents written"""
+        if not self.write_buffer:
+            self.commit_validators()
+            return 0
+        operations, urls, times = self.write_buffer, self.buffered_urls, self.buffered_times
+        self.write_buffer, self.buffered_urls, self.buffered_times = [], [], []
+        self.buffered_url_set = set()
+        atomic = self.atomic_saves()
+        
+        failed_indexes, duplicate_indexes = set(), set()
+        try:
+            result = self.db_client.bulk_write(operations, ordered=False)
+            upserted, matched = len(result.upserted_ids), result.matched_count
+            upserted_indexes = set(result.upserted_ids)
+        except BulkWriteError as e:
+            for error in e.details.get('writeErrors', []):
+                # A concurrent scraper inserted the same URL first: it exists, nothing failed
+                (duplicate_indexes if error.get('code') == DUPLICATE_KEY else failed_indexes).add(error['index'])
+            upserted, matched = e.details.get('nUpserted', 0), e.details.get('nMatched', 0)
+            upserted_indexes = {item['index'] for item in e.details.get('upserted', [])}
+            if failed_indexes:
+                self.logger.error(f"❌ Bulk write: {len(failed_indexes)} of {len(operations)} upserts failed")
+        except Exception as e:
+            failed_indexes = set(range(len(operations)))
+            upserted = matched = 0
+            upserted_indexes = set()
+            self.logger.error(f"❌ Error flushing {len(operations)} articles: {e}")
+        
+        if atomic:
+            # $setOnInsert: only upserted documents are new, matched ones were already stored
+            written = upserted
+            saved_indexes = upserted_indexes
+            already_stored = matched + len(duplicate_indexes)
+            if not self.config['mode'] == "full":
+                self.skipped_urls += already_stored
+        else:
+            written = upserted + matched
+            saved_indexes = set(range(len(operations))) - failed_indexes - duplicate_indexes
+        
+        # Counters were incremented when queued; take back what was not newly written
+        failed = len(operations) - written
+        if failed > 0:
+            self.total_articles_scraped -= failed
+            self.articles_saved_this_page = max(self.articles_saved_this_page - failed, 0)
+        self.bulk_writes += 1
+        if self.known_urls:
+            for index, url in enumerate(urls):
+                if index not in failed_indexes:
+                    self.known_urls.add(url)
+        for index, published in enumerate(times):
+            if published is not None and index not in failed_indexes:
+                if self.saved_watermark is None or published > self.saved_watermark['time']:
+                    self.saved_watermark = {"time": published, "url": urls[index]}
+                if self.oldest_stored is not None and published < self.oldest_stored:
+                    self.oldest_stored = published
+        self.commit_validators(failed=bool(failed_indexes))
+        for index in sorted(saved_indexes):
+            self.logger.info(f"✅ Saved: {urls[index]}")
+        self.logger.info(f"💾 Flushed {written}/{len(operations)} articles in one bulk write")
+        return written
+    
     def get_stats(self) -> Dict:
         
         return {
@@ -235,10 +1047,38 @@ class BaseScraper:
             'skipped_urls': self.skipped_urls,
             'consecutive_skips': self.consecutive_skips,
             'pages_scraped': self.page_index - 1,
-            'stopped_early': not self.run_loop
+            'pages_not_modified': self.pages_not_modified,
+            'stopped_early': not self.run_loop,
+            'circuit_open_hosts': sorted(self.circuit_open_hosts),
+            'retry_budget': self.retry_budget.get_stats(),
+            'bulk_writes': self.bulk_writes,
+            'listing_prefetch_hits': self.prefetch_hits,
+            'listing_prefetch_wasted': self.prefetch_wasted,
+            'pipeline': self.detail_pipeline.get_stats() if self.detail_pipeline else {},
+            'frontier': {
+                'searches': self.frontier_searches,
+                'probes': self.frontier_probes,
+                'pages': self.frontier_pages
+            },
+            'sitemaps': {
+                'fetched': self.sitemaps_fetched,
+                'skipped': self.sitemaps_skipped,
+                'urls_seen': self.sitemap_urls_seen,
+                'errors': self.sitemap_errors,
+                'complete': self.sitemap_complete
+            },
+            'watermark': {
+                'time': self.watermark['time'].isoformat() if self.watermark else None,
+                'cuts': self.watermark_cuts,
+                'newest_saved': self.saved_watermark['time'].isoformat() if self.saved_watermark else None
+            }
         }
     
     def log_stats(self):
+        # End of run: make the totals reflect what actually reached the DB
+        self.cancel_prefetch()
+        self.flush_writes()
+        self.finish_checkpoint()
         stats = self.get_stats()
         self.logger.info("=" * 60)
         self.logger.info("📊 SCRAPING STATISTICS")
@@ -261,3 +1101,330 @@ class BaseScraper:
     
     def run(self):
         raise NotImplementedError("Subclass must implement run()")
+    
+    def parse_article(self, grid: Dict, response) -> Optional[Dict]:
+        """
+        Run separate_blog_details (with or without grid) and merge it with the grid item.
+        Returns None when separate_blog_details gave no usable details (e.g. False).
+        """
+        if len(inspect.signature(self.separate_blog_details).parameters) > 1:
+            details = self.separate_blog_details(response, grid)
+        else:
+            details = self.separate_blog_details(response)
+        if not isinstance(details, dict):
+            self.logger.info(f"Skipping {grid['url']}: no usable details ({details!r})")
+            return None
+        merged = {**details, **grid} if self.GRID_OVERRIDES_DETAILS else {**grid, **details}
+        if grid.get('discovered_by') == 'sitemap':
+            self.fill_from_page_meta(merged, response)
+        merged['created_at'] = datetime.now(self.ist)
+        return merged
+    
+    # ------------------------------------------------------------------
+    # Detail stages: filter -> fetch -> parse -> save, streamed through a
+    # Pipeline of worker groups joined by bounded queues
+    # ------------------------------------------------------------------
+    
+    def fetch_detail(self, grid: Dict):
+        """Network half of the detail stage, runs on a worker thread; returns (done, response)"""
+        return get_request(grid['url'])
+    
+    def build_detail_pipeline(self) -> Pipeline:
+        queue_size = self.config.get('pipeline_queue_size', 16)
+        return Pipeline([
+            # One worker: existence is checked with one query per page and counted in grid order
+            Stage("filter", self._filter_stage, workers=1, queue_size=queue_size, fan_out=True),
+            Stage("fetch", self._fetch_stage, workers=self.config.get('detail_concurrency', 4), queue_size=queue_size),
+            Stage("parse", self._parse_stage, workers=self.config.get('parse_workers', 2), queue_size=queue_size),
+            # Ordered, so one worker: save_article owns the write buffer and the page counters,
+            # and articles are saved in grid order however the fetch/parse workers finish
+            Stage("save", self._save_stage, queue_size=queue_size, ordered=True),
+        ], worker_init=self.bind_fetch_context, logger=self.logger)
+    
+    def _filter_stage(self, grids: List[Dict]) -> List[Dict]:
+        if not self.SKIP_EXISTING_BEFORE_FETCH:
+            return grids
+        return self.drop_existing(grids)
+    
+    def _fetch_stage(self, grid: Dict):
+        if not self.run_loop:
+            # Stopped mid-page (e.g. circuit breaker opened): leave the rest unfetched
+            return None
+        done, response = self.fetch_detail(grid)
+        if not done:
+            self.page_incomplete = True
+            self.logger.warning(f"Failed fetching: {grid['url']}")
+            return None
+        return grid, response
+    
+    def _parse_stage(self, fetched):
+        grid, response = fetched
+        try:
+            return self.parse_article(grid, response)
+        except Exception as e:
+            self.page_incomplete = True
+            self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
+            return None
+    
+    def _save_stage(self, merged: Dict):
+        # Queued only; flush_writes() logs each article once the DB has confirmed it
+        self.save_article(merged, checked=True)
+    
+    def check_db_grid(self, grids: Optional[List[Dict]] = None, watermark: bool = True):
+        """
+        Stream the page's grid items through the detail pipeline and wait for it to drain
+        
+        Args:
+            grids: Items to process (default: grid_details)
+            watermark: Cut them at the watermark first; False when the caller already did
+        """
+        grids = self.grid_details if grids is None else grids
+        if watermark:
+            grids = self.apply_watermark(grids)
+        if self.is_frontier_probe():
+            return
+        if grids:
+            if self.detail_pipeline is None:
+                self.detail_pipeline = self.build_detail_pipeline()
+            self.detail_pipeline.run([grids])
+        self.finish_listing_page()
+    
+    def reparse_from_cache(self):
+        """
+        Re-run this scraper against the on-disk response cache only: listing and article
+        HTML go back through scrape_grid_data / separate_blog_details and the re-extracted
+        fields overwrite the stored documents. No request leaves the machine.
+        """
+        self.logger.info("📦 Reparsing from response cache")
+        self.replay_mode = True
+        self.set_config({'mode': 'full', 'skip_existing': False})
+        response_cache.set_replay(True)
+        try:
+            self.run()
+        finally:
+            self.flush_writes()
+            response_cache.set_replay(False)
+            self.replay_mode = False
+    
+    # ------------------------------------------------------------------
+    # Sitemap discovery: new article URLs come from SITEMAP_URLS instead
+    # of paging the listing, and go straight to the detail stage
+    # ------------------------------------------------------------------
+    
+    def iter_sitemap_entries(self, since: Optional[datetime] = None) -> Iterator[Dict]:
+        """
+        Grid items for the article URLs in SITEMAP_URLS, following sitemap indexes.
+        
+        Child sitemaps and URLs whose lastmod (or news publication date) is older than
+        since are skipped without being fetched / yielded; entries without a date always
+        pass. Each sitemap is parsed lazily, so items reach the caller while it is read.
+        
+        Args:
+            since: Only entries changed at or after this time (None = everything)
+        """
+        pattern = re.compile(self.SITEMAP_URL_PATTERN) if self.SITEMAP_URL_PATTERN else None
+        pending = list(self.SITEMAP_URLS)
+        seen_sitemaps = set(pending)
+        seen_urls = set()
+        while pending and self.run_loop:
+            sitemap_url = pending.pop(0)
+            # Not conditional: a 304 for an index would hide children that changed since
+            done, response = get_request(sitemap_url, kind="listing")
+            if not done:
+                self.sitemap_errors += 1
+                self.logger.warning(f"⚠️ Sitemap fetch failed: {sitemap_url}")
+                continue
+            self.sitemaps_fetched += 1
+            try:
+                for entry in iter_sitemap(response.content):
+                    changed = entry['lastmod']
+                    if entry['kind'] == 'sitemap':
+                        if entry['loc'] in seen_sitemaps:
+                            continue
+                        if since is not None and changed is not None and changed < since:
+                            self.sitemaps_skipped += 1
+                            continue
+                        seen_sitemaps.add(entry['loc'])
+                        pending.append(entry['loc'])
+                        continue
+                    url = entry['loc']
+                    if url in seen_urls or (pattern and not pattern.search(url)):
+                        continue
+                    seen_urls.add(url)
+                    changed = entry['published'] or changed
+                    if since is not None and changed is not None and changed < since:
+                        continue
+                    self.sitemap_urls_seen += 1
+                    grid = {'url': url, 'time': entry['published'], 'discovered_by': 'sitemap', 'lastmod': entry['lastmod']}
+                    if entry['title']:
+                        grid['title'] = entry['title']
+                    if entry['image']:
+                        grid['image'] = entry['image']
+                    yield grid
+            except Exception as e:
+                self.sitemap_errors += 1
+                self.logger.error(f"❌ Could not parse sitemap {sitemap_url}: {e}")
+    
+    def fill_from_page_meta(self, article: Dict, response):
+        """
+        Fill the fields a listing page would have given (title, image, time, author) from
+        the article page's <title> / Open Graph / article:published_time meta tags, for
+        items discovered through a sitemap. Fields already set are left alone.
+        """
+        missing = [key for key in ('title', 'image', 'time', 'author') if not article.get(key)]
+        if missing:
+            head = BeautifulSoup(response.text, 'html.parser', parse_only=SoupStrainer(['meta', 'title']))
+            meta = {}
+            for tag in head.find_all('meta'):
+                key = tag.get('property') or tag.get('name')
+                if key and key not in meta and tag.get('content'):
+                    meta[key] = tag['content'].strip()
+            title_tag = head.find('title')
+            found = {
+                'title': meta.get('og:title') or (title_tag.get_text(strip=True) if title_tag else None),
+                'image': meta.get('og:image'),
+                'time': parse_w3c_datetime(meta.get('article:published_time')) or article.get('lastmod'),
+                'author': meta.get('author'),
+            }
+            for key in missing:
+                if found[key]:
+                    article[key] = found[key]
+        article.pop('discovered_by', None)
+        article.pop('lastmod', None)
+    
+    def run_sitemaps(self, since: Optional[datetime] = None):
+        """
+        Incremental run driven by the sitemaps instead of the listing pages: URLs changed
+        since the last run are checked against the DB in batches of sitemap_batch_size
+        and only the new ones are fetched and parsed.
+        
+        sitemap_complete tells the caller whether the next run may start from this one:
+        only when every sitemap was fetched and parsed, nothing stopped the run (circuit
+        breaker) and every new article was fetched, parsed and written.
+        
+        Args:
+            since: Lower bound for lastmod / publication date (None = whole sitemap)
+        """
+        self.logger.info(f"🗺️ Sitemap discovery from {len(self.SITEMAP_URLS)} sitemap(s), changed since {since.isoformat() if since else 'ever'}")
+        self.bind_fetch_context()
+        batch_size = max(int(self.config.get('sitemap_batch_size', 50)), 1)
+        batch = []
+        entries = self.iter_sitemap_entries(since)
+        self.sitemap_complete = False
+        # Set by the detail stage and failed writes, never reset here: one failure makes the run incomplete
+        self.page_incomplete = False
+        read_all = False
+        while self.run_loop:
+            grid = next(entries, None)
+            if grid is not None:
+                batch.append(grid)
+            if batch and (grid is None or len(batch) >= batch_size):
+                # The filter stage only drops stored URLs for scrapers that check before fetching
+                pending = batch if self.SKIP_EXISTING_BEFORE_FETCH else self.drop_existing(batch)
+                self.check_db_grid(pending)
+                batch = []
+            if grid is None:
+                read_all = True
+                break
+        self.flush_writes()
+        self.sitemap_complete = read_all and self.run_loop and not self.sitemap_errors and not self.page_incomplete
+        if not self.sitemap_complete:
+            self.logger.warning(f"⚠️ Sitemap run incomplete ({self.sitemap_errors} sitemap error(s), stopped: {not self.run_loop}, failed articles: {self.page_incomplete})")
+        self.log_stats()
+    
+    def get_listing_grid(self, url: str) -> list:
+        """Grid of listing page page_index of url (PAGE_URL_TEMPLATE), fetched with get_listing"""
+        self.listing_base = url
+        page_url = self.PAGE_URL_TEMPLATE.format(url=url, page=self.page_index)
+        try:
+            done, response = self.get_listing(page_url)
+            self.logger.info(f"Fetching: {page_url}")
+            
+            if self.listing_not_modified:
+                return []
+            if not done:
+                self.logger.error(f"Request failed: {page_url}")
+                return []
+            
+            self.grid_details = self.scrape_grid_data(response.text)
+            self.logger.info(f"Collected {len(self.grid_details)} grid items.")
+            return self.grid_details
+        
+        except RequestException as e:
+            self.logger.error(f"Request error while fetching grid: {e}")
+            return []
+        except Exception as e:
+            self.logger.error(f"Unexpected error in get_listing_grid: {e}")
+            return []
+    
+    # ------------------------------------------------------------------
+    # Async backend: opt in by setting LISTING_URLS, fetches go through
+    # AsyncFetchEngine instead of the blocking get_request
+    # ------------------------------------------------------------------
+    
+    async def async_check_db_grid(self, engine):
+        """Fetch every new article on the page concurrently, then parse and save in grid order"""
+        pending = self.apply_watermark(self.grid_details)
+        if self.is_frontier_probe():
+            return
+        if self.SKIP_EXISTING_BEFORE_FETCH:
+            pending = self.drop_existing(pending)
+        results = await asyncio.gather(*(engine.fetch(grid['url']) for grid in pending))
+        
+        for grid, (done, response) in zip(pending, results):
+            if not done:
+                self.page_incomplete = True
+                self.logger.warning(f"Failed fetching: {grid['url']}")
+                continue
+            try:
+                merged = self.parse_article(grid, response)
+                if merged:
+                    self.save_article(merged, checked=True)
+            except Exception as e:
+                self.page_incomplete = True
+                self.logger.error(f"Error in async_check_db_grid for {grid['url']}: {e}")
+        self.finish_listing_page()
+    
+    async def async_run(self, engine):
+        """Paginated listing -> details loop over LISTING_URLS using the async engine"""
+        self.logger.info(f"🚀 Starting {type(self).__name__} scraper (async backend)")
+        self.previous_grid = []
+        for url in self.LISTING_URLS:
+            self.logger.info(f"📂 Processing: {url}")
+            self.page_index = self.FIRST_PAGE
+            self.consecutive_skips = 0
+            
+            while self.should_continue_scraping():
+                self.logger.info(f"📄 Processing page {self.page_index}")
+                self.grid_details = []
+                # Listing pages take the same path as run() (validators, prefetch); only details go async
+                self.get_listing_grid(url)
+                
+                if self.should_break_loop(self.page_index, self.previous_grid, self.grid_details):
+                    self.logger.warning("Breaking loop - reached end or duplicate pages")
+                    break
+                
+                if self.grid_details:
+                    self.previous_grid = self.grid_details
+                    await self.async_check_db_grid(engine)
+                else:
+                    self.logger.warning(f"No articles found on page {self.page_index}")
+                
+                self.page_index = self.get_new_page_index(self.page_index, self.grid_details)
+        
+        self.log_stats()
+        self.logger.info(f"✅ {type(self).__name__} scraper completed")
+    
+    def run_async(self, global_limit: int = 100, per_host_limit: int = 8):
+        """Blocking entry point for the async backend"""
+        if not self.LISTING_URLS or not self.PAGE_URL_TEMPLATE:
+            raise NotImplementedError("Subclass must set LISTING_URLS and PAGE_URL_TEMPLATE to use run_async()")
+        
+        from async_fetch import AsyncFetchEngine
+        
+        async def _main():
+            async with AsyncFetchEngine(global_limit=global_limit, per_host_limit=per_host_limit) as engine:
+                await self.async_run(engine)
+                self.logger.info(f"🌐 Async fetch stats: {engine.get_stats()}")
+        
+        asyncio.run(_main())
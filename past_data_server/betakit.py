@@ -16,6 +16,8 @@ URLS_list = [
 ]
 
 class BetaKit(BaseScraper):
+    GRID_OVERRIDES_DETAILS = True
+    
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -26,7 +28,9 @@ class BetaKit(BaseScraper):
     def get_grid_details(self, url):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(url + str(self.page_index))
+            done, response = self.get_listing(url + str(self.page_index))
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {url}")
                 return []
@@ -113,31 +117,6 @@ class BetaKit(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(grid['url']):
-                    continue
-
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                details = self.separate_blog_details(response)
-                merged = {**details, **grid}
-                merged['created_at'] = datetime.now(ist)
-                
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic"""
         # self.config['mode'] = "full"
@@ -20,6 +20,9 @@ BASE_URL = "https://www.businessinsider.com"
 API_BASE_URL = "https://www.businessinsider.com/ajax/content-api/vertical?templateId=legacy-river&capiVer=2&riverSize=50&riverNextPageToken="
 
 class BusinessInsider(BaseScraper):
+    SHARDABLE = False  # API pagination follows next_url, there are no page ranges to split
+    GRID_OVERRIDES_DETAILS = True
+    
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -31,7 +34,9 @@ class BusinessInsider(BaseScraper):
     def get_grid_details(self, url):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(url)
+            done, response = self.get_listing(url)
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {url}")
                 return []
@@ -87,10 +92,6 @@ class BusinessInsider(BaseScraper):
             
             url = urljoin(BASE_URL, title_el.get("href"))
             
-            # Check if exists (with skip tracking)
-            if self.check_article_exists(url):
-                continue
-
             articles.append({
                 "category": category,
                 "title": title_el.get_text(strip=True),
@@ -199,33 +200,6 @@ class BusinessInsider(BaseScraper):
 
         return details
 
-    def check_db_grid(self, articles_list=[]):
-        """Check DB before fetching details; skip if exists."""
-        if not articles_list:
-            articles_list = self.grid_details
-        
-        for grid in articles_list:
-            try:
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-                
-                details = self.separate_blog_details(response)
-                if details == False:
-                    continue
-                
-                merged = {**details, **grid}
-                merged['created_at'] = datetime.now(ist)
-
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic - UNIQUE: Uses API pagination"""
         self.logger.info("🚀 Starting Business Insider scraper")
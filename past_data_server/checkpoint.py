@@ -0,0 +1,109 @@
+"""
+Backfill Checkpoints for News Scraper System
+Full-mode (backfill) paging state per scraper, written atomically after every
+listing page (temp file + fsync + rename, a few hundred bytes) so a process
+that dies or is killed by the cron timeout resumes where it stopped instead
+of re-walking the archive from page 1
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from typing import Dict, Optional
+
+
+class CheckpointStore:
+    """scraper name -> last paging checkpoint, one small JSON file each"""
+
+    def __init__(self, directory: str, enabled: bool = True, fsync: bool = True, every_pages: int = 1):
+        """
+        Initialize checkpoint store
+
+        Args:
+            directory: Where the per-scraper checkpoint files are written
+            enabled: When off, nothing is written and runs always start from page 1
+            fsync: Flush each checkpoint to disk before it replaces the previous one
+            every_pages: Write a checkpoint every N listing pages
+        """
+        self.directory = directory
+        self.enabled = enabled
+        self.fsync = fsync
+        self.every_pages = every_pages
+        self._lock = threading.Lock()
+        self.writes = 0
+        self.write_seconds = 0.0
+        self.resumed = 0
+        self.errors = 0
+
+    def configure(self, options: Dict):
+        """Apply the checkpoints section of scraper_config.json"""
+        self.enabled = bool(options.get("enabled", self.enabled))
+        self.directory = options.get("directory", self.directory)
+        self.fsync = bool(options.get("fsync", self.fsync))
+        self.every_pages = max(int(options.get("every_pages", self.every_pages)), 1)
+
+    def _path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{re.sub(r'[^A-Za-z0-9_.-]', '_', name)}.json")
+
+    def load(self, name: str) -> Optional[Dict]:
+        """Last checkpoint written for name, None if there is none (or it is unreadable)"""
+        if not self.enabled:
+            return None
+        path = self._path(name)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                checkpoint = json.load(f)
+        except (json.JSONDecodeError, IOError):
+            with self._lock:
+                self.errors += 1
+            return None
+        with self._lock:
+            self.resumed += 1
+        return checkpoint
+
+    def save(self, name: str, checkpoint: Dict) -> bool:
+        """Atomically replace name's checkpoint; a crash mid-write leaves the previous one intact"""
+        if not self.enabled:
+            return False
+        started = time.monotonic()
+        path = self._path(name)
+        tmp_file = f"{path}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(tmp_file, 'w', encoding='utf-8') as f:
+                json.dump(checkpoint, f)
+                if self.fsync:
+                    f.flush()
+                    os.fsync(f.fileno())
+            os.replace(tmp_file, path)
+        except (OSError, TypeError, ValueError):
+            with self._lock:
+                self.errors += 1
+            return False
+        with self._lock:
+            self.writes += 1
+            self.write_seconds += time.monotonic() - started
+        return True
+
+    def clear(self, name: str):
+        """Drop name's checkpoint once its backfill has run to the end"""
+        try:
+            os.remove(self._path(name))
+        except FileNotFoundError:
+            pass
+        except OSError:
+            with self._lock:
+                self.errors += 1
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "writes": self.writes,
+                "avg_write_ms": round(self.write_seconds / self.writes * 1000, 2) if self.writes else 0.0,
+                "resumed": self.resumed,
+                "errors": self.errors,
+            }
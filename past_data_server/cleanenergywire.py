@@ -31,12 +31,14 @@ class CleanEnergyWire(BaseScraper):
         try:
             # UNIQUE: First page has no parameter, subsequent pages use ?page=N
             if self.page_index == 0:
-                done, response = get_request(url)
+                done, response = self.get_listing(url)
             else:
-                done, response = get_request(url + '?page=' + str(self.page_index))
+                done, response = self.get_listing(url + '?page=' + str(self.page_index))
             
             self.logger.info(f"Fetching: {url}")
             
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {url}")
                 return []
@@ -137,31 +139,6 @@ class CleanEnergyWire(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(grid['url']):
-                    continue
-                    
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                details = self.separate_blog_details(response)
-                merged = {**grid, **details}
-                merged['created_at'] = datetime.now(ist)
-                
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic"""
         self.logger.info("🚀 Starting Clean Energy Wire scraper")
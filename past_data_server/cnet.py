@@ -12,6 +12,11 @@ import pytz
 ist = pytz.timezone("Asia/Kolkata")
 
 class Cnet(BaseScraper):
+    # Stored articles are dropped per API batch in get_grid_details, so skips can end the paging
+    SKIP_EXISTING_BEFORE_FETCH = False
+    SHARDABLE = False  # API limit/offset pagination inside get_grid_details, not page_index
+    GRID_OVERRIDES_DETAILS = True
+    
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -35,7 +40,9 @@ class Cnet(BaseScraper):
                     continue
                 
                 json_data = response.json()
-                articles = self.scrape_grid_data(json_data)
+                # Cut at the watermark before the existence check, so the DB is never
+                # queried past it and the cut still sees the (stored) watermark URL
+                articles = self.drop_existing(self.apply_watermark(self.scrape_grid_data(json_data)))
                 self.grid_details.append(articles)
                 
                 self.offset += self.limit
@@ -85,9 +92,6 @@ class Cnet(BaseScraper):
         for items in data.get('items', []):
             url = self.generate_cnet_absolute_url(items)
 
-            # Check if exists (with skip tracking)
-            if self.check_article_exists(url):
-                continue
             tmp = {
                 'url': url,
                 'title': items.get('title', ''),
@@ -133,27 +137,9 @@ class Cnet(BaseScraper):
         return details
 
     def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        # UNIQUE: grid_details is a list of lists
-        for grid_items in self.grid_details:
-            for grid in grid_items:
-                try:
-                    done, response = get_request(grid["url"])
-                    if not done:
-                        self.logger.warning(f"Failed fetching: {grid['url']}")
-                        continue
-                    
-                    details = self.separate_blog_details(response)
-                    merged = {**details, **grid}
-                    merged['created_at'] = datetime.now(ist)
-
-                    # Use save_article from BaseScraper
-                    if self.save_article(merged):
-                        self.logger.info(f"✅ Saved: {merged['url']}")
-
-                    time.sleep(1)
-                except Exception as e:
-                    self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
+        """Detail stage over every batch"""
+        # UNIQUE: grid_details is a list of lists, each batch already cut at the watermark
+        super().check_db_grid([grid for grid_items in self.grid_details for grid in grid_items], watermark=False)
 
     def run(self):
         """Main execution logic - UNIQUE: API-based scraping"""
@@ -57,7 +57,9 @@ class ComplianceWeek(BaseScraper):
     def get_grid_details(self, url):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(url)
+            done, response = self.get_listing(url)
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {url}")
                 return []
@@ -162,32 +164,6 @@ class ComplianceWeek(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(grid['url']):
-                    continue
-                    
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                # UNIQUE: Pass grid to separate_blog_details
-                details = self.separate_blog_details(response, grid)
-                merged = {**grid, **details}
-                merged['created_at'] = datetime.now(ist)
-
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic"""
         self.logger.info("🚀 Starting ComplianceWeek scraper")
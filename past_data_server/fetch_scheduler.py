@@ -0,0 +1,176 @@
+"""
+Global Fetch Scheduler for News Scraper System
+Every get_request attempt from every scraper thread is queued here and sent by
+a shared pool of fetch workers. Workers always pick the most urgent request
+whose host has rate-limit capacity right now, so requests interleave across
+domains instead of each scraper thread sleeping on its own site's limit
+"""
+
+import heapq
+import itertools
+import threading
+import time
+from concurrent.futures import Future
+from typing import Callable, Dict, List
+
+from scraper_common.rate_limiter import RateLimiter, domain_of
+
+# Lower value is served first
+PRIORITIES = {
+    "listing": 0,
+    "detail": 1,
+    "backfill_listing": 2,
+    "backfill_detail": 3,
+}
+
+
+class _Job:
+    __slots__ = ("name", "priority", "seq", "url", "fn", "future", "submitted_at", "wait")
+
+    def __init__(self, name: str, seq: int, url: str, fn: Callable):
+        self.name = name
+        self.priority = PRIORITIES[name]
+        self.seq = seq
+        self.url = url
+        self.fn = fn
+        self.future = Future()
+        self.submitted_at = time.monotonic()
+        self.wait = 0.0
+
+    def __lt__(self, other: "_Job") -> bool:
+        return (self.priority, self.seq) < (other.priority, other.seq)
+
+
+class FetchScheduler:
+    """Priority queue per domain, drained by a fixed pool of worker threads"""
+
+    def __init__(self, rate_limiter: RateLimiter, workers: int = 16, enabled: bool = True):
+        """
+        Initialize fetch scheduler
+
+        Args:
+            rate_limiter: Per-domain token buckets the workers respect
+            workers: Number of fetch worker threads (started on first use)
+            enabled: When False, run() just rate-limits and fetches on the calling thread
+        """
+        self.rate_limiter = rate_limiter
+        self.workers = workers
+        self.enabled = enabled
+        self._queues: Dict[str, List[_Job]] = {}
+        self._cond = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._seq = itertools.count()
+        self._local = threading.local()
+        self.peak_depth = 0
+        self.dispatched: Dict[str, int] = {name: 0 for name in PRIORITIES}
+        self.wait_seconds: Dict[str, float] = {name: 0.0 for name in PRIORITIES}
+        self.max_wait: Dict[str, float] = {name: 0.0 for name in PRIORITIES}
+
+    def configure(self, options: Dict):
+        """Apply the fetch_scheduler section of scraper_config.json"""
+        self.enabled = bool(options.get("enabled", self.enabled))
+        self.workers = int(options.get("workers", self.workers))
+
+    # -- priority context (per scraper thread) --
+
+    def set_backfill(self, backfill: bool):
+        """Mark this thread's requests as backfill (full mode), ranked below incremental ones"""
+        self._local.backfill = backfill
+
+    def priority_name(self, kind: str) -> str:
+        return f"backfill_{kind}" if getattr(self._local, "backfill", False) else kind
+
+    # -- submission --
+
+    def run(self, url: str, fn: Callable, kind: str = "detail"):
+        """
+        Queue fn (one HTTP attempt for url) and block until a worker has run it
+
+        Args:
+            url: Request URL, used for domain pacing
+            fn: Zero-argument callable doing the actual request
+            kind: "listing" or "detail"
+
+        Returns the callable's result, or re-raises its exception.
+        """
+        if not self.enabled:
+            self.rate_limiter.acquire(url)
+            return fn()
+
+        job = _Job(self.priority_name(kind), next(self._seq), url, fn)
+        with self._cond:
+            self._start_workers()
+            heapq.heappush(self._queues.setdefault(domain_of(url), []), job)
+            self.peak_depth = max(self.peak_depth, self._depth())
+            self._cond.notify()
+        return job.future.result()
+
+    def _depth(self) -> int:
+        return sum(len(queue) for queue in self._queues.values())
+
+    def _start_workers(self):
+        """Spawn missing worker threads (caller holds the lock)"""
+        self._threads = [thread for thread in self._threads if thread.is_alive()]
+        while len(self._threads) < self.workers:
+            thread = threading.Thread(target=self._worker, name=f"fetch-worker-{len(self._threads)}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    # -- workers --
+
+    def _next_job(self) -> _Job:
+        """Most urgent job on a domain with capacity; waits until one exists"""
+        with self._cond:
+            while True:
+                best_domain, soonest = None, None
+                for domain, queue in self._queues.items():
+                    ready_in = self.rate_limiter.bucket_for(queue[0].url).ready_in()
+                    if ready_in > 0:
+                        soonest = ready_in if soonest is None else min(soonest, ready_in)
+                    elif best_domain is None or queue[0] < self._queues[best_domain][0]:
+                        best_domain = domain
+
+                if best_domain is not None:
+                    queue = self._queues[best_domain]
+                    job = heapq.heappop(queue)
+                    if not queue:
+                        del self._queues[best_domain]
+                    # Take the token while still holding the lock so no other worker claims it
+                    job.wait = self.rate_limiter.bucket_for(job.url).reserve()
+                    return job
+
+                self._cond.wait(timeout=soonest)
+
+    def _worker(self):
+        while True:
+            job = self._next_job()
+            if job.wait > 0:
+                # Token taken by a caller outside the scheduler since we checked
+                time.sleep(job.wait)
+
+            waited = time.monotonic() - job.submitted_at
+            with self._cond:
+                self.dispatched[job.name] += 1
+                self.wait_seconds[job.name] += waited
+                self.max_wait[job.name] = max(self.max_wait[job.name], waited)
+
+            try:
+                job.future.set_result(job.fn())
+            except Exception as e:
+                job.future.set_exception(e)
+
+    def get_stats(self) -> Dict:
+        with self._cond:
+            return {
+                "enabled": self.enabled,
+                "workers": self.workers,
+                "queue_depth": self._depth(),
+                "peak_queue_depth": self.peak_depth,
+                "queued_by_domain": {domain: len(queue) for domain, queue in self._queues.items()},
+                "dispatched": dict(self.dispatched),
+                "avg_wait_seconds": {
+                    name: round(self.wait_seconds[name] / count, 3)
+                    for name, count in self.dispatched.items() if count
+                },
+                "max_wait_seconds": {name: round(wait, 3) for name, wait in self.max_wait.items() if wait},
+            }
@@ -48,6 +48,7 @@ def parse_relative_time(text: str) -> datetime | None:
     return datetime.strptime(text, "%B %d, %Y")
 
 class HTN_CO_UK(BaseScraper):
+    SHARDABLE = False  # No should_continue_scraping / page_index loop to split
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -60,7 +61,9 @@ class HTN_CO_UK(BaseScraper):
     def get_grid_details(self, url):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(url)
+            done, response = self.get_listing(url)
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {url}")
                 return []
@@ -145,32 +148,6 @@ class HTN_CO_UK(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(grid['url']):
-                    continue
-                
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                # UNIQUE: Pass grid to separate_blog_details
-                details = self.separate_blog_details(response, grid)
-                merged = {**grid, **details}
-                merged['created_at'] = datetime.now(ist)
-
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic - UNIQUE: Single static page"""
         self.logger.info("🚀 Starting HTN.co.uk scraper")
@@ -14,6 +14,8 @@ ist = pytz.timezone("Asia/Kolkata")
 URL = "https://www.intelligence360.news/page/"
 
 class Inteligence360(BaseScraper):
+    GRID_OVERRIDES_DETAILS = True
+    
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -24,7 +26,9 @@ class Inteligence360(BaseScraper):
     def get_grid_details(self):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(URL + str(self.page_index))
+            done, response = self.get_listing(URL + str(self.page_index))
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {URL}")
                 return []
@@ -58,10 +62,6 @@ class Inteligence360(BaseScraper):
                 if not article_url:
                     continue
                 
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(article_url):
-                    continue
-                
                 # time
                 time_tag = article.find('time')
                 date = parse_datetime_safe(time_tag.get('datetime', '') if time_tag else 'No date')
@@ -119,27 +119,6 @@ class Inteligence360(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                done, response = get_request(grid["url"])
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                details = self.separate_blog_details(response)
-                merged = {**details, **grid}
-                merged['created_at'] = datetime.now(ist)
-
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic"""
         self.logger.info("🚀 Starting Intelligence360 scraper")
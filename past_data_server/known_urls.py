@@ -0,0 +1,248 @@
+"""
+Known-URL Filter for News Scraper System
+A Bloom filter per Mongo collection holding every stored article URL. It is
+built once by streaming only the url field, updated on every save, persisted
+between runs (and caught up from newer _ids on load), so "is this URL new?"
+is answered in memory: a negative never touches Mongo, a positive is
+confirmed against the DB only when the filter's false-positive rate is too high
+
+A Bloom filter cannot forget a key, so deleted articles would stay "known" and
+never be scraped again. On load the filter is rebuilt from scratch when the
+collection holds fewer documents than at the last sync; deletions hidden by
+newer inserts need a reset: known_urls.rebuild in scraper_config.json, or
+removing <directory>/<db>.<collection>.bloom
+"""
+
+import hashlib
+import json
+import math
+import os
+import threading
+import time
+from typing import Dict, List, Optional, Set
+
+from bson import ObjectId
+
+
+class BloomFilter:
+    """Fixed-size bit array with k double-hashed probes per key"""
+
+    def __init__(self, capacity: int, fp_rate: float):
+        self.capacity = max(capacity, 1000)
+        self.fp_rate = fp_rate
+        self.num_bits = int(math.ceil(-self.capacity * math.log(fp_rate) / (math.log(2) ** 2)))
+        self.num_hashes = max(1, round(self.num_bits / self.capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+
+    def _positions(self, key: str):
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "little")
+        h2 = int.from_bytes(digest[8:], "little") | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+
+    def add(self, key: str):
+        for position in self._positions(key):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, key: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    def estimated_fp_rate(self) -> float:
+        """(1 - e^(-k n / m))^k for the number of keys added so far"""
+        return (1 - math.exp(-self.num_hashes * self.count / self.num_bits)) ** self.num_hashes
+
+
+class KnownUrls:
+    """Bloom filter of one collection's url field, with persistence and DB catch-up"""
+
+    def __init__(self, collection, path: str, fp_rate: float, max_unconfirmed_fp_rate: float):
+        self.collection = collection
+        self.path = path
+        self.fp_rate = fp_rate
+        self.max_unconfirmed_fp_rate = max_unconfirmed_fp_rate
+        self.bloom: Optional[BloomFilter] = None
+        self.last_id = None
+        self.documents: Optional[int] = None  # Collection size the filter last matched
+        self._lock = threading.Lock()
+        self._dirty = False
+        self.negatives = 0
+        self.confirmed = 0
+        self.false_positives = 0
+        self.load_seconds = 0.0
+
+    # -- build / load / save --
+
+    def load_or_build(self, rebuild: bool = False):
+        """Load the persisted filter and catch it up, or build it when there is none (or rebuild is set)"""
+        started = time.monotonic()
+        if rebuild or not self._load():
+            self._build()
+        else:
+            self._catch_up()
+        self.load_seconds = time.monotonic() - started
+
+    def _stream(self, query: Dict):
+        cursor = self.collection.find(query, {"url": 1}).sort("_id", 1)
+        for doc in cursor:
+            if doc.get("url"):
+                self.bloom.add(doc["url"])
+                self._dirty = True
+            if isinstance(doc.get("_id"), ObjectId):
+                self.last_id = doc["_id"]
+
+    def _build(self):
+        documents = self.collection.estimated_document_count()
+        # Twice the current size leaves room for this run's saves before a rebuild is due
+        self.bloom = BloomFilter(documents * 2, self.fp_rate)
+        self.last_id = None
+        self._stream({})
+        self.documents = documents
+
+    def _catch_up(self):
+        """Add documents written since the filter was saved (by any process)"""
+        documents = self.collection.estimated_document_count()
+        if self.last_id is None or self.bloom.count > self.bloom.capacity:
+            self._build()
+        elif self.documents is not None and documents < self.documents:
+            # Articles were deleted since the last sync; only a fresh filter forgets them
+            self._build()
+        else:
+            self._stream({"_id": {"$gt": self.last_id}})
+            self.documents = documents
+
+    def _load(self) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with open(self.path, "rb") as f:
+                header = json.loads(f.readline())
+                bits = bytearray(f.read())
+            bloom = BloomFilter(header["capacity"], header["fp_rate"])
+            if len(bits) != len(bloom.bits) or bloom.num_hashes != header["num_hashes"]:
+                return False
+            bloom.bits = bits
+            bloom.count = header["count"]
+            self.bloom = bloom
+            self.last_id = ObjectId(header["last_id"]) if header.get("last_id") else None
+            self.documents = header.get("documents")
+            return True
+        except (OSError, ValueError, KeyError):
+            return False
+
+    def save(self):
+        """Atomically write the filter to disk if it changed"""
+        with self._lock:
+            if not self._dirty or self.bloom is None:
+                return
+            header = {
+                "capacity": self.bloom.capacity,
+                "fp_rate": self.bloom.fp_rate,
+                "num_hashes": self.bloom.num_hashes,
+                "count": self.bloom.count,
+                "last_id": str(self.last_id) if self.last_id else None,
+                "documents": self.documents,
+            }
+            bits = bytes(self.bloom.bits)
+            self._dirty = False
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(json.dumps(header).encode("utf-8") + b"\n")
+            f.write(bits)
+        os.replace(tmp_path, self.path)
+
+    # -- lookups --
+
+    def add(self, url: str):
+        with self._lock:
+            if url not in self.bloom:
+                self.bloom.add(url)
+                self._dirty = True
+                if self.documents is not None:
+                    # A URL the filter had not seen is a new document, so a later drop still shows
+                    self.documents += 1
+
+    def existing(self, urls: List[str]) -> Set[str]:
+        """Stored URLs among urls; only filter hits reach Mongo, and only if confirmation is needed"""
+        with self._lock:
+            hits = [url for url in set(urls) if url in self.bloom]
+            self.negatives += len(set(urls)) - len(hits)
+            confirm = self.bloom.estimated_fp_rate() > self.max_unconfirmed_fp_rate
+        if not hits or not confirm:
+            return set(hits)
+        found = {doc["url"] for doc in self.collection.find({"url": {"$in": hits}}, {"url": 1, "_id": 0})}
+        with self._lock:
+            self.confirmed += len(hits)
+            self.false_positives += len(hits) - len(found)
+        return found
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "urls": self.bloom.count if self.bloom else 0,
+                "load_seconds": round(self.load_seconds, 2),
+                "size_kb": round(len(self.bloom.bits) / 1024) if self.bloom else 0,
+                "estimated_fp_rate": round(self.bloom.estimated_fp_rate(), 8) if self.bloom else 0.0,
+                "negatives_without_db": self.negatives,
+                "positives_confirmed": self.confirmed,
+                "false_positives": self.false_positives,
+            }
+
+
+class KnownUrlRegistry:
+    """One KnownUrls per collection, created on first use when enabled"""
+
+    def __init__(self, directory: str, enabled: bool = False, fp_rate: float = 1e-5,
+                 max_unconfirmed_fp_rate: float = 1e-4, rebuild: bool = False):
+        """
+        Initialize known-URL registry
+
+        Args:
+            directory: Where the per-collection filters are persisted
+            enabled: Off by default; existence checks then go straight to Mongo
+            fp_rate: Target false-positive rate the filters are sized for
+            max_unconfirmed_fp_rate: Above this estimated rate, filter hits are confirmed in Mongo
+            rebuild: Ignore the persisted filters and build them again from the DB (after deletions)
+        """
+        self.directory = directory
+        self.enabled = enabled
+        self.fp_rate = fp_rate
+        self.max_unconfirmed_fp_rate = max_unconfirmed_fp_rate
+        self.rebuild = rebuild
+        self._filters: Dict[str, KnownUrls] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, options: Dict):
+        """Apply the known_urls section of scraper_config.json"""
+        self.enabled = bool(options.get("enabled", self.enabled))
+        self.directory = options.get("directory", self.directory)
+        self.fp_rate = float(options.get("fp_rate", self.fp_rate))
+        self.max_unconfirmed_fp_rate = float(options.get("max_unconfirmed_fp_rate", self.max_unconfirmed_fp_rate))
+        self.rebuild = bool(options.get("rebuild", self.rebuild))
+
+    def for_collection(self, collection) -> Optional[KnownUrls]:
+        """The collection's filter, loading or building it on first use; None when disabled"""
+        if not self.enabled:
+            return None
+        with self._lock:
+            known = self._filters.get(collection.full_name)
+            if known is None:
+                path = os.path.join(self.directory, f"{collection.full_name}.bloom")
+                known = KnownUrls(collection, path, self.fp_rate, self.max_unconfirmed_fp_rate)
+                known.load_or_build(rebuild=self.rebuild)
+                self._filters[collection.full_name] = known
+            return known
+
+    def save(self):
+        with self._lock:
+            filters = list(self._filters.values())
+        for known in filters:
+            known.save()
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            filters = dict(self._filters)
+        return {name: known.get_stats() for name, known in filters.items()}
@@ -27,9 +27,11 @@ class NanoWerk(BaseScraper):
     def get_grid_details(self, url):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(f"{url + str(self.page_index)}/")
+            done, response = self.get_listing(f"{url + str(self.page_index)}/")
             self.logger.info(f"Fetching: {url + str(self.page_index)}/")
             
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {url}")
                 return []
@@ -161,30 +163,6 @@ class NanoWerk(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(grid['url']):
-                    continue
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                details = self.separate_blog_details(response)
-                merged = {**grid, **details}
-                merged['created_at'] = datetime.now(ist)
-
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic"""
         self.logger.info("🚀 Starting Nanowerk scraper")
@@ -20,6 +20,7 @@ API_URL = "https://www.phocuswire.com/Dyna.asmx/PageContentList"
 max_retries = 10
 
 class PhocusWire(BaseScraper):
+    
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -96,10 +97,6 @@ class PhocusWire(BaseScraper):
                 
                 url = f'{BASE_URL}{url}' if BASE_URL not in url else url
                 
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(url):
-                    continue
-                
                 extracted_data.append({
                     "image": image,
                     "url": url,
@@ -139,28 +136,6 @@ class PhocusWire(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                # UNIQUE: Pass grid to separate_blog_details
-                details = self.separate_blog_details(response, grid)
-                merged = {**grid, **details}
-                merged['created_at'] = datetime.now(ist)
-
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic - UNIQUE: POST API-based scraping"""
         self.logger.info("🚀 Starting PhocusWire scraper")
@@ -0,0 +1,219 @@
+"""
+Stage Pipeline for News Scraper System
+Runs a chain of stages (e.g. filter -> fetch -> parse -> save), each a group of
+worker threads reading from its own bounded queue. A stage that gets ahead
+blocks on the next stage's full queue (backpressure), so fetch-bound and
+CPU-bound stages overlap while at most the queue sizes' worth of items (and
+their responses) are held in memory. An ordered stage gets items back in the
+order they entered the pipeline, however the multi-worker stages before it finished
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from typing import Callable, Dict, Iterable, List, Optional
+
+# End-of-input marker, one per worker of the receiving stage
+_DONE = object()
+# Stands in for an item a stage dropped, so the ordered stage does not wait for it
+_SKIP = object()
+
+
+class Stage:
+    """One step of the pipeline: fn applied to every item by a group of workers"""
+
+    def __init__(self, name: str, fn: Callable, workers: int = 1, queue_size: int = 16, fan_out: bool = False,
+                 ordered: bool = False):
+        """
+        Initialize stage
+
+        Args:
+            name: Label used in logs, thread names and stats
+            fn: fn(item) -> output for the next stage, or None to drop the item
+            workers: Threads running fn concurrently
+            queue_size: Items that may wait for this stage before upstream blocks
+            fan_out: fn returns a list of outputs instead of one
+            ordered: Take items in the order they were emitted by the last fan_out stage
+                     before this one (or fed to run() if there is none); runs one worker
+        """
+        self.name = name
+        self.fn = fn
+        self.workers = 1 if ordered else max(int(workers), 1)
+        self.queue_size = max(int(queue_size), 1)
+        self.fan_out = fan_out
+        self.ordered = ordered
+        self._lock = threading.Lock()
+        self.items_in = 0
+        self.items_out = 0
+        self.errors = 0
+        self.busy_seconds = 0.0
+        self.blocked_seconds = 0.0  # Time spent waiting on the next stage's full queue
+        self.max_queue_depth = 0
+        self._depth_total = 0
+        self._depth_samples = 0
+
+    def record_depth(self, depth: int):
+        with self._lock:
+            self.max_queue_depth = max(self.max_queue_depth, depth)
+            self._depth_total += depth
+            self._depth_samples += 1
+
+    def get_stats(self, elapsed: float) -> Dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "items_in": self.items_in,
+                "items_out": self.items_out,
+                "errors": self.errors,
+                "throughput_per_sec": round(self.items_in / elapsed, 2) if elapsed > 0 else 0.0,
+                "busy_seconds": round(self.busy_seconds, 2),
+                "blocked_seconds": round(self.blocked_seconds, 2),
+                "max_queue_depth": self.max_queue_depth,
+                "avg_queue_depth": round(self._depth_total / self._depth_samples, 2) if self._depth_samples else 0.0,
+            }
+
+
+class Pipeline:
+    """Stages joined by bounded queues; run() streams a batch of items through all of them"""
+
+    def __init__(self, stages: List[Stage], worker_init: Optional[Callable] = None, logger=None):
+        """
+        Initialize pipeline
+
+        Args:
+            stages: Stages in order; the last stage's outputs are discarded
+            worker_init: Called once on every worker thread before it takes items
+                         (e.g. to bind thread-local fetch context)
+            logger: Where stage errors are reported (defaults to the logging module)
+        """
+        self.stages = stages
+        self.worker_init = worker_init
+        self.logger = logger or logging
+        self.runs = 0
+        self.elapsed = 0.0
+        # Items are numbered as they leave stage _sequence_from (-1: as run() feeds them)
+        # and travel as (seq, item) up to the ordered stage, which restores that order
+        ordered = [index for index, stage in enumerate(stages) if stage.ordered]
+        if len(ordered) > 1:
+            raise ValueError("A pipeline can have at most one ordered stage")
+        self._ordered: Optional[int] = ordered[0] if ordered else None
+        self._sequence_from: Optional[int] = None
+        if self._ordered is not None:
+            self._sequence_from = max((index for index in range(self._ordered) if stages[index].fan_out), default=-1)
+        self._sequence = itertools.count()
+        self._sequence_lock = threading.Lock()
+
+    def _put(self, index: int, queues: List[queue.Queue], item):
+        queues[index].put(item)
+        self.stages[index].record_depth(queues[index].qsize())
+
+    def _tag(self, item):
+        with self._sequence_lock:
+            return next(self._sequence), item
+
+    def _apply(self, stage: Stage, item) -> List:
+        """Run the stage on one item and return its outputs"""
+        started = time.monotonic()
+        try:
+            output = stage.fn(item)
+        except Exception as e:
+            output = None
+            with stage._lock:
+                stage.errors += 1
+            self.logger.error(f"❌ Pipeline stage {stage.name} failed: {e}")
+        outputs = (output or []) if stage.fan_out else ([] if output is None else [output])
+        with stage._lock:
+            stage.items_in += 1
+            stage.items_out += len(outputs)
+            stage.busy_seconds += time.monotonic() - started
+        return outputs
+
+    def _emit(self, index: int, queues: List[queue.Queue], outputs: List):
+        if index + 1 == len(self.stages):
+            return
+        stage = self.stages[index]
+        started = time.monotonic()
+        for out in outputs:
+            self._put(index + 1, queues, self._tag(out) if index == self._sequence_from else out)
+        with stage._lock:
+            stage.blocked_seconds += time.monotonic() - started
+
+    def _work(self, index: int, queues: List[queue.Queue], remaining: List[int], lock: threading.Lock):
+        stage = self.stages[index]
+        numbered = self._ordered is not None and self._sequence_from < index <= self._ordered
+        pending: Dict[int, object] = {}  # Ordered stage: items that arrived ahead of next_seq
+        next_seq = 0
+        if self.worker_init:
+            try:
+                self.worker_init()
+            except Exception as e:
+                self.logger.error(f"❌ Pipeline {stage.name} worker init failed: {e}")
+
+        while True:
+            item = queues[index].get()
+            if item is _DONE:
+                break
+            if not numbered:
+                self._emit(index, queues, self._apply(stage, item))
+                continue
+            seq, item = item
+            if not stage.ordered:
+                # Between the numbering and the ordered stage every stage is one-to-one,
+                # a dropped item still passes its number on
+                outputs = [] if item is _SKIP else self._apply(stage, item)
+                self._emit(index, queues, [(seq, outputs[0] if outputs else _SKIP)])
+                continue
+            pending[seq] = item
+            while next_seq in pending:
+                item = pending.pop(next_seq)
+                next_seq += 1
+                if item is not _SKIP:
+                    self._emit(index, queues, self._apply(stage, item))
+        for seq in sorted(pending):
+            if pending[seq] is not _SKIP:
+                self._emit(index, queues, self._apply(stage, pending[seq]))
+
+        # Last worker of this stage out tells every worker of the next stage to finish
+        with lock:
+            remaining[index] -= 1
+            closing = remaining[index] == 0
+        if closing and index + 1 < len(self.stages):
+            for _ in range(self.stages[index + 1].workers):
+                queues[index + 1].put(_DONE)
+
+    def run(self, items: Iterable):
+        """Feed items into the first stage and block until every stage has drained"""
+        queues = [queue.Queue(maxsize=stage.queue_size) for stage in self.stages]
+        remaining = [stage.workers for stage in self.stages]
+        lock = threading.Lock()
+        threads = [
+            threading.Thread(
+                target=self._work, args=(index, queues, remaining, lock),
+                name=f"{stage.name}-{worker}", daemon=True
+            )
+            for index, stage in enumerate(self.stages)
+            for worker in range(stage.workers)
+        ]
+        self._sequence = itertools.count()
+        started = time.monotonic()
+        for thread in threads:
+            thread.start()
+        try:
+            for item in items:
+                self._put(0, queues, self._tag(item) if self._sequence_from == -1 else item)
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+            for thread in threads:
+                thread.join()
+            self.elapsed += time.monotonic() - started
+            self.runs += 1
+
+    def get_stats(self) -> Dict:
+        return {
+            "runs": self.runs,
+            "seconds": round(self.elapsed, 2),
+            "stages": {stage.name: stage.get_stats(self.elapsed) for stage in self.stages},
+        }
@@ -0,0 +1,194 @@
+"""
+On-Disk Response Cache for News Scraper System
+Opt-in store of raw responses keyed by URL hash (zstd when available, gzip
+otherwise) with size-based LRU eviction. Lets BaseScraper.reparse_from_cache
+re-run a scraper's parse methods over stored HTML without touching the network
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Dict, Optional
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+
+class CachedResponse:
+    """requests.Response look-alike rebuilt from a cache entry"""
+
+    def __init__(self, url: str, status_code: int, headers: Dict, content: bytes, encoding: Optional[str]):
+        self.url = url
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.encoding = encoding or "utf-8"
+
+    @property
+    def text(self) -> str:
+        return self.content.decode(self.encoding, errors="replace")
+
+    def json(self):
+        return json.loads(self.text)
+
+
+class ResponseCache:
+    """Content-addressed response store with LRU eviction by total size"""
+
+    def __init__(self, cache_dir: str, max_size_mb: int = 2048, enabled: bool = False, compression: str = "auto"):
+        """
+        Initialize response cache
+
+        Args:
+            cache_dir: Directory the entries are written to
+            max_size_mb: Evict least recently used entries above this total size
+            enabled: Store responses fetched by get_request (off by default)
+            compression: "zstd", "gzip" or "auto" (zstd if installed)
+        """
+        self.cache_dir = cache_dir
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.enabled = enabled
+        self.compression = compression
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._size = None
+        self.writes = 0
+        self.replay_hits = 0
+        self.replay_misses = 0
+        self.evicted = 0
+
+    def configure(self, options: Dict):
+        """Apply the response_cache section of scraper_config.json"""
+        self.enabled = bool(options.get("enabled", self.enabled))
+        self.cache_dir = options.get("directory", self.cache_dir)
+        self.max_bytes = int(options.get("max_size_mb", self.max_bytes // (1024 * 1024))) * 1024 * 1024
+        self.compression = options.get("compression", self.compression)
+        self._size = None
+
+    # -- replay switch (per thread, so one scraper can reparse while others crawl) --
+
+    def set_replay(self, replaying: bool):
+        self._local.replaying = replaying
+
+    def is_replaying(self) -> bool:
+        return getattr(self._local, "replaying", False)
+
+    # -- storage --
+
+    def _codec(self) -> str:
+        if self.compression == "zstd" or (self.compression == "auto" and zstandard is not None):
+            return "zst"
+        return "gz"
+
+    def _path(self, url: str, ext: str) -> str:
+        digest = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return os.path.join(self.cache_dir, digest[:2], f"{digest}.{ext}")
+
+    def _current_size(self) -> int:
+        """Total bytes on disk (scanned once, then tracked incrementally; caller holds the lock)"""
+        if self._size is None:
+            self._size = 0
+            for root, _, files in os.walk(self.cache_dir):
+                for name in files:
+                    self._size += os.path.getsize(os.path.join(root, name))
+        return self._size
+
+    def put(self, url: str, response) -> bool:
+        """Store a response (anything with status_code, headers, content, encoding)"""
+        if not self.enabled or self.is_replaying():
+            return False
+
+        ext = self._codec()
+        header = {
+            "url": url,
+            "status_code": response.status_code,
+            "headers": {k: v for k, v in response.headers.items() if k.lower() in ("content-type", "etag", "last-modified")},
+            "encoding": response.encoding,
+            "fetched_at": time.time(),
+        }
+        payload = json.dumps(header).encode("utf-8") + b"\n" + response.content
+        data = zstandard.ZstdCompressor(level=6).compress(payload) if ext == "zst" else gzip.compress(payload, 6)
+
+        path = self._path(url, ext)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+
+        with self._lock:
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            os.replace(tmp_path, path)
+            self._size = self._current_size() - previous + len(data)
+            self.writes += 1
+            if self._size > self.max_bytes:
+                self._evict()
+        return True
+
+    def _evict(self):
+        """Drop least recently used entries down to 90% of the limit (caller holds the lock)"""
+        entries = []
+        for root, _, files in os.walk(self.cache_dir):
+            for name in files:
+                if name.endswith((".zst", ".gz")):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        target = int(self.max_bytes * 0.9)
+        for _, size, path in entries:
+            if self._size <= target:
+                break
+            try:
+                os.remove(path)
+                self._size -= size
+                self.evicted += 1
+            except OSError:
+                continue
+
+    def get(self, url: str) -> Optional[CachedResponse]:
+        """Cached response for the URL, or None; a hit refreshes its LRU position"""
+        for ext in ("zst", "gz"):
+            path = self._path(url, ext)
+            if not os.path.exists(path):
+                continue
+            with open(path, "rb") as f:
+                data = f.read()
+            if ext == "zst":
+                if zstandard is None:
+                    continue
+                payload = zstandard.ZstdDecompressor().decompress(data)
+            else:
+                payload = gzip.decompress(data)
+            os.utime(path)
+
+            header, _, body = payload.partition(b"\n")
+            meta = json.loads(header)
+            return CachedResponse(meta["url"], meta["status_code"], meta["headers"], body, meta["encoding"])
+        return None
+
+    def replay(self, url: str) -> Optional[CachedResponse]:
+        """get() that also counts replay hits and misses"""
+        cached = self.get(url)
+        with self._lock:
+            if cached is None:
+                self.replay_misses += 1
+            else:
+                self.replay_hits += 1
+        return cached
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "size_mb": round((self._size or 0) / (1024 * 1024), 1),
+                "writes": self.writes,
+                "evicted": self.evicted,
+                "replay_hits": self.replay_hits,
+                "replay_misses": self.replay_misses,
+            }
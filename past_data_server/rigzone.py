@@ -23,6 +23,7 @@ URLS_list = [
 BASE_URL = "https://www.rigzone.com/news"
 
 class RigZone(BaseScraper):
+    SHARDABLE = False  # One page per category URL
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -33,9 +34,11 @@ class RigZone(BaseScraper):
     def get_grid_details(self, url):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(f"{url}")
+            done, response = self.get_listing(f"{url}")
             self.logger.info(f"Fetching: {url}")
             
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {url}")
                 return []
@@ -139,31 +142,6 @@ class RigZone(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(grid['url']):
-                    continue
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                # UNIQUE: Pass grid to separate_blog_details
-                details = self.separate_blog_details(response, grid)
-                merged = {**grid, **details}
-                merged['created_at'] = datetime.now(ist)
-
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic - UNIQUE: Multiple category URLs"""
         self.logger.info("🚀 Starting RigZone scraper")
@@ -13,7 +13,7 @@ import pytz
 
 ist = pytz.timezone("Asia/Kolkata")
 
-from settings import get_request, SACRA_client as news_details_client, get_proxy, random_sleep, get_headers, parse_datetime_safe
+from settings import get_request, SACRA_client as news_details_client, get_proxy, random_sleep, get_headers, parse_datetime_safe, rate_limiter
 from base_scraper import BaseScraper
 from logger import CustomLogger
 
@@ -25,6 +25,7 @@ URLS_LIST = [
 ]
 
 class Sacra(BaseScraper):
+    SHARDABLE = False  # No should_continue_scraping / page_index loop to split
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -174,7 +175,7 @@ class Sacra(BaseScraper):
             return False
             
         for _ in range(5):
-            random_sleep()
+            rate_limiter.acquire(grid['url'])
             res = requests.get(grid['url'], headers=get_headers(), proxies=get_proxy(), timeout=15, verify=False)
             if res.status_code == 200:
                 break
@@ -213,11 +214,8 @@ class Sacra(BaseScraper):
                     merged['created_at'] = datetime.now(ist)
                     data_list.append(merged)
                     
-                    # Use save_article from BaseScraper
-                    if self.save_article(merged):
-                        self.logger.info(f"✅ Saved: {merged['url']}")
-
-                    time.sleep(1)
+                    # Use save_article from BaseScraper (logged once the write buffer is flushed)
+                    self.save_article(merged)
                     break
 
                 except Exception as e:
@@ -1,10 +1,31 @@
+import atexit
 import os
 import random
+import sys
 import time
 import requests
 import urllib3, urllib, json
+from urllib.parse import urlencode
 from pymongo import MongoClient
+
+# Fetch components shared with news_scrapper / link_scrapper (scraper_common/ at the repo root)
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if REPO_ROOT not in sys.path:
+    sys.path.append(REPO_ROOT)
+
 from logger import CustomLogger
+from scraper_common.session_pool import SessionPool
+from scraper_common.rate_limiter import RateLimiter
+from scraper_common.proxy_manager import ProxyManager
+from scraper_common.circuit_breaker import CircuitBreakerRegistry
+from validator_cache import ValidatorCache
+from response_cache import ResponseCache
+from scraper_common.single_flight import SingleFlight, normalize_url
+from scraper_common.adaptive_timeout import AdaptiveTimeouts
+from fetch_scheduler import FetchScheduler
+from scraper_common.retry_policy import RetryPolicy
+from known_urls import KnownUrlRegistry
+from checkpoint import CheckpointStore
 from dateutil import parser
 import pytz
 
@@ -89,9 +110,26 @@ USER_AGENTS = [
     "Mozilla/5.0 (X11; Ubuntu; Linux x86_64; rv:116.0) Gecko/20100101 Firefox/116.0",
 ]
 
-def get_proxy():
-    prx = random.choice(PROXIES)
-    return {"http": f"http://{prx}", "https": f"http://{prx}"}
+session_pool = SessionPool()
+rate_limiter = RateLimiter()
+proxy_manager = ProxyManager(PROXIES)
+circuit_breakers = CircuitBreakerRegistry()
+validator_cache = ValidatorCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), "validator_cache.json"))
+atexit.register(validator_cache.save)
+response_cache = ResponseCache(os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "responses"))
+single_flight = SingleFlight()
+adaptive_timeouts = AdaptiveTimeouts()
+fetch_scheduler = FetchScheduler(rate_limiter)
+retry_policy = RetryPolicy()
+known_urls = KnownUrlRegistry(os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "known_urls"))
+atexit.register(known_urls.save)
+checkpoints = CheckpointStore(os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "checkpoints"))
+
+# Statuses that mean the host is refusing or failing us (for the circuit breaker)
+HOST_FAILURE_STATUSES = {403, 429}
+
+def get_proxy(url=None):
+    return proxy_manager.get_proxy(url)
 
 def get_headers():
     return {
@@ -106,34 +144,105 @@ def random_sleep(start = 5, end = 10):
     print(f'Time sleep for :', time_sleep, end=" ")
     time.sleep(time_sleep)
 
-def get_request(url, max_retries=20, timeout=10, params = {}, headers = {}):
-    """Perform GET request with retries, proxies, and UA rotation."""
+def get_request(url, max_retries=20, timeout=None, params = {}, headers = {}, conditional=False, kind="detail"):
+    """Perform GET request with retries, proxies, and UA rotation.
+
+    timeout=None uses the host's adaptive timeout (rolling latency percentile).
+    kind ("listing" / "detail") sets the request's priority in the global fetch scheduler.
+
+    conditional=True revalidates with the ETag / Last-Modified stored for the URL;
+    an unchanged page then returns (True, response) with status_code 304 and no body.
+    A 200's validators are only used once the caller commits them (validator_cache.commit).
+    """
+    cache_key = f"{url}?{urlencode(sorted(params.items()))}" if params else url
+    if response_cache.is_replaying():
+        # Reparse mode: serve only from the on-disk cache, never the network
+        cached = response_cache.replay(cache_key)
+        return (True, cached) if cached else (False, None)
+
+    # Identical concurrent requests (same normalized URL, same custom headers) share one fetch
+    flight_key = normalize_url(url, params)
+    if conditional:
+        flight_key += "|conditional"
+    if headers:
+        flight_key += "|" + json.dumps(headers, sort_keys=True)
+    return single_flight.do(
+        flight_key,
+        lambda: _fetch(url, max_retries, timeout, params, headers, conditional, cache_key, kind),
+        is_success=lambda result: result[0],
+    )
+
+def _fetch(url, max_retries, timeout, params, headers, conditional, cache_key, kind):
+    """The retrying network fetch behind get_request."""
     if not headers:
         headers = get_headers()
+    if conditional:
+        headers = {**headers, **validator_cache.conditional_headers(cache_key)}
+    retry_policy.record_request()
+    retry_after = None
     for attempt in range(max_retries):
-        try:
-            res = requests.get(
+        if attempt:
+            if not retry_policy.allow_retry():
+                logger.warning(f"🪣 Retry budget exhausted, giving up on {url}")
+                return False, None
+            time.sleep(retry_policy.delay(attempt - 1, retry_after))
+            retry_after = None
+        if not circuit_breakers.allow(url):
+            logger.warning(f"🔌 Circuit open, failing fast: {url}")
+            return False, None
+        proxy = proxy_manager.choose(url)
+        attempt_timeout = timeout or adaptive_timeouts.timeout_for(url)
+        sent = {"at": time.monotonic()}
+
+        def send():
+            # Runs on a scheduler worker once the host has rate-limit capacity
+            sent["at"] = time.monotonic()
+            return session_pool.get(
                 url,
                 headers=headers,
-                proxies=get_proxy(),
-                timeout=timeout,
+                proxies=proxy_manager.as_requests_proxies(proxy),
+                timeout=attempt_timeout,
                 verify=False,
                 params=params
             )
 
+        try:
+            res = fetch_scheduler.run(url, send, kind)
+            adaptive_timeouts.record(url, time.monotonic() - sent["at"])
+            proxy_manager.report(proxy, url, time.monotonic() - sent["at"], res.status_code)
+            circuit_breakers.record(url, res.status_code not in HOST_FAILURE_STATUSES and res.status_code < 500)
+
+            if conditional and res.status_code == 304:
+                validator_cache.record_hit()
+                logger.info(f"♻️ Not modified: {url} [304]")
+                return True, res
+
             if res.status_code == 200:
+                if conditional:
+                    validator_cache.store(cache_key, res.headers)
+                response_cache.put(cache_key, res)
                 logger.info(f"✅ Success: {url} [{res.status_code}]")
                 return True, res
 
+            if retry_policy.is_permanent(res.status_code):
+                logger.warning(f"🚫 Permanent failure, not retrying: {url} [{res.status_code}]")
+                return False, None
+
+            retry_after = retry_policy.retry_after(res.status_code, res.headers)
             logger.warning(f"⚠️ Failed: {url} [{res.status_code}]")
 
-        except requests.Timeout:
-            logger.warning(f"⏳ Timeout on {url}, retry {attempt+1}/{max_retries}")
+        except requests.Timeout as e:
+            if proxy is None and isinstance(e, requests.ReadTimeout):
+                # Proxied and connect timeouts are the proxy's or the network's, not the host's latency
+                adaptive_timeouts.record_timeout(url)
+            proxy_manager.report(proxy, url, time.monotonic() - sent["at"])
+            circuit_breakers.record(url, False)
+            logger.warning(f"⏳ Timeout ({attempt_timeout}s) on {url}, retry {attempt+1}/{max_retries}")
         except Exception as e:
+            proxy_manager.report(proxy, url, time.monotonic() - sent["at"])
+            circuit_breakers.record(url, False)
             logger.warning(f"❌ Error fetching {url}: {e}")
 
-        time.sleep(1)
-
     logger.error(f"❌ All retries failed for {url}")
     return False, None
 
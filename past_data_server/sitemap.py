@@ -0,0 +1,91 @@
+"""
+Sitemap Reader for News Scraper System
+Streams sitemap indexes, urlsets and Google News sitemaps (plain or .xml.gz)
+through a lazy iterparse: entries are yielded as each <sitemap> / <url>
+element closes and then cleared, so a 50k-URL sitemap is never held as a
+tree and gzip is decompressed as the parser reads
+"""
+
+import gzip
+import io
+import xml.etree.ElementTree as ET
+from datetime import datetime, timezone
+from typing import Dict, Iterator, Optional
+
+GZIP_MAGIC = b"\x1f\x8b"
+
+
+def _local(tag: str) -> str:
+    """Tag name without its namespace ({http://www.sitemaps.org/...}loc -> loc)"""
+    return tag.rsplit("}", 1)[-1]
+
+
+def parse_w3c_datetime(value: Optional[str]) -> Optional[datetime]:
+    """
+    lastmod / publication_date as an aware UTC datetime (date-only values are midnight UTC);
+    None when missing or unreadable
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc)
+
+
+def iter_sitemap(content: bytes) -> Iterator[Dict]:
+    """
+    Entries of one sitemap document, in document order:
+    {"kind": "sitemap", "loc", "lastmod"} for index entries,
+    {"kind": "url", "loc", "lastmod", "published", "title", "image"} for articles
+    (published / title from <news:news>, image from <image:image>, None when absent)
+
+    Raises ET.ParseError for a document that is not XML.
+    """
+    stream = io.BytesIO(content)
+    if content[:2] == GZIP_MAGIC:
+        stream = gzip.GzipFile(fileobj=stream)
+
+    root = None
+    for event, element in ET.iterparse(stream, events=("start", "end")):
+        if event == "start":
+            if root is None:
+                root = element
+            continue
+        kind = _local(element.tag)
+        if kind not in ("sitemap", "url"):
+            continue
+
+        loc = lastmod = published = title = image = None
+        for child in element:
+            name = _local(child.tag)
+            text = (child.text or "").strip()
+            if name == "loc":
+                loc = text
+            elif name == "lastmod":
+                lastmod = text
+            elif name == "news":
+                for field in child.iter():
+                    if _local(field.tag) == "publication_date":
+                        published = (field.text or "").strip()
+                    elif _local(field.tag) == "title":
+                        title = (field.text or "").strip()
+            elif name == "image" and image is None:
+                image = next(((field.text or "").strip() for field in child if _local(field.tag) == "loc"), None)
+
+        if loc:
+            entry = {"kind": kind, "loc": loc, "lastmod": parse_w3c_datetime(lastmod)}
+            if kind == "url":
+                entry["published"] = parse_w3c_datetime(published)
+                entry["title"] = title or None
+                entry["image"] = image or None
+            yield entry
+
+        # Drop the finished entry so memory stays flat however long the file is
+        element.clear()
+        if root is not None:
+            root.clear()
@@ -0,0 +1,321 @@
+"""
+Spec-driven Scraper for News Scraper System
+One paginate -> grid-parse -> detail-parse -> save implementation for every site
+described in scraper_specs.json. A spec holds the listing URLs, the page URL
+template, the grid item / detail field selectors and how each value is cleaned;
+selectors are compiled once per process with soupsieve, so adding a site is a
+JSON entry and every improvement to this loop reaches all of them
+"""
+
+import copy
+import json
+import re
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytz
+import soupsieve
+from bs4 import BeautifulSoup
+
+import settings
+from base_scraper import BaseScraper
+from settings import parse_datetime_safe
+
+SPEC_FILE = Path(__file__).parent / "scraper_specs.json"
+
+# Extract value for a field whose element is not on the page (distinct from None / "")
+MISSING = object()
+
+# "#text" in an attr list falls back to the element's text
+TEXT = "#text"
+
+FIELD_OPTIONS = {
+    "select", "within", "scope", "index", "all", "join", "skip_empty", "dedupe", "attr",
+    "separator", "strip", "replace", "trim", "regex", "absolute", "parse", "date_format", "required", "default",
+}
+SITE_OPTIONS = {
+    "name", "collection_client", "log_folder", "listing_urls", "page_url", "first_page", "parser",
+    "skip_existing_before_fetch", "grid_overrides_details", "grid", "detail",
+    "sitemap_urls", "sitemap_url_pattern",
+}
+
+
+def _as_list(value) -> List:
+    if value is None:
+        return []
+    return value if isinstance(value, list) else [value]
+
+
+def _set_path(doc: Dict, path: List[str], value):
+    for key in path[:-1]:
+        doc = doc.setdefault(key, {})
+    doc[path[-1]] = value
+
+
+def _merge_defaults(doc: Dict, defaults: Dict):
+    """Fill keys the document does not have yet, recursing into nested dicts"""
+    for key, value in defaults.items():
+        if isinstance(value, dict) and isinstance(doc.get(key), dict):
+            _merge_defaults(doc[key], value)
+        elif key not in doc:
+            doc[key] = copy.deepcopy(value)
+
+
+class FieldSpec:
+    """One extracted value: which element, which attribute or text, and how it is cleaned"""
+
+    def __init__(self, name: str, options: Dict):
+        unknown = set(options) - FIELD_OPTIONS
+        if unknown:
+            raise ValueError(f"field {name!r}: unknown options {sorted(unknown)}")
+        self.name = name
+        self.path = name.split(".")
+        # A list of selectors is tried in order, the first one that matches wins
+        self.selectors = [soupsieve.compile(selector) for selector in _as_list(options.get("select"))]
+        self.within = soupsieve.compile(options["within"]) if options.get("within") else None
+        self.page_scope = options.get("scope") == "page"
+        self.index = options.get("index")
+        self.all = bool(options.get("all"))
+        if self.all and len(self.selectors) > 1:
+            raise ValueError(f"field {name!r}: 'all' takes one selector (use a selector group, e.g. \"p, h2\")")
+        self.join = options.get("join", " \n")
+        self.skip_empty = bool(options.get("skip_empty"))
+        self.dedupe = bool(options.get("dedupe"))
+        self.attrs = _as_list(options.get("attr"))
+        self.separator = options.get("separator", "")
+        self.strip = options.get("strip", True)
+        self.replace = options.get("replace", [])
+        self.trim = bool(options.get("trim"))
+        self.regex = re.compile(options["regex"]) if options.get("regex") else None
+        self.absolute = options.get("absolute")
+        self.parse = options.get("parse")
+        self.date_format = options.get("date_format")
+        self.required = bool(options.get("required"))
+        self.has_default = "default" in options
+        self.default = options.get("default")
+
+    def _text(self, element) -> str:
+        return element.get_text(self.separator, strip=self.strip)
+
+    def _select_one(self, root):
+        if not self.selectors:
+            return root
+        for selector in self.selectors:
+            if self.index is None:
+                element = selector.select_one(root)
+            else:
+                matches = selector.select(root)
+                element = matches[self.index] if -len(matches) <= self.index < len(matches) else None
+            if element is not None:
+                return element
+        return None
+
+    def _value(self, element):
+        value = None
+        for attr in self.attrs or [TEXT]:
+            value = self._text(element) if attr == TEXT else element.get(attr)
+            if value:
+                break
+        if isinstance(value, str):
+            if self.replace:
+                for old, new in self.replace:
+                    value = value.replace(old, new)
+                if self.trim:
+                    value = value.strip()
+            if self.regex:
+                match = self.regex.search(value)
+                value = match.group(1) if match else None
+        if isinstance(value, str) and value and self.absolute and self.absolute not in value:
+            value = f"{self.absolute}{value}"
+        return value
+
+    def _parsed(self, value):
+        if self.parse != "datetime":
+            return value
+        if self.date_format and isinstance(value, str):
+            try:
+                return pytz.UTC.localize(datetime.strptime(value, self.date_format))
+            except ValueError:
+                pass
+        return parse_datetime_safe(value)
+
+    def extract(self, node, page):
+        """Value of this field for a grid item (node) or detail page (node is page)"""
+        root = page if self.page_scope else node
+        if self.within:
+            root = self.within.select_one(root)
+            if root is None:
+                return self.default if self.has_default else MISSING
+
+        if self.all:
+            elements = self.selectors[0].select(root) if self.selectors else [root]
+            texts = [self._text(element) for element in elements]
+            if self.skip_empty:
+                texts = [text for text in texts if text]
+            if self.dedupe:
+                texts = list(dict.fromkeys(texts))
+            return self.join.join(texts)
+
+        element = self._select_one(root)
+        if element is None:
+            return self.default if self.has_default else MISSING
+        value = self._value(element)
+        if value is None and self.has_default:
+            value = self.default
+        return self._parsed(value)
+
+
+class SiteSpec:
+    """A compiled scraper_specs.json entry"""
+
+    def __init__(self, key: str, options: Dict):
+        unknown = set(options) - SITE_OPTIONS
+        if unknown:
+            raise ValueError(f"spec {key!r}: unknown options {sorted(unknown)}")
+        self.key = key
+        self.name = options.get("name", key)
+        self.collection_client = options["collection_client"]
+        self.log_folder = options.get("log_folder", f"log/{key}")
+        self.listing_urls = options["listing_urls"]
+        self.page_url = options.get("page_url", "{url}{page}")
+        self.first_page = int(options.get("first_page", 1))
+        self.parser = options.get("parser", "html.parser")
+        self.skip_existing_before_fetch = bool(options.get("skip_existing_before_fetch", True))
+        self.grid_overrides_details = bool(options.get("grid_overrides_details", False))
+        self.sitemap_urls = _as_list(options.get("sitemap_urls"))
+        self.sitemap_url_pattern = options.get("sitemap_url_pattern", "")
+
+        grid = options["grid"]
+        self.items = soupsieve.compile(grid["items"])
+        self.items_within = soupsieve.compile(grid["within"]) if grid.get("within") else None
+        self.grid_defaults = grid.get("defaults", {})
+        self.grid_fields = self._fields(key, grid.get("fields", {}))
+
+        detail = options.get("detail", {})
+        self.detail_defaults = detail.get("defaults", {})
+        self.detail_fields = self._fields(key, detail.get("fields", {}))
+
+    @staticmethod
+    def _fields(key: str, fields: Dict) -> List[FieldSpec]:
+        try:
+            return [FieldSpec(name, field) for name, field in fields.items()]
+        except (ValueError, soupsieve.SelectorSyntaxError) as e:
+            raise ValueError(f"spec {key!r}: {e}") from e
+
+
+_specs: Dict[str, SiteSpec] = {}
+_specs_lock = threading.Lock()
+
+
+def load_spec(key: str, path: Path = SPEC_FILE) -> SiteSpec:
+    """Compiled spec for key; the file is read and every selector compiled once per process"""
+    with _specs_lock:
+        if not _specs:
+            with open(path, "r", encoding="utf-8") as f:
+                sites = json.load(f)["sites"]
+            _specs.update({name: SiteSpec(name, options) for name, options in sites.items()})
+        if key not in _specs:
+            raise KeyError(f"No scraper spec named {key!r} in {path}")
+        return _specs[key]
+
+
+class SpecScraper(BaseScraper):
+    """BaseScraper driven by a scraper_specs.json entry; subclasses only set SPEC"""
+
+    SPEC = ""
+
+    def __init__(self):
+        self.spec = load_spec(self.SPEC)
+        super().__init__(
+            db_client=getattr(settings, self.spec.collection_client),
+            log_folder=self.spec.log_folder
+        )
+        self.SKIP_EXISTING_BEFORE_FETCH = self.spec.skip_existing_before_fetch
+        self.GRID_OVERRIDES_DETAILS = self.spec.grid_overrides_details
+        # Same listing description drives the async backend (run_async)
+        self.LISTING_URLS = self.spec.listing_urls
+        self.PAGE_URL_TEMPLATE = self.spec.page_url
+        self.FIRST_PAGE = self.spec.first_page
+        # Used instead of the listings when sitemap_discovery lists this scraper
+        self.SITEMAP_URLS = self.spec.sitemap_urls
+        self.SITEMAP_URL_PATTERN = self.spec.sitemap_url_pattern
+        self.grid_details = []
+
+    def get_grid_details(self, url):
+        """Scrape the grid (listing) page."""
+        return self.get_listing_grid(url)
+
+    def parse_grid_item(self, node, page) -> Optional[Dict]:
+        item = copy.deepcopy(self.spec.grid_defaults)
+        for field in self.spec.grid_fields:
+            value = field.extract(node, page)
+            if field.required and (value is MISSING or not value):
+                return None
+            if value is not MISSING:
+                _set_path(item, field.path, value)
+        return item
+
+    def scrape_grid_data(self, html_content):
+        """Extract grid items with the spec's item and field selectors"""
+        data = BeautifulSoup(html_content, self.spec.parser)
+        root = self.spec.items_within.select_one(data) if self.spec.items_within else data
+        if root is None:
+            return []
+
+        extracted_data = []
+        for node in self.spec.items.select(root):
+            try:
+                item = self.parse_grid_item(node, data)
+                if item:
+                    extracted_data.append(item)
+            except Exception as e:
+                self.logger.error(f"Error extracting data from article: {e}")
+        return extracted_data
+
+    def separate_blog_details(self, response, grid):
+        """Apply the spec's detail fields on top of the grid item"""
+        details = copy.deepcopy(grid)
+        _merge_defaults(details, self.spec.detail_defaults)
+        try:
+            data = BeautifulSoup(response.text, self.spec.parser)
+            for field in self.spec.detail_fields:
+                value = field.extract(data, data)
+                if value is not MISSING:
+                    _set_path(details, field.path, value)
+        except Exception as e:
+            self.logger.error(f"Error parsing blog details: {e}")
+
+        return details
+
+    def run(self):
+        """Main execution logic"""
+        self.logger.info(f"🚀 Starting {self.spec.name} scraper")
+        self.previous_grid = []
+        for url in self.spec.listing_urls:
+            self.logger.info(f"📂 Processing: {url}")
+            self.page_index = self.FIRST_PAGE
+            self.consecutive_skips = 0
+
+            while self.should_continue_scraping():
+                self.logger.info(f"📄 Processing page {self.page_index}")
+
+                self.grid_details = []
+                self.get_grid_details(url)
+
+                if self.should_break_loop(self.page_index, self.previous_grid, self.grid_details):
+                    self.logger.warning("Breaking loop - reached end or duplicate pages")
+                    break
+
+                if self.grid_details:
+                    self.previous_grid = self.grid_details
+                    self.check_db_grid()
+                else:
+                    self.logger.warning(f"No articles found on page {self.page_index}")
+
+                self.page_index = self.get_new_page_index(self.page_index, self.grid_details)
+
+        # Log final statistics
+        self.log_stats()
+        self.logger.info(f"✅ {self.spec.name} scraper completed")
@@ -33,7 +33,8 @@ class StatsTracker:
             "total_articles_scraped": 0,
             "total_articles_skipped": 0,
             "total_errors": 0,
-            "scrapers": {}
+            "scrapers": {},
+            "network": {}
         }
         
     def start_run(self, mode: str = "full", total_scrapers: int = 0):
@@ -56,7 +57,8 @@ class StatsTracker:
             "total_articles_scraped": 0,
             "total_articles_skipped": 0,
             "total_errors": 0,
-            "scrapers": {}
+            "scrapers": {},
+            "network": {}
         }
         
     def add_scraper_stats(self, scraper_name: str, stats: Dict[str, Any]):
@@ -76,6 +78,9 @@ class StatsTracker:
                 - collection: Collection name
                 - before_count: Article count before scraping
                 - after_count: Article count after scraping
+                - circuit_open_hosts: Hosts whose circuit breaker stopped the scraper
+                - retry_budget: Requests, retries spent and retries denied by the run's budget
+                - pipeline: Per detail stage items in/out, throughput, busy/blocked seconds and queue depth
         """
         self.current_run["scrapers"][scraper_name] = stats
         
@@ -89,6 +94,16 @@ class StatsTracker:
         self.current_run["total_articles_skipped"] += stats.get("articles_skipped", 0)
         self.current_run["total_errors"] += stats.get("errors", 0)
         
+    def add_network_stats(self, component: str, stats: Dict[str, Any]):
+        """
+        Add statistics for a shared network component (session pool, proxies, ...)
+        
+        Args:
+            component: Name of the component, e.g. "http_pool"
+            stats: Dictionary returned by the component's get_stats()
+        """
+        self.current_run["network"][component] = stats
+        
     def end_run(self):
         """Mark the current run as complete and save to file"""
         self.current_run["end_time"] = datetime.now().isoformat()
@@ -13,6 +13,11 @@ ist = pytz.timezone("Asia/Kolkata")
 URL = "https://techcrunch.com/latest/page/"
 
 class TechCrunch(BaseScraper):
+    GRID_OVERRIDES_DETAILS = True
+    # Incremental runs with sitemap_discovery enabled read these instead of /latest/page/N
+    SITEMAP_URLS = ["https://techcrunch.com/sitemap.xml"]
+    SITEMAP_URL_PATTERN = r"^https://techcrunch\.com/\d{4}/\d{2}/\d{2}/"
+    
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -23,7 +28,9 @@ class TechCrunch(BaseScraper):
     def get_grid_details(self):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(URL + str(self.page_index))
+            done, response = self.get_listing(URL + str(self.page_index))
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {URL}")
                 return []
@@ -59,10 +66,6 @@ class TechCrunch(BaseScraper):
                 if title == 'No title':
                     continue
 
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(article_url):
-                    continue
-
                 # Extract date
                 date_span = article.find('time')
                 date = date_span.get('datetime', '') if date_span else 'No date'
@@ -125,38 +128,18 @@ class TechCrunch(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
+    def parse_article(self, grid, response):
+        merged = super().parse_article(grid, response)
+        
+        # Convert time if it's a string
+        if merged and isinstance(merged["time"], str) and merged["time"]:
             try:
-                # Skip if already exists (handled by check_article_exists in scrape_grid_data)
-                
-                done, response = get_request(grid["url"])
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                details = self.separate_blog_details(response)
-                merged = {**details, **grid}
-                
-                # Convert time if it's a string
-                if isinstance(merged["time"], str) and merged["time"]:
-                    try:
-                        merged["time"] = datetime.strptime(
-                            merged["time"], "%B %d, %Y"
-                        )
-                    except Exception:
-                        merged["time"] = datetime.utcnow()
-                
-                merged['created_at'] = datetime.now(ist)
-
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1) 
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
+                merged["time"] = datetime.strptime(
+                    merged["time"], "%B %d, %Y"
+                )
+            except Exception:
+                merged["time"] = datetime.utcnow()
+        return merged
 
     def run(self):
         """Main execution logic"""
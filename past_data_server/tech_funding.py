@@ -2,7 +2,7 @@ import time
 import json, random
 from datetime import datetime, timedelta
 from bs4 import BeautifulSoup
-from settings import get_request, news_details_client
+from settings import get_request, news_details_client, rate_limiter
 from base_scraper import BaseScraper
 from logger import CustomLogger
 import requests
@@ -69,6 +69,7 @@ def get_proxy():
     return {"http": f"http://{prx}", "https": f"http://{prx}"}
 
 class TechFundingNews(BaseScraper):
+    SHARDABLE = False  # No should_continue_scraping / page_index loop to split
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -118,6 +119,7 @@ class TechFundingNews(BaseScraper):
         }
 
         for attempt in range(max_retries):
+            rate_limiter.acquire(AJAX_URL)
             try:
                 r = requests.post(AJAX_URL, headers=HEADERS, data=payload, timeout=timeout, proxies=get_proxy())
                 r.raise_for_status()
@@ -191,11 +193,8 @@ class TechFundingNews(BaseScraper):
                 merged = {**grid, **details}
                 merged['created_at'] = datetime.now(ist)
 
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {grid['url']}")
-
-                time.sleep(1)
+                # Use save_article from BaseScraper (logged once the write buffer is flushed)
+                self.save_article(merged)
             except Exception as e:
                 self.logger.error(f"Error saving article {grid['url']}: {e}")
 
@@ -223,7 +222,6 @@ class TechFundingNews(BaseScraper):
                         break
 
                 page += 1
-                time.sleep(1)
 
         self.save_to_db()
         
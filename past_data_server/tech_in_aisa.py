@@ -10,7 +10,7 @@ from selenium.webdriver.support import expected_conditions as EC
 import undetected_chromedriver as uc
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
 
-from settings import get_request, TECHINASIA_client as news_details_client, get_proxy, random_sleep, parse_datetime_safe
+from settings import get_request, TECHINASIA_client as news_details_client, get_proxy, random_sleep, parse_datetime_safe, rate_limiter
 from base_scraper import BaseScraper
 from logger import CustomLogger
 
@@ -57,6 +57,7 @@ URLS_LIST = [
 ]
 
 class TechInAsia(BaseScraper):
+    SHARDABLE = False  # No should_continue_scraping / page_index loop to split
     def __init__(self):
         super().__init__(
             db_client=news_details_client,
@@ -163,7 +164,7 @@ class TechInAsia(BaseScraper):
         """UNIQUE: Fetch article details from API"""
         url = f"{API_BASE}{slug}"
         for _ in range(5):
-            random_sleep()
+            rate_limiter.acquire(url)
             res = requests.get(url, headers=headers, proxies=get_proxy(), timeout=15, verify=False)
             if res.status_code == 200:
                 break
@@ -221,11 +222,8 @@ class TechInAsia(BaseScraper):
                     
                     merged['created_at'] = datetime.now()
                     
-                    # Use save_article from BaseScraper
-                    if self.save_article(merged):
-                        self.logger.info(f"✅ Saved: {merged['url']}")
-
-                    time.sleep(1)
+                    # Use save_article from BaseScraper (logged once the write buffer is flushed)
+                    self.save_article(merged)
                     break
 
                 except Exception as e:
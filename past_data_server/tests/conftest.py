@@ -0,0 +1,13 @@
+"""
+Test setup: scraper modules import each other flat from past_data_server/, and their
+loggers create log folders under the working directory, so tests run from a scratch folder
+"""
+
+import os
+import sys
+import tempfile
+
+SERVER_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, SERVER_DIR)
+sys.path.append(os.path.dirname(SERVER_DIR))  # scraper_common
+os.chdir(tempfile.mkdtemp(prefix="scraper-tests-"))
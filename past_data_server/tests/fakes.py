@@ -0,0 +1,119 @@
+"""
+In-memory stand-ins for a Mongo collection and an HTTP response, enough for
+BaseScraper's existence checks, index setup and bulk upserts, and a scraper
+paging through a synthetic listing
+"""
+
+import itertools
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Dict, Iterable, List, Optional
+
+from base_scraper import BaseScraper
+
+
+class FakeCollection:
+    """url -> document, with the pymongo calls BaseScraper makes"""
+
+    def __init__(self, urls: Iterable[str] = ()):
+        self.docs: Dict[str, Dict] = {url: {"url": url} for url in urls}
+        self.indexes: Dict[str, bool] = {}
+        self.writes: List[str] = []  # URLs in the order bulk_write received them
+        self._ids = itertools.count()
+
+    def create_index(self, key, unique=False, **kwargs):
+        self.indexes[key] = unique
+
+    def index_information(self):
+        info = {"_id_": {"key": [("_id", 1)]}}
+        for key, unique in self.indexes.items():
+            info[f"{key}_1"] = {"key": [(key, 1)], **({"unique": True} if unique else {})}
+        return info
+
+    def drop_index(self, name):
+        self.indexes.pop(name[:-len("_1")], None)
+
+    def find_one(self, query, *args, **kwargs):
+        return self.docs.get(query["url"]) if "url" in query else None
+
+    def find(self, query, projection=None):
+        return [self.docs[url] for url in query["url"]["$in"] if url in self.docs]
+
+    def count_documents(self, query):
+        return len(self.docs)
+
+    def bulk_write(self, operations, ordered=True):
+        upserted, matched = {}, 0
+        for index, operation in enumerate(operations):
+            url = operation._filter["url"]
+            self.writes.append(url)
+            if url in self.docs:
+                matched += 1
+                self.docs[url].update(operation._doc.get("$set", {}))
+            else:
+                self.docs[url] = dict(next(iter(operation._doc.values())))
+                upserted[index] = next(self._ids)
+        return SimpleNamespace(upserted_ids=upserted, matched_count=matched)
+
+
+class FakeResponse:
+    def __init__(self, text: str = "", status_code: int = 200, headers: Dict = None):
+        self.text = text
+        self.content = text.encode()
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class ListingScraper(BaseScraper):
+    """
+    Full-mode listing of `pages` pages of `per_page` articles, newest first, with the
+    run loop the per-site scrapers use; PREFILTER drops stored items in scrape_grid_data
+    """
+
+    PREFILTER = False
+    # Run loop breaks off after this many listing pages (a scraper-specific stop condition)
+    STOP_AFTER: Optional[int] = None
+
+    def __init__(self, collection: FakeCollection, pages: int, per_page: int = 10):
+        super().__init__(db_client=collection, log_folder="log/listing")
+        self.pages = pages
+        self.per_page = per_page
+        self.listings_fetched: List[int] = []
+        self.grid_details = []
+
+    @staticmethod
+    def article_url(page: int, item: int) -> str:
+        return f"https://example.com/page-{page}/article-{item}"
+
+    def scrape_grid_data(self, page: int) -> List[Dict]:
+        self.listings_fetched.append(page)
+        grids = [
+            {"url": self.article_url(page, item), "time": datetime(2025, 1, 1) - timedelta(hours=page * self.per_page + item)}
+            for item in range(self.per_page)
+        ] if page <= self.pages else []
+        return self.drop_existing(grids) if self.PREFILTER else grids
+
+    def fetch_detail(self, grid: Dict):
+        return True, FakeResponse()
+
+    def parse_article(self, grid: Dict, response) -> Dict:
+        return dict(grid)
+
+    def run(self):
+        self.previous_grid = []
+        while self.should_continue_scraping():
+            self.grid_details = self.scrape_grid_data(self.page_index)
+            if self.should_break_loop(self.page_index, self.previous_grid, self.grid_details):
+                break
+            if self.STOP_AFTER is not None and len(self.listings_fetched) >= self.STOP_AFTER:
+                break
+            if self.grid_details:
+                self.previous_grid = self.grid_details
+                self.check_db_grid()
+            self.page_index = self.get_new_page_index(self.page_index, self.grid_details)
+            self.page_index += 1
+        self.flush_writes()
+
+
+class PrefilterListingScraper(ListingScraper):
+    PREFILTER = True
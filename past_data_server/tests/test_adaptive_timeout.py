@@ -0,0 +1,46 @@
+"""
+Adaptive timeouts under a host that answers in about a second but leaves a few
+percent of requests hanging: only completed responses may move the timeout
+"""
+
+import random
+
+from scraper_common.adaptive_timeout import AdaptiveTimeouts
+
+URL = "https://example.com/article"
+
+
+def _simulate(timeouts: AdaptiveTimeouts, requests: int, timeout_rate: float) -> float:
+    """Drive the feedback loop the fetchers run; returns the highest timeout handed out"""
+    rng = random.Random(7)
+    highest = 0.0
+    for _ in range(requests):
+        limit = timeouts.timeout_for(URL)
+        highest = max(highest, limit)
+        latency = rng.uniform(0.5, 1.5)
+        if rng.random() < timeout_rate or latency > limit:
+            timeouts.record_timeout(URL)
+        else:
+            timeouts.record(URL, latency)
+    return highest
+
+
+def test_occasional_timeouts_do_not_ratchet_the_timeout():
+    timeouts = AdaptiveTimeouts()
+    highest = _simulate(timeouts, requests=2000, timeout_rate=0.03)
+
+    # p99 of completed latencies x 1.5 stays near 2.25 s, far from the 30 s ceiling
+    assert timeouts.timeout_for(URL) <= 3.0
+    assert highest <= 10  # the caller's default until enough samples are in
+    stats = timeouts.get_stats()["example.com"]
+    assert stats["samples"] == timeouts.window
+    assert stats["timeouts"] > 0
+
+
+def test_timeouts_alone_keep_the_default():
+    timeouts = AdaptiveTimeouts()
+    for _ in range(100):
+        timeouts.record_timeout(URL)
+
+    assert timeouts.timeout_for(URL) == 10
+    assert timeouts.get_stats()["example.com"]["timeouts"] == 100
@@ -0,0 +1,105 @@
+"""
+Full-mode listing bookkeeping: which listing page continues the current listing,
+and when a backfill (or one of its shards) counts as finished, including for
+scrapers that drop stored items while collecting the grid.
+"""
+
+import pytest
+
+from fakes import FakeCollection, ListingScraper, PrefilterListingScraper
+from settings import checkpoints
+
+
+@pytest.fixture(autouse=True)
+def no_checkpoints(monkeypatch):
+    monkeypatch.setattr(checkpoints, "enabled", False)
+
+
+def _full_mode(scraper):
+    scraper.set_config({'mode': 'full', 'frontier_search': False, 'write_batch_size': 1000, 'write_flush_seconds': 60})
+    return scraper
+
+
+def test_listing_continues_only_after_get_new_page_index():
+    scraper = _full_mode(ListingScraper(FakeCollection(), pages=5))
+    assert scraper.track_listing() and scraper.listing_number == 0
+
+    # However far the loop moves past the returned index, it is still this listing
+    scraper.articles_saved_this_page = 1
+    scraper.page_index = scraper.get_new_page_index(1, []) + 4
+    assert scraper.track_listing() and scraper.listing_number == 0
+    assert scraper.hold_gap == 4
+
+    # A loop starting over without asking for the next page starts the next listing
+    scraper.page_index = 1
+    assert scraper.track_listing() and scraper.listing_number == 1
+
+
+def test_stop_listing_ends_the_listing():
+    scraper = _full_mode(ListingScraper(FakeCollection(), pages=5))
+    scraper.track_listing()
+    scraper.page_index = scraper.get_new_page_index(1, []) + 1
+    scraper.stop_listing()
+    assert scraper.track_listing() and scraper.listing_number == 1
+
+
+def _stored_pages(pages):
+    return FakeCollection(urls=[ListingScraper.article_url(page, item) for page in pages for item in range(10)])
+
+
+def _shard(scraper_class, collection, shard_id, start, end, pages=40):
+    scraper = _full_mode(scraper_class(collection, pages=pages))
+    scraper.set_config({'frontier_search': True})
+    scraper.set_shard(shard_id, start, end)
+    scraper.run()
+    return scraper
+
+
+@pytest.mark.parametrize("scraper_class", [ListingScraper, PrefilterListingScraper])
+def test_shard_behind_stored_pages_completes_at_its_last_page(scraper_class):
+    collection = _stored_pages(range(1, 11))
+    scraper = _shard(scraper_class, collection, 0, 0, 20)
+    assert collection.writes == [ListingScraper.article_url(page, item) for page in range(11, 21) for item in range(10)]
+    assert scraper.backfill_complete()
+
+
+@pytest.mark.parametrize("scraper_class", [ListingScraper, PrefilterListingScraper])
+def test_shard_past_the_listing_completes_at_its_end(scraper_class):
+    collection = _stored_pages(range(1, 41))
+    scraper = _shard(scraper_class, collection, 2, 40, 60)
+    assert collection.writes == []
+    assert scraper.backfill_complete()
+
+
+def test_stored_shard_is_not_taken_for_the_listing_end():
+    # Every page of the shard is stored: searched up to its last page, not ended as empty
+    collection = _stored_pages(range(1, 41))
+    scraper = _shard(PrefilterListingScraper, collection, 0, 0, 20)
+    assert not scraper.end_of_listing and scraper.backfill_complete()
+    assert max(scraper.listings_fetched) <= 20
+
+
+class StoppingScraper(PrefilterListingScraper):
+    STOP_AFTER = 5
+
+
+def test_shard_stopped_early_is_not_complete():
+    collection = _stored_pages(range(1, 11))
+    scraper = _shard(StoppingScraper, collection, 0, 0, 20)
+    assert scraper.run_loop
+    assert not scraper.backfill_complete()
+
+
+def test_shard_stopped_by_circuit_breaker_is_not_complete():
+    collection = _stored_pages([])
+    scraper = _full_mode(PrefilterListingScraper(collection, pages=40))
+    scraper.set_config({'frontier_search': True})
+    scraper.set_shard(0, 0, 20)
+
+    def failing_fetch(grid):
+        scraper.on_circuit_open("example.com")
+        return False, None
+
+    scraper.fetch_detail = failing_fetch
+    scraper.run()
+    assert not scraper.backfill_complete()
@@ -0,0 +1,31 @@
+"""
+Full-mode paging: pages whose articles are all stored are scraped, not empty, however
+the scraper drops stored items, so the frontier search finds the unscraped history
+instead of taking the scraped pages for the end of the listing.
+"""
+
+import pytest
+
+from fakes import FakeCollection, ListingScraper, PrefilterListingScraper
+from settings import checkpoints
+
+
+@pytest.fixture(autouse=True)
+def no_checkpoints(monkeypatch):
+    monkeypatch.setattr(checkpoints, "enabled", False)
+
+
+@pytest.mark.parametrize("scraper_class", [ListingScraper, PrefilterListingScraper])
+def test_backfill_saves_everything_behind_stored_pages(scraper_class):
+    stored = [ListingScraper.article_url(page, item) for page in range(1, 11) for item in range(10)]
+    collection = FakeCollection(urls=stored)
+    scraper = scraper_class(collection, pages=40)
+    scraper.set_config({'mode': 'full', 'write_batch_size': 1000, 'write_flush_seconds': 60})
+
+    scraper.run()
+
+    missing = [ListingScraper.article_url(page, item) for page in range(11, 41) for item in range(10)]
+    assert collection.writes == missing
+    assert scraper.frontier_pages == [11]
+    # Galloped over the stored pages instead of reading each of them
+    assert len([page for page in scraper.listings_fetched if page <= 10]) < 10
@@ -0,0 +1,92 @@
+"""
+Persisted known-URL filters against a collection that changes between runs:
+new documents are caught up, deleted ones are forgotten by rebuilding
+"""
+
+from bson import ObjectId
+
+from known_urls import KnownUrlRegistry
+
+
+class Cursor(list):
+    def sort(self, key, direction):
+        return Cursor(sorted(self, key=lambda doc: doc[key], reverse=direction < 0))
+
+
+class Collection:
+    """The find / count calls KnownUrls makes, over documents with ObjectId _ids"""
+
+    full_name = "NEWS.articles"
+
+    def __init__(self, urls):
+        self.docs = [{"_id": ObjectId(), "url": url} for url in urls]
+
+    def insert(self, url):
+        self.docs.append({"_id": ObjectId(), "url": url})
+
+    def delete(self, url):
+        self.docs = [doc for doc in self.docs if doc["url"] != url]
+
+    def estimated_document_count(self):
+        return len(self.docs)
+
+    def find(self, query, projection=None):
+        if "_id" in query:
+            return Cursor(doc for doc in self.docs if doc["_id"] > query["_id"]["$gt"])
+        if "url" in query:
+            return Cursor(doc for doc in self.docs if doc["url"] in query["url"]["$in"])
+        return Cursor(self.docs)
+
+
+def _reload(directory, collection, **options):
+    registry = KnownUrlRegistry(directory, enabled=True, max_unconfirmed_fp_rate=1.0, **options)
+    return registry.for_collection(collection)
+
+
+def _urls(count):
+    return [f"https://example.com/article-{n}" for n in range(count)]
+
+
+def test_catch_up_adds_documents_written_since_the_save(tmp_path):
+    collection = Collection(_urls(50))
+    _reload(str(tmp_path), collection).save()
+    collection.insert("https://example.com/new")
+
+    known = _reload(str(tmp_path), collection)
+
+    assert known.existing(["https://example.com/new"]) == {"https://example.com/new"}
+
+
+def test_deleted_documents_are_forgotten(tmp_path):
+    urls = _urls(50)
+    collection = Collection(urls)
+    _reload(str(tmp_path), collection).save()
+    collection.delete(urls[3])
+
+    known = _reload(str(tmp_path), collection)
+
+    assert known.existing([urls[3], urls[4]]) == {urls[4]}
+
+
+def test_saves_count_towards_the_synced_size(tmp_path):
+    urls = _urls(50)
+    collection = Collection(urls)
+    known = _reload(str(tmp_path), collection)
+    collection.insert("https://example.com/saved")
+    known.add("https://example.com/saved")
+    known.save()
+    collection.delete(urls[0])
+
+    # 50 documents again, but one fewer than the filter was synced with
+    assert urls[0] not in _reload(str(tmp_path), collection).existing([urls[0]])
+
+
+def test_rebuild_forgets_deletions_hidden_by_inserts(tmp_path):
+    urls = _urls(50)
+    collection = Collection(urls)
+    _reload(str(tmp_path), collection).save()
+    collection.delete(urls[3])
+    collection.insert("https://example.com/new")
+
+    assert _reload(str(tmp_path), collection).existing([urls[3]]) == {urls[3]}
+    assert _reload(str(tmp_path), collection, rebuild=True).existing([urls[3]]) == set()
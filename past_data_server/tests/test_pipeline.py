@@ -0,0 +1,72 @@
+"""
+Detail pipeline ordering: fetch and parse run on several workers and finish out of
+order, the ordered save stage must still see items in grid order.
+"""
+
+import random
+import time
+
+import pytest
+
+from base_scraper import BaseScraper
+from fakes import FakeCollection
+from pipeline import Pipeline, Stage
+
+
+def _jitter(value):
+    time.sleep(random.uniform(0, 0.01))
+    return value
+
+
+def test_ordered_stage_restores_input_order():
+    seen = []
+    pipeline = Pipeline([
+        Stage("work", _jitter, workers=4),
+        Stage("more", _jitter, workers=3),
+        Stage("collect", seen.append, ordered=True),
+    ])
+    pipeline.run(range(50))
+    assert seen == list(range(50))
+
+
+def test_ordered_stage_skips_dropped_items():
+    seen = []
+    pipeline = Pipeline([
+        Stage("split", lambda page: [page * 10 + n for n in range(10)], fan_out=True),
+        Stage("odd", lambda n: _jitter(n) if n % 2 else None, workers=4),
+        Stage("fails", lambda n: n if n % 7 else 1 // 0, workers=2),
+        Stage("collect", seen.append, workers=3, ordered=True),
+    ])
+    pipeline.run(range(5))
+    assert seen == [n for n in range(50) if n % 2 and n % 7]
+    assert pipeline.stages[-1].workers == 1
+    # Numbering restarts with every run
+    seen.clear()
+    pipeline.run([7])
+    assert seen == [71, 73, 75, 79]
+
+
+def test_one_ordered_stage_per_pipeline():
+    with pytest.raises(ValueError):
+        Pipeline([Stage("a", _jitter, ordered=True), Stage("b", _jitter, ordered=True)])
+
+
+class JitterScraper(BaseScraper):
+    """Details come back after a random delay, so workers finish out of order"""
+
+    def fetch_detail(self, grid):
+        return True, _jitter(grid['url'])
+
+    def parse_article(self, grid, response):
+        return _jitter({**grid, "title": response})
+
+
+def test_detail_pipeline_saves_in_grid_order():
+    collection = FakeCollection(urls=[f"https://example.com/{n}" for n in range(0, 40, 5)])
+    scraper = JitterScraper(collection)
+    scraper.set_config({'detail_concurrency': 4, 'parse_workers': 2, 'write_batch_size': 1000,
+                        'write_flush_seconds': 60})
+    grids = [{"url": f"https://example.com/{n}"} for n in range(40)]
+    scraper.check_db_grid(grids)
+    scraper.flush_writes()
+    assert collection.writes == [grid['url'] for grid in grids if int(grid['url'].rsplit('/', 1)[1]) % 5]
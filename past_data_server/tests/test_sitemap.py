@@ -0,0 +1,75 @@
+"""
+Sitemap discovery only reports a clean run (which lets the next run's cutoff move on)
+when every sitemap was read and every new article was fetched and saved
+"""
+
+from datetime import datetime, timezone
+
+import base_scraper
+from fakes import FakeCollection, FakeResponse, ListingScraper
+
+INDEX = "https://example.com/sitemap.xml"
+CHILD = "https://example.com/sitemap-1.xml"
+
+
+def _urlset(urls):
+    entries = "".join(f"<url><loc>{url}</loc><lastmod>2025-03-01T10:00:00+00:00</lastmod></url>" for url in urls)
+    return f'<?xml version="1.0"?><urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</urlset>'
+
+
+def _index(children):
+    entries = "".join(f"<sitemap><loc>{url}</loc></sitemap>" for url in children)
+    return f'<?xml version="1.0"?><sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">{entries}</sitemapindex>'
+
+
+def _scraper(monkeypatch, sitemaps, fail_details=()):
+    def get_request(url, **kwargs):
+        return (True, FakeResponse(sitemaps[url])) if url in sitemaps else (False, None)
+
+    monkeypatch.setattr(base_scraper, "get_request", get_request)
+    scraper = ListingScraper(FakeCollection(), pages=0)
+    scraper.SITEMAP_URLS = [INDEX]
+    scraper.set_config({"mode": "incremental"})
+    monkeypatch.setattr(scraper, "fetch_detail", lambda grid: (grid["url"] not in fail_details, FakeResponse()))
+    return scraper
+
+
+def _articles(count):
+    return [f"https://example.com/article-{n}" for n in range(count)]
+
+
+def test_clean_run_is_complete(monkeypatch):
+    scraper = _scraper(monkeypatch, {INDEX: _index([CHILD]), CHILD: _urlset(_articles(3))})
+
+    scraper.run_sitemaps(datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    assert scraper.sitemap_complete
+    assert sorted(scraper.db_client.docs) == _articles(3)
+
+
+def test_failed_child_sitemap_keeps_the_cutoff(monkeypatch):
+    scraper = _scraper(monkeypatch, {INDEX: _index([CHILD, "https://example.com/sitemap-2.xml"]), CHILD: _urlset(_articles(3))})
+
+    scraper.run_sitemaps(datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    assert scraper.sitemap_errors == 1
+    assert not scraper.sitemap_complete
+
+
+def test_unparsable_sitemap_keeps_the_cutoff(monkeypatch):
+    scraper = _scraper(monkeypatch, {INDEX: _index([CHILD]), CHILD: "<urlset><url><loc>"})
+
+    scraper.run_sitemaps(datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    assert scraper.sitemap_errors == 1
+    assert not scraper.sitemap_complete
+
+
+def test_failed_article_keeps_the_cutoff(monkeypatch):
+    articles = _articles(3)
+    scraper = _scraper(monkeypatch, {INDEX: _index([CHILD]), CHILD: _urlset(articles)}, fail_details={articles[1]})
+
+    scraper.run_sitemaps(datetime(2025, 1, 1, tzinfo=timezone.utc))
+
+    assert not scraper.sitemap_complete
+    assert articles[1] not in scraper.db_client.docs
@@ -0,0 +1,53 @@
+"""
+Incremental watermark: the listing is cut at the watermark before stored URLs are
+looked up, so the DB is never queried past it and a stored watermark URL still cuts.
+"""
+
+import tech_crunch
+from fakes import FakeCollection, FakeResponse
+
+LISTING_ITEM = (
+    '<li class="post"><img src="https://img.techcrunch.com/{n}.jpg">'
+    '<h3><a href="https://techcrunch.com/2025/03/{n:02d}/story-{n}/">Story {n}</a></h3>'
+    '<time datetime="2025-03-{n:02d}T10:00:00+00:00"></time></li>'
+)
+
+
+def _listing(days):
+    return "<ul>" + "".join(LISTING_ITEM.format(n=n) for n in days) + "</ul>"
+
+
+def _url(n):
+    return f"https://techcrunch.com/2025/03/{n:02d}/story-{n}/"
+
+
+def test_watermark_cut_before_existence_check(monkeypatch):
+    collection = FakeCollection(urls=[_url(n) for n in (19, 18, 17, 16, 15)])
+    queried = []
+    find = collection.find
+
+    def recording_find(query, projection=None):
+        queried.extend(query["url"]["$in"])
+        return find(query, projection)
+
+    fetched = []
+
+    def fetch_detail(grid):
+        fetched.append(grid['url'])
+        return True, FakeResponse("<html></html>")
+
+    monkeypatch.setattr(collection, "find", recording_find)
+    monkeypatch.setattr(tech_crunch, "news_details_client", collection)
+    scraper = tech_crunch.TechCrunch()
+    monkeypatch.setattr(scraper, "fetch_detail", fetch_detail)
+    scraper.set_watermark({"time": "2025-03-18T10:00:00+00:00", "url": _url(18)})
+
+    scraper.grid_details = scraper.scrape_grid_data(_listing([20, 19, 18, 17, 16, 15]))
+    assert len(scraper.grid_details) == 6
+    scraper.check_db_grid()
+    scraper.flush_writes()
+
+    assert sorted(queried) == sorted([_url(20), _url(19)])
+    assert fetched == [_url(20)]
+    assert scraper.watermark_reached and scraper.watermark_cuts == 1
+    assert collection.writes == [_url(20)]
@@ -0,0 +1,120 @@
+"""
+Conditional GET Validator Cache for News Scraper System
+Remembers ETag / Last-Modified per listing URL between runs so unchanged
+listing pages come back as a bodiless 304 instead of a full download.
+A fetched page's validators are held back until the scraper commits them
+(its articles are saved), so a run that stops between the fetch and the
+save cannot turn the next run's fetch of that page into a 304
+"""
+
+import json
+import os
+import threading
+import time
+from typing import Dict
+
+
+class ValidatorCache:
+    """Persistent URL -> {etag, last_modified} store"""
+
+    def __init__(self, cache_file: str, max_entries: int = 5000, save_interval: int = 30):
+        """
+        Initialize validator cache
+
+        Args:
+            cache_file: JSON file the validators are persisted to
+            max_entries: Oldest entries are dropped beyond this many URLs
+            save_interval: Minimum seconds between automatic saves
+        """
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        self.save_interval = save_interval
+        self._lock = threading.Lock()
+        self._entries: Dict[str, Dict] = self._load()
+        self._pending: Dict[str, Dict] = {}  # Fetched but not yet processed, see commit()
+        self._dirty = False
+        self._last_save = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+
+    def _load(self) -> Dict[str, Dict]:
+        if os.path.exists(self.cache_file):
+            try:
+                with open(self.cache_file, 'r', encoding='utf-8') as f:
+                    return json.load(f)
+            except (json.JSONDecodeError, IOError):
+                return {}
+        return {}
+
+    def conditional_headers(self, url: str) -> Dict[str, str]:
+        """If-None-Match / If-Modified-Since headers for a URL we have validators for"""
+        with self._lock:
+            entry = self._entries.get(url)
+        if not entry:
+            return {}
+        headers = {}
+        if entry.get("etag"):
+            headers["If-None-Match"] = entry["etag"]
+        if entry.get("last_modified"):
+            headers["If-Modified-Since"] = entry["last_modified"]
+        return headers
+
+    def store(self, url: str, response_headers) -> bool:
+        """Hold the validators of a 200 response until commit(url); returns False if it had none"""
+        etag = response_headers.get("ETag")
+        last_modified = response_headers.get("Last-Modified")
+        with self._lock:
+            self.misses += 1
+            if not etag and not last_modified:
+                self._pending.pop(url, None)
+                self._entries.pop(url, None)
+                return False
+            self._pending[url] = {"etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        return True
+
+    def commit(self, url: str) -> bool:
+        """The page last fetched from url has been processed: revalidate it from now on"""
+        with self._lock:
+            entry = self._pending.pop(url, None)
+            if entry is None:
+                return False
+            self._entries.pop(url, None)
+            self._entries[url] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.pop(next(iter(self._entries)))
+            self._dirty = True
+            save_due = time.monotonic() - self._last_save >= self.save_interval
+        if save_due:
+            self.save()
+        return True
+
+    def discard(self, url: str):
+        """Forget url's uncommitted validators; the stored ones (if any) stay in use"""
+        with self._lock:
+            self._pending.pop(url, None)
+
+    def record_hit(self):
+        with self._lock:
+            self.hits += 1
+
+    def save(self):
+        """Atomically write the cache to disk if anything changed"""
+        with self._lock:
+            if not self._dirty:
+                return
+            snapshot = dict(self._entries)
+            self._dirty = False
+            self._last_save = time.monotonic()
+        tmp_file = f"{self.cache_file}.tmp"
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(snapshot, f)
+        os.replace(tmp_file, self.cache_file)
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "uncommitted": len(self._pending),
+                "not_modified": self.hits,
+                "refetched": self.misses,
+            }
@@ -15,9 +15,10 @@ Date: 2026-01-28
 import json
 import logging
 import os
+import threading
 import time
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
 import pytz
@@ -58,7 +59,7 @@ import worldoil
 import zdnet
 
 from logger import CustomLogger
-from settings import news_details_client
+from settings import news_details_client, session_pool, rate_limiter, proxy_manager, circuit_breakers, validator_cache, response_cache, single_flight, adaptive_timeouts, fetch_scheduler, retry_policy, known_urls, checkpoints
 from stats_tracker import StatsTracker
 
 
@@ -356,6 +357,109 @@ class ScraperConfig:
         "disabled_scrapers": [],  
         "auto_merge": False,  
         "merge_date_filter": "2025-01-01",  
+        "http_pool": {
+            "pool_connections": 10,
+            "pool_maxsize": 20,
+            "idle_timeout": 300,
+            "max_sessions": 256
+        },
+        "fetch_backend": "sync",
+        "async_fetch": {
+            "global_limit": 100,
+            "per_host_limit": 8
+        },
+        "rate_limits": {
+            "default": {"rate": 2.0, "burst": 5},
+            "sites": {}
+        },
+        "proxy_manager": {
+            "failure_threshold": 3,
+            "quarantine_seconds": 60,
+            "max_quarantine_seconds": 1800,
+            "explore_ratio": 0.1
+        },
+        "circuit_breaker": {
+            "failure_threshold": 15,
+            "recovery_timeout": 120,
+            "half_open_max_calls": 1
+        },
+        "response_cache": {
+            "enabled": False,
+            "directory": "cache/responses",
+            "max_size_mb": 2048,
+            "compression": "auto"
+        },
+        "reparse_from_cache": False,
+        "single_flight": {
+            "memo_ttl": 5
+        },
+        "adaptive_timeouts": {
+            "percentile": 0.99,
+            "multiplier": 1.5,
+            "floor": 3,
+            "ceiling": 30,
+            "window": 200,
+            "min_samples": 20
+        },
+        "fetch_scheduler": {
+            "enabled": True,
+            "workers": 16
+        },
+        "write_batch_size": 200,
+        "write_flush_seconds": 5,
+        "save_mode": "atomic",
+        "listing_prefetch": 1,
+        "detail_concurrency": {
+            "default": 4,
+            "scrapers": {}
+        },
+        "pipeline": {
+            "parse_workers": 2,
+            "queue_size": 16
+        },
+        "watermark": {
+            "enabled": True,
+            "overlap_minutes": 60,
+            "min_older_items": 2
+        },
+        "frontier_search": {
+            "enabled": True,
+            "known_ratio": 1.0
+        },
+        "checkpoints": {
+            "enabled": True,
+            "directory": "cache/checkpoints",
+            "fsync": True,
+            "every_pages": 1
+        },
+        "backfill_shards": {
+            "enabled": True,
+            "scrapers": ["tech_crunch"],
+            "shard_pages": 250,
+            "max_pages": 5000,
+            "workers": 3
+        },
+        "sitemap_discovery": {
+            "enabled": False,
+            "scrapers": ["tech_crunch"],
+            "batch_size": 50,
+            "lastmod_overlap_minutes": 60,
+            "first_run_days": 2
+        },
+        "known_urls": {
+            "enabled": False,
+            "directory": "cache/known_urls",
+            "fp_rate": 0.00001,
+            "max_unconfirmed_fp_rate": 0.0001,
+            "rebuild": False
+        },
+        "retry_policy": {
+            "base_delay": 1,
+            "max_delay": 30,
+            "max_retry_after": 120,
+            "budget_ratio": 0.2,
+            "budget_min_retries": 20
+        },
     }
     
     def __init__(self, config_file: Path):
@@ -400,6 +504,11 @@ class ScraperConfig:
         if enabled == "all":
             return True
         return scraper_name in enabled
+    
+    def get_detail_concurrency(self, scraper_name: str) -> int:
+        """Article fetches a scraper may have in flight at once"""
+        options = self.config.get("detail_concurrency", {})
+        return int(options.get("scrapers", {}).get(scraper_name, options.get("default", 4)))
 
 
 class ScraperState:
@@ -408,6 +517,8 @@ class ScraperState:
     def __init__(self, state_file: Path):
         self.state_file = state_file
         self.state = self.load_state()
+        # Scrapers (and backfill shards of one scraper) update state from pool threads
+        self._lock = threading.RLock()
     
     def load_state(self) -> Dict:
         """Load state from file"""
@@ -423,7 +534,7 @@ class ScraperState:
     def save_state(self):
         """Save state to file"""
         try:
-            with open(self.state_file, 'w') as f:
+            with self._lock, open(self.state_file, 'w') as f:
                 json.dump(self.state, f, indent=2)
         except Exception as e:
             logger.error(f"❌ Error saving state: {e}")
@@ -432,18 +543,79 @@ class ScraperState:
         """Get last successful run timestamp for a scraper"""
         return self.state.get(scraper_name, {}).get("last_success")
     
+    def get_sitemap_since(self, scraper_name: str) -> Optional[str]:
+        """Start of the scraper's last sitemap run that read every sitemap and saved every new URL"""
+        return self.state.get(scraper_name, {}).get("sitemap_since")
+    
+    def update_sitemap_since(self, scraper_name: str, started: str):
+        """Record a clean sitemap run; the next one only looks at entries changed after it started"""
+        with self._lock:
+            self.state.setdefault(scraper_name, {})["sitemap_since"] = started
+            self.save_state()
+    
+    def get_watermark(self, scraper_name: str) -> Optional[Dict]:
+        """Newest article time/url a scraper's incremental runs have saved, if any"""
+        return self.state.get(scraper_name, {}).get("watermark")
+    
+    def update_watermark(self, scraper_name: str, watermark: Dict):
+        """Persist a scraper's watermark ({"time": ISO, "url": ..., "updated": ISO})"""
+        with self._lock:
+            self.state.setdefault(scraper_name, {})["watermark"] = watermark
+            self.save_state()
+    
+    def start_backfill(self, scraper_name: str, shard_count: int, shard_pages: int) -> Dict:
+        """
+        The scraper's sharded backfill in progress, or a new one if there is none (or its
+        shard layout changed); {"shards", "shard_pages", "done": [shard ids], "started"}
+        """
+        with self._lock:
+            scraper_state = self.state.setdefault(scraper_name, {})
+            backfill = scraper_state.get("backfill")
+            if not backfill or backfill.get("shards") != shard_count or backfill.get("shard_pages") != shard_pages:
+                backfill = {
+                    "shards": shard_count,
+                    "shard_pages": shard_pages,
+                    "done": [],
+                    "started": datetime.now(ist).isoformat()
+                }
+                scraper_state["backfill"] = backfill
+                self.save_state()
+            return dict(backfill, done=list(backfill["done"]))
+    
+    def complete_shard(self, scraper_name: str, shard_id: int) -> bool:
+        """Record a shard that ran to its last page or the end of the listing; True once every shard of the backfill is done"""
+        with self._lock:
+            scraper_state = self.state.setdefault(scraper_name, {})
+            backfill = scraper_state.get("backfill")
+            if not backfill:
+                return False
+            if shard_id not in backfill["done"]:
+                backfill["done"].append(shard_id)
+            finished = len(backfill["done"]) >= backfill["shards"]
+            if finished:
+                # The next full run starts a fresh backfill
+                del scraper_state["backfill"]
+                scraper_state["last_backfill_completed"] = datetime.now(ist).isoformat()
+            self.save_state()
+            return finished
+    
     def update_scraper_state(self, scraper_name: str, success: bool, 
                             articles_collected: int = 0, error: str = None):
         """Update state for a scraper"""
+        with self._lock:
+            self._update_scraper_state(scraper_name, success, articles_collected, error)
+    
+    def _update_scraper_state(self, scraper_name: str, success: bool, articles_collected: int, error: str):
         now = datetime.now(ist).isoformat()
         
-        if scraper_name not in self.state:
-            self.state[scraper_name] = {
+        if "total_runs" not in self.state.get(scraper_name, {}):
+            # The entry may already hold a watermark saved earlier in this run
+            self.state.setdefault(scraper_name, {}).update({
                 "total_runs": 0,
                 "successful_runs": 0,
                 "failed_runs": 0,
                 "total_articles": 0
-            }
+            })
         
         self.state[scraper_name]["total_runs"] += 1
         self.state[scraper_name]["last_run"] = now
@@ -480,11 +652,53 @@ class UnifiedScraperManager:
             "start_time": None,
             "end_time": None
         }
+        self.configure_network()
+    
+    def configure_network(self):
+        """Push network tuning from scraper_config.json into the shared fetch layer"""
+        session_pool.configure(self.config.config.get("http_pool", {}))
+        rate_limiter.configure(self.config.config.get("rate_limits", {}))
+        proxy_manager.configure(self.config.config.get("proxy_manager", {}))
+        circuit_breakers.configure(self.config.config.get("circuit_breaker", {}))
+        cache_options = dict(self.config.config.get("response_cache", {}))
+        if "directory" in cache_options:
+            cache_options["directory"] = str(SCRIPT_DIR / cache_options["directory"])
+        response_cache.configure(cache_options)
+        single_flight.configure(self.config.config.get("single_flight", {}))
+        adaptive_timeouts.configure(self.config.config.get("adaptive_timeouts", {}))
+        fetch_scheduler.configure(self.config.config.get("fetch_scheduler", {}))
+        retry_policy.configure(self.config.config.get("retry_policy", {}))
+        known_url_options = dict(self.config.config.get("known_urls", {}))
+        if "directory" in known_url_options:
+            known_url_options["directory"] = str(SCRIPT_DIR / known_url_options["directory"])
+        known_urls.configure(known_url_options)
+        checkpoint_options = dict(self.config.config.get("checkpoints", {}))
+        if "directory" in checkpoint_options:
+            checkpoint_options["directory"] = str(SCRIPT_DIR / checkpoint_options["directory"])
+        checkpoints.configure(checkpoint_options)
     
-    def run_scraper(self, scraper_name: str, scraper_info: Dict) -> Dict:
-        """Execute a single scraper"""
+    def collect_network_stats(self):
+        """Record shared fetch-layer statistics for the current run"""
+        self.stats_tracker.add_network_stats("http_pool", session_pool.get_stats())
+        self.stats_tracker.add_network_stats("rate_limits", rate_limiter.get_stats())
+        self.stats_tracker.add_network_stats("proxies", proxy_manager.get_stats())
+        self.stats_tracker.add_network_stats("circuit_breakers", circuit_breakers.get_stats())
+        self.stats_tracker.add_network_stats("conditional_get", validator_cache.get_stats())
+        self.stats_tracker.add_network_stats("response_cache", response_cache.get_stats())
+        self.stats_tracker.add_network_stats("single_flight", single_flight.get_stats())
+        self.stats_tracker.add_network_stats("timeouts", adaptive_timeouts.get_stats())
+        self.stats_tracker.add_network_stats("fetch_scheduler", fetch_scheduler.get_stats())
+        self.stats_tracker.add_network_stats("retries", retry_policy.get_stats())
+        self.stats_tracker.add_network_stats("known_urls", known_urls.get_stats())
+        self.stats_tracker.add_network_stats("checkpoints", checkpoints.get_stats())
+        validator_cache.save()
+        known_urls.save()
+    
+    def run_scraper(self, scraper_name: str, scraper_info: Dict, shard: Optional[Dict] = None) -> Dict:
+        """Execute a single scraper (or one page-range shard of its backfill, see run_sharded_backfill)"""
+        label = f"{scraper_name}[shard {shard['id']}]" if shard else scraper_name
         result = {
-            "scraper": scraper_name,
+            "scraper": label,
             "success": False,
             "articles_collected": 0,
             "articles_skipped": 0,
@@ -492,14 +706,19 @@ class UnifiedScraperManager:
             "error": None,
             "duration": 0,
             "before_count": 0,
-            "after_count": 0
+            "after_count": 0,
+            "circuit_open_hosts": [],
+            "retry_budget": {},
+            "pipeline": {},
+            "shard_complete": False
         }
         
         start_time = time.time()
         scraper_start_time = datetime.now(ist).isoformat()
+        scraper_instance = None
         
         try:
-            logger.info(f"🚀 Starting scraper: {scraper_name}")
+            logger.info(f"🚀 Starting scraper: {label}")
             
             
             module = scraper_info["module"]
@@ -520,52 +739,123 @@ class UnifiedScraperManager:
                     'max_pages': self.config.config.get('max_pages_per_scraper', 5),
                     'skip_threshold': self.config.config.get('skip_threshold', 10),
                     'enable_skip_logic': self.config.config.get('enable_skip_logic', True),
-                    'mode': self.config.config.get('mode', 'incremental')
+                    'mode': self.config.config.get('mode', 'incremental'),
+                    'detail_concurrency': self.config.get_detail_concurrency(scraper_name),
+                    'write_batch_size': self.config.config.get('write_batch_size', 200),
+                    'write_flush_seconds': self.config.config.get('write_flush_seconds', 5),
+                    'save_mode': self.config.config.get('save_mode', 'atomic'),
+                    'listing_prefetch': self.config.config.get('listing_prefetch', 1),
+                    'parse_workers': self.config.config.get('pipeline', {}).get('parse_workers', 2),
+                    'pipeline_queue_size': self.config.config.get('pipeline', {}).get('queue_size', 16),
+                    'watermark_overlap_minutes': self.config.config.get('watermark', {}).get('overlap_minutes', 60),
+                    'watermark_min_older_items': self.config.config.get('watermark', {}).get('min_older_items', 2),
+                    'frontier_search': self.config.config.get('frontier_search', {}).get('enabled', True),
+                    'frontier_known_ratio': self.config.config.get('frontier_search', {}).get('known_ratio', 1.0),
+                    'sitemap_batch_size': self.config.config.get('sitemap_discovery', {}).get('batch_size', 50)
                 })
+            if shard:
+                scraper_instance.set_shard(shard["id"], shard["start"], shard["end"])
+            
+            sitemap_since = self.get_sitemap_since(scraper_name, scraper_instance)
+            
+            # Incremental runs stop at the newest article the last runs saved
+            # (sitemaps are not ordered by date, so not in sitemap discovery)
+            use_watermark = (
+                sitemap_since is None
+                and self.config.config.get('watermark', {}).get('enabled', True)
+                and self.config.config.get('mode', 'incremental') == 'incremental'
+                and not self.config.config.get("reparse_from_cache")
+                and hasattr(scraper_instance, 'set_watermark')
+            )
+            if use_watermark:
+                scraper_instance.set_watermark(self.state.get_watermark(scraper_name))
             
             
             before_count = collection_client.count_documents({})
             result["before_count"] = before_count
             
             
-            scraper_instance.run()
+            if self.config.config.get("reparse_from_cache") and hasattr(scraper_instance, 'reparse_from_cache'):
+                scraper_instance.reparse_from_cache()
+            elif sitemap_since is not None:
+                sitemap_started = datetime.now(ist)
+                scraper_instance.run_sitemaps(sitemap_since)
+                if scraper_instance.sitemap_complete:
+                    self.state.update_sitemap_since(scraper_name, sitemap_started.isoformat())
+                else:
+                    # A failed sitemap or article would fall behind a moved cutoff for good
+                    logger.warning(f"⚠️  {scraper_name} sitemap run incomplete, next run keeps the cutoff {sitemap_since.isoformat()}")
+            elif self.config.config.get("fetch_backend") == "async" and getattr(scraper_instance, "LISTING_URLS", None) and getattr(scraper_instance, "PAGE_URL_TEMPLATE", None):
+                scraper_instance.run_async(**self.config.config.get("async_fetch", {}))
+            else:
+                scraper_instance.run()
             
             
             after_count = collection_client.count_documents({})
             result["after_count"] = after_count
             articles_collected = after_count - before_count
+            if shard:
+                # Sibling shards write to the same collection concurrently, count this one's own writes
+                articles_collected = scraper_instance.total_articles_scraped
+                # Done only when every listing reached the shard's last page or the listing's end
+                result["shard_complete"] = scraper_instance.backfill_complete()
             
             
             if hasattr(scraper_instance, 'consecutive_skips'):
                 result["articles_skipped"] = scraper_instance.consecutive_skips
             if hasattr(scraper_instance, 'stats'):
                 result["errors"] = scraper_instance.stats.get('errors', 0)
+            if getattr(scraper_instance, 'circuit_open_hosts', None):
+                result["circuit_open_hosts"] = sorted(scraper_instance.circuit_open_hosts)
+                logger.warning(f"🔌 {label} stopped by circuit breaker: {result['circuit_open_hosts']}")
+            if hasattr(scraper_instance, 'retry_budget'):
+                result["retry_budget"] = scraper_instance.retry_budget.get_stats()
+                if result["retry_budget"]["denied"]:
+                    logger.warning(f"🪣 {label} ran out of retry budget: {result['retry_budget']}")
+            if getattr(scraper_instance, 'detail_pipeline', None):
+                result["pipeline"] = scraper_instance.detail_pipeline.get_stats()
+            if use_watermark:
+                watermark = scraper_instance.next_watermark()
+                if watermark:
+                    self.state.update_watermark(scraper_name, watermark)
+                    logger.info(f"🔖 {scraper_name} watermark advanced to {watermark['time']}")
             
             result["success"] = True
             result["articles_collected"] = articles_collected
             
-            logger.info(f"✅ {scraper_name} completed successfully. Articles: {articles_collected}")
+            logger.info(f"✅ {label} completed successfully. Articles: {articles_collected}")
             
         except Exception as e:
             error_msg = f"{str(e)}\n{traceback.format_exc()}"
             result["error"] = error_msg
-            logger.error(f"❌ {scraper_name} failed: {str(e)}")
+            logger.error(f"❌ {label} failed: {str(e)}")
             logger.error(traceback.format_exc())
         
         finally:
+            # A crashed run leaves no listing prefetches running
+            if hasattr(scraper_instance, 'cancel_prefetch'):
+                scraper_instance.cancel_prefetch()
+            # Articles still in the write buffer after a crash are written, not dropped
+            if hasattr(scraper_instance, 'flush_writes'):
+                try:
+                    scraper_instance.flush_writes()
+                except Exception as e:
+                    logger.error(f"❌ {label} final flush failed: {e}")
             result["duration"] = time.time() - start_time
             scraper_end_time = datetime.now(ist).isoformat()
             
             
-            self.state.update_scraper_state(
-                scraper_name,
-                result["success"],
-                result["articles_collected"],
-                result["error"]
-            )
+            # Shards report to run_sharded_backfill, which records the scraper's run once
+            if not shard:
+                self.state.update_scraper_state(
+                    scraper_name,
+                    result["success"],
+                    result["articles_collected"],
+                    result["error"]
+                )
             
             
-            self.stats_tracker.add_scraper_stats(scraper_name, {
+            self.stats_tracker.add_scraper_stats(label, {
                 "status": "success" if result["success"] else "failed",
                 "start_time": scraper_start_time,
                 "end_time": scraper_end_time,
@@ -576,11 +866,132 @@ class UnifiedScraperManager:
                 "collection": scraper_info.get("collection_name", "unknown"),
                 "before_count": result.get("before_count", 0),
                 "after_count": result.get("after_count", 0),
+                "circuit_open_hosts": result.get("circuit_open_hosts", []),
+                "retry_budget": result.get("retry_budget", {}),
+                "pipeline": result.get("pipeline", {}),
                 "error_message": result.get("error", "")[:200] if result.get("error") else ""
             })
         
         return result
     
+    def get_sitemap_since(self, scraper_name: str, scraper_instance) -> Optional[datetime]:
+        """
+        lastmod cutoff for an incremental run driven by the scraper's sitemaps (the start of
+        the last clean sitemap run minus lastmod_overlap_minutes, or first_run_days back
+        without one); None when the scraper pages its listings as usual. A sitemap run with
+        a failed sitemap or article does not move it, so the next run covers that window again
+        """
+        options = self.config.config.get("sitemap_discovery", {})
+        if (not options.get("enabled", False)
+                or self.config.config.get("mode", "incremental") != "incremental"
+                or self.config.config.get("reparse_from_cache")
+                or scraper_name not in options.get("scrapers", [])):
+            return None
+        if not getattr(scraper_instance, "SITEMAP_URLS", None):
+            logger.warning(f"⚠️  {scraper_name} has no SITEMAP_URLS, paging its listings instead")
+            return None
+        
+        last_clean = self.state.get_sitemap_since(scraper_name)
+        if last_clean:
+            since = datetime.fromisoformat(last_clean)
+            if since.tzinfo is None:
+                since = ist.localize(since)
+            return since - timedelta(minutes=options.get("lastmod_overlap_minutes", 60))
+        return datetime.now(timezone.utc) - timedelta(days=options.get("first_run_days", 2))
+    
+    def get_backfill_shards(self, scraper_name: str, scraper_info: Dict) -> List[Dict]:
+        """
+        Page-range shards of a full-mode backfill still to run for this scraper,
+        [] when it runs unsharded (not listed in backfill_shards, incremental mode, ...)
+        """
+        options = self.config.config.get("backfill_shards", {})
+        if (not options.get("enabled", True)
+                or self.config.config.get("mode") != "full"
+                or self.config.config.get("reparse_from_cache")
+                or scraper_name not in options.get("scrapers", [])):
+            return []
+        scraper_class = getattr(scraper_info["module"], scraper_info["class_name"])
+        if not getattr(scraper_class, "SHARDABLE", False):
+            logger.warning(f"⚠️  {scraper_name} does not page its listings by page_index, backfilling it unsharded")
+            return []
+        
+        shard_pages = max(int(options.get("shard_pages", 250)), 1)
+        max_pages = max(int(options.get("max_pages", 5000)), shard_pages)
+        shard_count = -(-max_pages // shard_pages)
+        backfill = self.state.start_backfill(scraper_name, shard_count, shard_pages)
+        if backfill["done"]:
+            logger.info(f"🧩 {scraper_name}: {len(backfill['done'])}/{shard_count} shards already done since {backfill['started']}")
+        return [
+            {"id": shard_id, "start": shard_id * shard_pages, "end": min((shard_id + 1) * shard_pages, max_pages)}
+            for shard_id in range(shard_count)
+            if shard_id not in backfill["done"]
+        ]
+    
+    def run_scraper_task(self, scraper_name: str, scraper_info: Dict) -> Dict:
+        """One manager worker per scraper: a normal run, or its sharded backfill"""
+        shards = self.get_backfill_shards(scraper_name, scraper_info)
+        if shards:
+            return self.run_sharded_backfill(scraper_name, scraper_info, shards)
+        return self.run_scraper(scraper_name, scraper_info)
+    
+    def run_sharded_backfill(self, scraper_name: str, scraper_info: Dict, shards: List[Dict]) -> Dict:
+        """
+        Run a scraper's pending backfill shards on backfill_shards.workers threads.
+        
+        Shards share the process-wide per-domain rate limiter and fetch scheduler, so the
+        site's rate limit holds across them. Each shard checkpoints on its own and is
+        marked done in scraper_state.json once it reaches its last page, so a killed run
+        only repeats the shards (from their checkpoints) that had not finished.
+        """
+        workers = max(int(self.config.config.get("backfill_shards", {}).get("workers", 3)), 1)
+        logger.info(f"🧩 {scraper_name}: backfilling {len(shards)} shards with {workers} workers")
+        start_time = time.time()
+        result = {
+            "scraper": scraper_name,
+            "success": True,
+            "articles_collected": 0,
+            "error": None,
+            "shards_completed": 0,
+            "shards_pending": len(shards)
+        }
+        errors = []
+        
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{scraper_name}-shard") as executor:
+            future_to_shard = {
+                executor.submit(self.run_scraper, scraper_name, scraper_info, shard): shard
+                for shard in shards
+            }
+            for future in as_completed(future_to_shard):
+                shard = future_to_shard[future]
+                try:
+                    shard_result = future.result()
+                except Exception as e:
+                    shard_result = {"success": False, "articles_collected": 0, "error": str(e), "shard_complete": False}
+                result["articles_collected"] += shard_result["articles_collected"]
+                if not shard_result["success"]:
+                    result["success"] = False
+                    errors.append(f"shard {shard['id']}: {shard_result['error']}")
+                if shard_result["shard_complete"]:
+                    result["shards_completed"] += 1
+                    result["shards_pending"] -= 1
+                    if self.state.complete_shard(scraper_name, shard["id"]):
+                        logger.info(f"🏁 {scraper_name}: every backfill shard is done")
+        
+        if errors:
+            result["error"] = "\n".join(errors)
+        result["duration"] = time.time() - start_time
+        logger.info(
+            f"🧩 {scraper_name}: {result['shards_completed']}/{len(shards)} shards finished, "
+            f"{result['articles_collected']} articles in {result['duration']:.0f}s"
+        )
+        self.state.update_scraper_state(
+            scraper_name,
+            result["success"],
+            result["articles_collected"],
+            result["error"]
+        )
+        return result
+    
     def get_enabled_scrapers(self) -> List[tuple]:
         """Get list of enabled scrapers sorted by priority"""
         enabled = []
@@ -625,7 +1036,7 @@ class UnifiedScraperManager:
         
         with ThreadPoolExecutor(max_workers=max_workers) as executor:
             future_to_scraper = {
-                executor.submit(self.run_scraper, name, info): name
+                executor.submit(self.run_scraper_task, name, info): name
                 for name, info in enabled_scrapers
             }
             
@@ -652,6 +1063,7 @@ class UnifiedScraperManager:
         self.stats["end_time"] = datetime.now(ist)
         
         
+        self.collect_network_stats()
         self.stats_tracker.end_run()
         
         self.print_summary()
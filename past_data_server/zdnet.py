@@ -63,7 +63,9 @@ class Zdnet(BaseScraper):
     def get_grid_details(self, url):
         """Scrape the grid (listing) page."""
         try:
-            done, response = get_request(url + str(self.page_index))
+            done, response = self.get_listing(url + str(self.page_index))
+            if self.listing_not_modified:
+                return []
             if not done:
                 self.logger.error(f"Request failed: {url}")
                 return []
@@ -173,39 +175,6 @@ class Zdnet(BaseScraper):
 
         return details
 
-    def check_db_grid(self):
-        """Check DB before fetching details; skip if exists."""
-        for grid in self.grid_details:
-            try:
-                # Check if exists (with skip tracking)
-                if self.check_article_exists(grid['url']):
-                    continue
-                done, response = get_request(f"{grid['url']}")
-                if not done:
-                    self.logger.warning(f"Failed fetching: {grid['url']}")
-                    continue
-
-                details = self.separate_blog_details(response)
-                
-                # UNIQUE: Skip video articles
-                if details == "Video Article":
-                    self.logger.info(f"Skipping video article: {grid['url']}")
-                    continue
-                
-                merged = {**grid, **details}
-                
-                # Use image from details if grid doesn't have one
-                if not grid.get('image'):
-                    merged['image'] = details.get('image', '')
-                
-                # Use save_article from BaseScraper
-                if self.save_article(merged):
-                    self.logger.info(f"✅ Saved: {merged['url']}")
-
-                time.sleep(1)
-            except Exception as e:
-                self.logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
-
     def run(self):
         """Main execution logic - UNIQUE: loops through 40+ category URLs"""
         self.logger.info("🚀 Starting ZDnet scraper")
@@ -0,0 +1,5 @@
+"""
+Fetch components shared by news_scrapper, link_scrapper and past_data_server.
+news_scrapper imports them from the repo root; the flat packages (run from their
+own directory) put the repo root on sys.path in their settings module first.
+"""
@@ -0,0 +1,109 @@
+"""
+Adaptive Per-Host Timeouts for News Scraper System
+Derives each host's request timeout from a rolling percentile of its observed
+latency (clamped between a floor and a ceiling) instead of a fixed 10 s
+"""
+
+import math
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+
+from scraper_common.rate_limiter import domain_of
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list"""
+    if not sorted_values:
+        return 0.0
+    rank = max(math.ceil(fraction * len(sorted_values)) - 1, 0)
+    return sorted_values[rank]
+
+
+class AdaptiveTimeouts:
+    """Rolling latency windows per host and the timeouts derived from them"""
+
+    def __init__(self, percentile: float = 0.99, multiplier: float = 1.5, floor: float = 3.0,
+                 ceiling: float = 30.0, window: int = 200, min_samples: int = 20):
+        """
+        Initialize adaptive timeouts
+
+        Args:
+            percentile: Latency percentile the timeout is based on (0.95 / 0.99)
+            multiplier: Headroom applied on top of that percentile
+            floor: Lowest timeout ever handed out (seconds)
+            ceiling: Highest timeout ever handed out (seconds)
+            window: Latest samples kept per host
+            min_samples: Below this many samples the caller's default timeout is used
+        """
+        self.percentile = percentile
+        self.multiplier = multiplier
+        self.floor = floor
+        self.ceiling = ceiling
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._timeouts: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, options: Dict):
+        """Apply the adaptive_timeouts section of scraper_config.json"""
+        for key in ("percentile", "multiplier", "floor", "ceiling"):
+            if key in options:
+                setattr(self, key, float(options[key]))
+        for key in ("window", "min_samples"):
+            if key in options:
+                setattr(self, key, int(options[key]))
+        with self._lock:
+            self._samples.clear()
+            self._timeouts.clear()
+
+    def record(self, url: str, seconds: float):
+        """Add the latency of a completed response (any status) to the host's window"""
+        domain = domain_of(url)
+        with self._lock:
+            if domain not in self._samples:
+                self._samples[domain] = deque(maxlen=self.window)
+            self._samples[domain].append(seconds)
+
+    def record_timeout(self, url: str):
+        """
+        Count a request the host did not answer in time. Kept out of the latency window:
+        fed back as a sample equal to the timeout, a few percent of timeouts would lift
+        the percentile, and with it the next timeout, step by step up to the ceiling.
+        Callers leave out proxied and connect timeouts, which say nothing about the host.
+        """
+        domain = domain_of(url)
+        with self._lock:
+            self._timeouts[domain] = self._timeouts.get(domain, 0) + 1
+
+    def _derive(self, samples) -> Optional[float]:
+        if len(samples) < self.min_samples:
+            return None
+        value = percentile(sorted(samples), self.percentile) * self.multiplier
+        return round(min(max(value, self.floor), self.ceiling), 2)
+
+    def timeout_for(self, url: str, default: float = 10) -> float:
+        """Timeout to use for the next request to the URL's host"""
+        with self._lock:
+            samples = list(self._samples.get(domain_of(url), ()))
+        derived = self._derive(samples)
+        return default if derived is None else derived
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            windows = {domain: sorted(samples) for domain, samples in self._samples.items()}
+            timeouts = dict(self._timeouts)
+        for domain in timeouts:
+            windows.setdefault(domain, [])
+        return {
+            domain: {
+                "samples": len(values),
+                "timeouts": timeouts.get(domain, 0),
+                "p50": round(percentile(values, 0.50), 2),
+                "p95": round(percentile(values, 0.95), 2),
+                "p99": round(percentile(values, 0.99), 2),
+                "timeout": self._derive(values),
+            }
+            for domain, values in windows.items()
+        }
@@ -0,0 +1,131 @@
+"""
+Per-Host Circuit Breaker for News Scraper System
+Stops get_request from burning every retry on a site that is down or blocking
+us: after repeated failures the host's breaker opens and calls fail fast until
+a cool-down passes and a trial request succeeds
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Optional
+
+from scraper_common.rate_limiter import domain_of
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """closed -> open after N consecutive failures -> half_open after a cool-down"""
+
+    def __init__(self, failure_threshold: int = 15, recovery_timeout: int = 120, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.state = CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.half_open_calls = 0
+        self.trips = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        with self._lock:
+            if self.state == OPEN:
+                if time.monotonic() - self.opened_at < self.recovery_timeout:
+                    self.rejected += 1
+                    return False
+                self.state = HALF_OPEN
+                self.half_open_calls = 0
+
+            if self.state == HALF_OPEN:
+                if self.half_open_calls >= self.half_open_max_calls:
+                    self.rejected += 1
+                    return False
+                self.half_open_calls += 1
+
+            return True
+
+    def record_success(self):
+        with self._lock:
+            self.state = CLOSED
+            self.consecutive_failures = 0
+
+    def record_failure(self) -> bool:
+        """Count a failure; returns True when this failure tripped the breaker"""
+        with self._lock:
+            self.consecutive_failures += 1
+            if self.state == HALF_OPEN or (self.state == CLOSED and self.consecutive_failures >= self.failure_threshold):
+                self.state = OPEN
+                self.opened_at = time.monotonic()
+                self.trips += 1
+                return True
+            return False
+
+
+class CircuitBreakerRegistry:
+    """One breaker per domain, plus a per-thread listener so the owning scraper hears about trips"""
+
+    def __init__(self, failure_threshold: int = 15, recovery_timeout: int = 120, half_open_max_calls: int = 1):
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._breakers: Dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def configure(self, options: Dict):
+        """Apply the circuit_breaker section of scraper_config.json"""
+        for key in ("failure_threshold", "recovery_timeout", "half_open_max_calls"):
+            if key in options:
+                setattr(self, key, int(options[key]))
+        with self._lock:
+            self._breakers.clear()
+
+    def listen(self, callback: Optional[Callable[[str], None]]):
+        """Register callback(domain) for breakers that open while this thread is fetching"""
+        self._local.listener = callback
+
+    def _notify(self, domain: str):
+        listener = getattr(self._local, "listener", None)
+        if listener:
+            listener(domain)
+
+    def breaker_for(self, url: str) -> CircuitBreaker:
+        domain = domain_of(url)
+        with self._lock:
+            if domain not in self._breakers:
+                self._breakers[domain] = CircuitBreaker(
+                    self.failure_threshold, self.recovery_timeout, self.half_open_max_calls
+                )
+            return self._breakers[domain]
+
+    def allow(self, url: str) -> bool:
+        """False while the URL's host breaker is open (fail fast)"""
+        allowed = self.breaker_for(url).allow()
+        if not allowed:
+            self._notify(domain_of(url))
+        return allowed
+
+    def record(self, url: str, success: bool):
+        breaker = self.breaker_for(url)
+        if success:
+            breaker.record_success()
+        elif breaker.record_failure():
+            self._notify(domain_of(url))
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {
+            domain: {
+                "state": breaker.state,
+                "trips": breaker.trips,
+                "rejected_calls": breaker.rejected,
+                "consecutive_failures": breaker.consecutive_failures,
+            }
+            for domain, breaker in breakers.items()
+            if breaker.trips or breaker.consecutive_failures
+        }
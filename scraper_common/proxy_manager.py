@@ -0,0 +1,180 @@
+"""
+Proxy Health Manager for News Scraper System
+Scores every proxy by EWMA success rate and latency (overall and per target
+host), quarantines failing proxies with timed re-probing, and prefers fast,
+healthy proxies when picking one for a request
+"""
+
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+
+class ProxyHealth:
+    """EWMA health record for one proxy (or one proxy against one host)"""
+
+    def __init__(self):
+        self.success_ewma = 1.0
+        self.latency_ewma: Optional[float] = None
+        self.requests = 0
+        self.failures = 0
+        self.consecutive_failures = 0
+        self.quarantines = 0
+        self.quarantined_until = 0.0
+
+    def record(self, success: bool, latency: float, alpha: float):
+        self.requests += 1
+        self.success_ewma = alpha * (1.0 if success else 0.0) + (1 - alpha) * self.success_ewma
+        if success:
+            self.latency_ewma = latency if self.latency_ewma is None else alpha * latency + (1 - alpha) * self.latency_ewma
+            self.consecutive_failures = 0
+            self.quarantines = 0
+        else:
+            self.failures += 1
+            self.consecutive_failures += 1
+
+    def is_quarantined(self, now: float) -> bool:
+        return self.quarantined_until > now
+
+    def score(self) -> float:
+        """Higher is better: reliability divided by expected latency"""
+        latency = self.latency_ewma if self.latency_ewma is not None else 1.0
+        return max(self.success_ewma, 0.01) / (latency + 0.25)
+
+
+class ProxyManager:
+    """Adaptive proxy selection with per-proxy and per-(proxy, host) health"""
+
+    def __init__(self, proxies: List[str], alpha: float = 0.3, failure_threshold: int = 3,
+                 quarantine_seconds: int = 60, max_quarantine_seconds: int = 1800,
+                 explore_ratio: float = 0.1):
+        """
+        Initialize proxy manager
+
+        Args:
+            proxies: "host:port" entries
+            alpha: EWMA weight of the newest observation
+            failure_threshold: Consecutive failures before a proxy is quarantined
+            quarantine_seconds: First quarantine length; doubles on every failed re-probe
+            max_quarantine_seconds: Upper bound for the quarantine length
+            explore_ratio: Share of picks made uniformly so slow proxies get re-measured
+        """
+        self.proxies = list(proxies)
+        self.alpha = alpha
+        self.failure_threshold = failure_threshold
+        self.quarantine_seconds = quarantine_seconds
+        self.max_quarantine_seconds = max_quarantine_seconds
+        self.explore_ratio = explore_ratio
+        self._lock = threading.Lock()
+        self._health: Dict[str, ProxyHealth] = {proxy: ProxyHealth() for proxy in self.proxies}
+        self._host_health: Dict[tuple, ProxyHealth] = {}
+
+    def configure(self, options: Dict):
+        """Apply the proxy_manager section of scraper_config.json"""
+        for key in ("alpha", "explore_ratio"):
+            if key in options:
+                setattr(self, key, float(options[key]))
+        for key in ("failure_threshold", "quarantine_seconds", "max_quarantine_seconds"):
+            if key in options:
+                setattr(self, key, int(options[key]))
+
+    @staticmethod
+    def as_requests_proxies(proxy: str) -> Dict[str, str]:
+        return {"http": f"http://{proxy}", "https": f"http://{proxy}"}
+
+    def _host_entry(self, proxy: str, host: str) -> ProxyHealth:
+        key = (proxy, host)
+        if key not in self._host_health:
+            self._host_health[key] = ProxyHealth()
+        return self._host_health[key]
+
+    def choose(self, url: Optional[str] = None) -> str:
+        """Pick a proxy for the URL, weighted by health score"""
+        host = urlsplit(url).hostname if url else None
+        now = time.monotonic()
+
+        with self._lock:
+            candidates = []
+            for proxy in self.proxies:
+                health = self._health[proxy]
+                host_health = self._host_health.get((proxy, host)) if host else None
+                if health.is_quarantined(now) or (host_health and host_health.is_quarantined(now)):
+                    continue
+                # Host-specific numbers win once there are enough of them
+                source = host_health if host_health and host_health.requests >= 3 else health
+                candidates.append((proxy, source.score()))
+
+            if not candidates:
+                # Everything is quarantined: use the proxy that comes back first
+                return min(
+                    self.proxies,
+                    key=lambda p: max(
+                        self._health[p].quarantined_until,
+                        self._host_health[(p, host)].quarantined_until if (p, host) in self._host_health else 0,
+                    ),
+                )
+
+        if random.random() < self.explore_ratio:
+            return random.choice(candidates)[0]
+        proxies, weights = zip(*candidates)
+        return random.choices(proxies, weights=weights, k=1)[0]
+
+    def get_proxy(self, url: Optional[str] = None) -> Dict[str, str]:
+        """requests-style proxies dict for the chosen proxy"""
+        return self.as_requests_proxies(self.choose(url))
+
+    def _quarantine_if_failing(self, health: ProxyHealth, now: float):
+        if health.consecutive_failures >= self.failure_threshold:
+            length = min(self.quarantine_seconds * (2 ** health.quarantines), self.max_quarantine_seconds)
+            health.quarantined_until = now + length
+            health.quarantines += 1
+
+    def report(self, proxy: str, url: str, latency: float, status: Optional[int] = None):
+        """
+        Record the outcome of a request made through a proxy
+
+        Args:
+            proxy: "host:port" returned by choose()
+            url: Requested URL (for the per-host score)
+            latency: Seconds the attempt took
+            status: HTTP status, or None when the request raised (timeout, connection error)
+        """
+        # No response or proxy auth failure: the proxy itself is at fault.
+        # 403/429/5xx: the target host is refusing this proxy, other hosts may be fine.
+        proxy_ok = status is not None and status != 407
+        host_ok = proxy_ok and status not in (403, 429) and status < 500
+        host = urlsplit(url).hostname or ""
+        now = time.monotonic()
+
+        with self._lock:
+            health = self._health.setdefault(proxy, ProxyHealth())
+            health.record(proxy_ok, latency, self.alpha)
+            self._quarantine_if_failing(health, now)
+
+            host_health = self._host_entry(proxy, host)
+            host_health.record(host_ok, latency, self.alpha)
+            self._quarantine_if_failing(host_health, now)
+
+    def get_stats(self) -> Dict:
+        """Per-proxy health scores for StatsTracker"""
+        now = time.monotonic()
+        with self._lock:
+            stats = {}
+            for proxy, health in self._health.items():
+                blocked_hosts = [
+                    host for (p, host), entry in self._host_health.items()
+                    if p == proxy and entry.is_quarantined(now)
+                ]
+                stats[proxy] = {
+                    "requests": health.requests,
+                    "failures": health.failures,
+                    "success_ewma": round(health.success_ewma, 3),
+                    "latency_ms": round(health.latency_ewma * 1000) if health.latency_ewma is not None else None,
+                    "score": round(health.score(), 3),
+                    "quarantined": health.is_quarantined(now),
+                    "quarantines": health.quarantines,
+                    "quarantined_hosts": blocked_hosts,
+                }
+            return stats
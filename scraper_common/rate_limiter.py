@@ -0,0 +1,121 @@
+"""
+Per-Domain Rate Limiter for News Scraper System
+Thread-safe token buckets keyed by domain; replaces the fixed sleeps that used
+to pace every scraper regardless of how much traffic a site could take
+"""
+
+import asyncio
+import threading
+import time
+from typing import Dict, Optional
+from urllib.parse import urlsplit
+
+
+def domain_of(url: str) -> str:
+    """Bucket key for a URL: lowercase hostname without a leading www."""
+    host = (urlsplit(url).hostname or "").lower()
+    return host[4:] if host.startswith("www.") else host
+
+
+class TokenBucket:
+    """Token bucket that hands out reservations instead of blocking under its lock"""
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = float(burst)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+        self.acquired = 0
+        self.waited_seconds = 0.0
+
+    def ready_in(self) -> float:
+        """Seconds until a token is available, without taking one"""
+        with self._lock:
+            tokens = min(self.burst, self.tokens + (time.monotonic() - self.updated) * self.rate)
+            return 0.0 if tokens >= 1 else (1 - tokens) / self.rate
+
+    def reserve(self) -> float:
+        """Take one token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            wait = -self.tokens / self.rate if self.tokens < 0 else 0.0
+            self.acquired += 1
+            self.waited_seconds += wait
+            return wait
+
+
+class RateLimiter:
+    """Registry of per-domain token buckets configured from scraper_config.json"""
+
+    def __init__(self, default_rate: float = 2.0, default_burst: int = 5,
+                 sites: Optional[Dict[str, Dict]] = None):
+        """
+        Initialize rate limiter
+
+        Args:
+            default_rate: Requests per second for domains without their own entry
+            default_burst: Requests allowed back-to-back before pacing starts
+            sites: {"techcrunch.com": {"rate": 3, "burst": 6}, ...}
+        """
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.sites = sites or {}
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    def configure(self, options: Dict):
+        """Apply the rate_limits section of scraper_config.json"""
+        default = options.get("default", {})
+        with self._lock:
+            self.default_rate = float(default.get("rate", self.default_rate))
+            self.default_burst = int(default.get("burst", self.default_burst))
+            self.sites = options.get("sites", {})
+            self._buckets.clear()
+
+    def _limits_for(self, domain: str) -> Dict:
+        for site, limits in self.sites.items():
+            if domain == site or domain.endswith("." + site):
+                return limits
+        return {}
+
+    def bucket_for(self, url: str) -> TokenBucket:
+        domain = domain_of(url)
+        with self._lock:
+            if domain not in self._buckets:
+                limits = self._limits_for(domain)
+                self._buckets[domain] = TokenBucket(
+                    rate=float(limits.get("rate", self.default_rate)),
+                    burst=int(limits.get("burst", self.default_burst)),
+                )
+            return self._buckets[domain]
+
+    def acquire(self, url: str) -> float:
+        """Block until the URL's domain has capacity; returns seconds waited"""
+        wait = self.bucket_for(url).reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self, url: str) -> float:
+        """Event-loop friendly acquire for the async fetch engine"""
+        wait = self.bucket_for(url).reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            buckets = dict(self._buckets)
+        return {
+            domain: {
+                "rate": bucket.rate,
+                "burst": bucket.burst,
+                "requests": bucket.acquired,
+                "waited_seconds": round(bucket.waited_seconds, 2),
+            }
+            for domain, bucket in buckets.items()
+        }
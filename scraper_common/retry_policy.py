@@ -0,0 +1,161 @@
+"""
+Retry Policy for News Scraper System
+Decides whether and when get_request tries again: permanent 4xx fail at once,
+everything else backs off exponentially with full jitter (or as long as the
+server's Retry-After asks), and every retry is drawn from a per-run budget so
+an unhealthy site cannot trigger a retry storm
+"""
+
+import random
+import threading
+from email.utils import parsedate_to_datetime
+from datetime import datetime, timezone
+from typing import Dict, Optional
+
+# Retrying these will not change the answer
+PERMANENT_STATUSES = {400, 401, 404, 405, 410, 414, 451}
+# The server asked us to slow down; Retry-After is honoured for these
+THROTTLE_STATUSES = {429, 503}
+
+
+class RetryBudget:
+    """Retries allowed = min_retries + ratio x requests made so far in this run"""
+
+    def __init__(self, ratio: float = 0.2, min_retries: int = 20):
+        self.ratio = ratio
+        self.min_retries = min_retries
+        self.requests = 0
+        self.retries = 0
+        self.denied = 0
+        self._lock = threading.Lock()
+
+    def record_request(self):
+        with self._lock:
+            self.requests += 1
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False once it is used up"""
+        with self._lock:
+            if self.retries < self.min_retries + self.ratio * self.requests:
+                self.retries += 1
+                return True
+            self.denied += 1
+            return False
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "denied": self.denied,
+            }
+
+
+class RetryPolicy:
+    """Status classification, backoff timing and the per-thread retry budget"""
+
+    def __init__(self, base_delay: float = 1.0, max_delay: float = 30.0, max_retry_after: float = 120.0,
+                 budget_ratio: float = 0.2, budget_min_retries: int = 20):
+        """
+        Initialize retry policy
+
+        Args:
+            base_delay: Backoff ceiling for the first retry (seconds), doubled per attempt
+            max_delay: Largest backoff ceiling (seconds)
+            max_retry_after: Longest Retry-After we are willing to sleep (seconds)
+            budget_ratio: Retries earned per request in a run's budget
+            budget_min_retries: Retries a run's budget starts with
+        """
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.budget_ratio = budget_ratio
+        self.budget_min_retries = budget_min_retries
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.permanent_failures = 0
+        self.retries = 0
+        self.budget_denied = 0
+        self.retry_after_honoured = 0
+
+    def configure(self, options: Dict):
+        """Apply the retry_policy section of scraper_config.json"""
+        for key in ("base_delay", "max_delay", "max_retry_after", "budget_ratio"):
+            if key in options:
+                setattr(self, key, float(options[key]))
+        if "budget_min_retries" in options:
+            self.budget_min_retries = int(options["budget_min_retries"])
+
+    # -- budget (per scraper run, bound to the scraper's thread) --
+
+    def new_budget(self) -> RetryBudget:
+        return RetryBudget(self.budget_ratio, self.budget_min_retries)
+
+    def use_budget(self, budget: Optional[RetryBudget]):
+        """Charge retries made on this thread to budget (None = unlimited)"""
+        self._local.budget = budget
+
+    def current_budget(self) -> Optional[RetryBudget]:
+        return getattr(self._local, "budget", None)
+
+    def record_request(self):
+        budget = self.current_budget()
+        if budget:
+            budget.record_request()
+
+    def allow_retry(self) -> bool:
+        budget = self.current_budget()
+        allowed = budget is None or budget.try_spend()
+        with self._lock:
+            if allowed:
+                self.retries += 1
+            else:
+                self.budget_denied += 1
+        return allowed
+
+    # -- classification and timing --
+
+    def is_permanent(self, status_code: int) -> bool:
+        if status_code in PERMANENT_STATUSES:
+            with self._lock:
+                self.permanent_failures += 1
+            return True
+        return False
+
+    def retry_after(self, status_code: int, headers) -> Optional[float]:
+        """Seconds the server asked us to wait, for throttling statuses only"""
+        if status_code not in THROTTLE_STATUSES:
+            return None
+        value = headers.get("Retry-After")
+        if not value:
+            return None
+        try:
+            seconds = float(value)
+        except ValueError:
+            try:
+                seconds = (parsedate_to_datetime(value) - datetime.now(timezone.utc)).total_seconds()
+            except (TypeError, ValueError):
+                return None
+        return max(seconds, 0.0)
+
+    def delay(self, retry_number: int, retry_after: Optional[float] = None) -> float:
+        """
+        Sleep before retry number retry_number (0 = first retry)
+
+        Full jitter: uniform(0, min(max_delay, base_delay * 2^n)). A Retry-After
+        from the server takes precedence, capped at max_retry_after.
+        """
+        if retry_after is not None:
+            with self._lock:
+                self.retry_after_honoured += 1
+            return min(retry_after, self.max_retry_after)
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** retry_number))
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "retries": self.retries,
+                "permanent_failures": self.permanent_failures,
+                "budget_denied": self.budget_denied,
+                "retry_after_honoured": self.retry_after_honoured,
+            }
@@ -0,0 +1,183 @@
+"""
+HTTP Session Pool for News Scraper System
+Keeps keep-alive requests.Session objects per (host, proxy) so repeated
+fetches reuse TCP/TLS connections instead of handshaking on every request
+"""
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+
+class _ConnectionCounter:
+    """Thread-safe count of new TCP connections opened per host"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.by_host: Dict[str, int] = {}
+
+    def increment(self, host: str):
+        with self._lock:
+            self.by_host[host] = self.by_host.get(host, 0) + 1
+
+    def snapshot(self) -> Dict[str, int]:
+        with self._lock:
+            return dict(self.by_host)
+
+
+_new_connections = _ConnectionCounter()
+
+
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _new_conn(self):
+        _new_connections.increment(self.host)
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _new_conn(self):
+        _new_connections.increment(self.host)
+        return super()._new_conn()
+
+
+_COUNTING_POOL_CLASSES = {
+    "http": _CountingHTTPConnectionPool,
+    "https": _CountingHTTPSConnectionPool,
+}
+
+
+class PooledHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter whose urllib3 pools report every new connection they open"""
+
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = _COUNTING_POOL_CLASSES
+
+    def proxy_manager_for(self, proxy, **proxy_kwargs):
+        manager = super().proxy_manager_for(proxy, **proxy_kwargs)
+        manager.pool_classes_by_scheme = _COUNTING_POOL_CLASSES
+        return manager
+
+
+class SessionPool:
+    """Per-host, per-proxy pool of keep-alive requests sessions"""
+
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 20,
+                 idle_timeout: int = 300, max_sessions: int = 256):
+        """
+        Initialize session pool
+
+        Args:
+            pool_connections: Number of urllib3 host pools cached per session
+            pool_maxsize: Max keep-alive connections kept per host pool
+            idle_timeout: Seconds a session may sit unused before it is closed
+            max_sessions: Upper bound on open sessions (least recently used are closed first)
+        """
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.idle_timeout = idle_timeout
+        self.max_sessions = max_sessions
+
+        self._lock = threading.Lock()
+        self._sessions: "OrderedDict[Tuple[str, str], Tuple[requests.Session, float]]" = OrderedDict()
+        self._last_sweep = time.monotonic()
+        self._requests_by_host: Dict[str, int] = {}
+        self.sessions_created = 0
+        self.sessions_evicted = 0
+
+    def configure(self, options: Dict):
+        """Apply tuning options (from scraper_config.json) and drop existing sessions"""
+        for key in ("pool_connections", "pool_maxsize", "idle_timeout", "max_sessions"):
+            if key in options:
+                setattr(self, key, int(options[key]))
+        self.close_all()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        adapter = PooledHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        self.sessions_created += 1
+        return session
+
+    def _evict_idle(self, now: float):
+        """Close sessions idle for longer than idle_timeout (caller holds the lock)"""
+        if now - self._last_sweep < min(self.idle_timeout, 60):
+            return
+        self._last_sweep = now
+        for key in [k for k, (_, used) in self._sessions.items() if now - used > self.idle_timeout]:
+            session, _ = self._sessions.pop(key)
+            session.close()
+            self.sessions_evicted += 1
+
+    def get_session(self, url: str, proxies: Optional[Dict] = None) -> requests.Session:
+        """Return the pooled session for the URL's host and the given proxy"""
+        parts = urlsplit(url)
+        proxy = (proxies or {}).get(parts.scheme, "")
+        key = (f"{parts.scheme}://{parts.netloc}", proxy)
+        now = time.monotonic()
+
+        with self._lock:
+            self._evict_idle(now)
+            self._requests_by_host[parts.hostname or ""] = self._requests_by_host.get(parts.hostname or "", 0) + 1
+
+            if key in self._sessions:
+                session, _ = self._sessions.pop(key)
+            else:
+                session = self._new_session()
+                while len(self._sessions) >= self.max_sessions:
+                    _, (oldest, _) = self._sessions.popitem(last=False)
+                    oldest.close()
+                    self.sessions_evicted += 1
+            self._sessions[key] = (session, now)
+
+        return session
+
+    def get(self, url: str, proxies: Optional[Dict] = None, **kwargs) -> requests.Response:
+        """Drop-in replacement for requests.get that goes through a pooled session"""
+        return self.get_session(url, proxies).get(url, proxies=proxies, **kwargs)
+
+    def close_all(self):
+        """Close every pooled session"""
+        with self._lock:
+            for session, _ in self._sessions.values():
+                session.close()
+            self._sessions.clear()
+
+    def get_stats(self) -> Dict:
+        """Connection reuse statistics for StatsTracker"""
+        connections = _new_connections.snapshot()
+        with self._lock:
+            requests_by_host = dict(self._requests_by_host)
+            open_sessions = len(self._sessions)
+
+        hosts = {}
+        for host, count in requests_by_host.items():
+            opened = connections.get(host, 0)
+            hosts[host] = {
+                "requests": count,
+                "new_connections": opened,
+                "reuse_rate": round(max(count - opened, 0) / count, 3) if count else 0,
+            }
+
+        total_requests = sum(requests_by_host.values())
+        total_connections = sum(connections.get(host, 0) for host in requests_by_host)
+        return {
+            "open_sessions": open_sessions,
+            "sessions_created": self.sessions_created,
+            "sessions_evicted": self.sessions_evicted,
+            "requests": total_requests,
+            "new_connections": total_connections,
+            "reused_connections": max(total_requests - total_connections, 0),
+            "reuse_rate": round(max(total_requests - total_connections, 0) / total_requests, 3) if total_requests else 0,
+            "hosts": hosts,
+        }
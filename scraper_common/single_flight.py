@@ -0,0 +1,115 @@
+"""
+Single-Flight Request Coalescing for News Scraper System
+Concurrent get_request calls for the same normalized URL share one in-flight
+fetch, and a short TTL memo answers calls that arrive right after it finished
+"""
+
+import threading
+import time
+from typing import Callable, Dict, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
+
+def normalize_url(url: str, params: Dict = None) -> str:
+    """Canonical form used as the coalescing key"""
+    parts = urlsplit(url)
+    scheme = parts.scheme.lower()
+    host = (parts.hostname or "").lower()
+    if parts.port and parts.port != DEFAULT_PORTS.get(scheme):
+        host = f"{host}:{parts.port}"
+    query = [(k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if not k.startswith("utm_")]
+    query += [(str(k), str(v)) for k, v in (params or {}).items()]
+    return urlunsplit((scheme, host, parts.path or "/", urlencode(sorted(query)), ""))
+
+
+class _Call:
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Duplicate-suppression for concurrent identical fetches"""
+
+    def __init__(self, memo_ttl: float = 5.0):
+        """
+        Initialize single-flight group
+
+        Args:
+            memo_ttl: Seconds a successful result keeps answering new callers (0 disables)
+        """
+        self.memo_ttl = memo_ttl
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, _Call] = {}
+        self._memo: Dict[str, Tuple[float, object]] = {}
+        self.fetches = 0
+        self.coalesced = 0
+        self.memo_hits = 0
+
+    def configure(self, options: Dict):
+        """Apply the single_flight section of scraper_config.json"""
+        if "memo_ttl" in options:
+            self.memo_ttl = float(options["memo_ttl"])
+
+    def do(self, key: str, fn: Callable, is_success: Callable = bool):
+        """
+        Run fn() once per key among concurrent callers
+
+        Args:
+            key: Normalized request key
+            fn: The actual fetch
+            is_success: Decides whether a result may be memoized
+        """
+        now = time.monotonic()
+        with self._lock:
+            memo = self._memo.get(key)
+            if memo and memo[0] > now:
+                self.memo_hits += 1
+                return memo[1]
+
+            call = self._in_flight.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._in_flight[key] = call
+                self.fetches += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except Exception as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+                if call.error is None and self.memo_ttl > 0 and is_success(call.result):
+                    self._memo[key] = (time.monotonic() + self.memo_ttl, call.result)
+                    self._prune(time.monotonic())
+            call.done.set()
+        return call.result
+
+    def _prune(self, now: float):
+        """Drop expired memo entries (caller holds the lock)"""
+        if len(self._memo) > 256:
+            for key in [k for k, (expires, _) in self._memo.items() if expires <= now]:
+                del self._memo[key]
+
+    def get_stats(self) -> Dict:
+        with self._lock:
+            return {
+                "fetches": self.fetches,
+                "coalesced": self.coalesced,
+                "memo_hits": self.memo_hits,
+                "requests_saved": self.coalesced + self.memo_hits,
+            }
@@ -168,8 +168,6 @@ class VcCircle:
                     upsert=True
                 )
                 logger.info(f"Inserted new article: {merged['url']}")
-
-                time.sleep(1) 
             except Exception as e:
                 logger.error(f"Error in check_db_grid for {grid['url']}: {e}")
     
@@ -185,7 +183,5 @@ class VcCircle:
             if self.grid_details:
                 self.check_db_grid()
 
-            time.sleep(random.randint(5,7))
-
 if __name__ == "__main__":
     VcCircle().run()